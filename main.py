@@ -21,13 +21,14 @@ from __future__ import annotations
 import sys
 import os
 import json
+import math
 import subprocess
 import tempfile
 import traceback
 import shutil
 from typing import Any
 
-import openpyxl
+import numpy as np
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QPushButton, QWidget,
@@ -35,23 +36,20 @@ from PySide6.QtWidgets import (
     QLineEdit, QGroupBox, QMessageBox, QFrame, QTabWidget, QScrollArea,
     QTreeWidget, QTreeWidgetItem, QSplitter, QMenu, QFileDialog,
     QGridLayout, QToolButton, QSizePolicy, QInputDialog, QProgressBar,
-    QDialog, QDialogButtonBox,
+    QDialog, QDialogButtonBox, QGraphicsItem,
 )
 from PySide6.QtGui import (
-    QColor, QFont, QIcon, QAction, QPixmap, QPainter, QPen,
+    QColor, QFont, QIcon, QAction, QPixmap, QPainter, QPen, QPageLayout, QPicture,
 )
 from PySide6.QtCore import (
     Qt, QParallelAnimationGroup, QPropertyAnimation, QAbstractAnimation,
-    QTimer, QPointF, QThread, Signal, QRect,
+    QTimer, QPointF, QThread, Signal, QRect, QRectF,
 )
-from PySide6.QtPrintSupport import QPrinter
 
 # ---------------------------------------------------------------------------
 # Internal module imports  (your project structure)
 # ---------------------------------------------------------------------------
-from ui.canvas import DesignCanvas
-from ui.sld_viewer import SLDViewer
-from ui.view_3d import View3D
+from ui.canvas import DesignCanvas, ELEC_COMP_TYPE
 from ui.settings_dialog import ProjectSettingsDialog
 from modules.logic import PECCalculator
 
@@ -76,6 +74,9 @@ _PDF_FILTER      = "PDF Files (*.pdf)"
 _SVG_FILTER      = "SVG Files (*.svg)"
 _SYMBOL_FILTER   = "Symbol Files (*.svg *.png *.jpg *.jpeg *.bmp)"
 
+# Load schedules longer than this are split across numbered .xlsx files
+_EXCEL_CHUNK_ROWS = 250_000
+
 # Colour tokens
 CLR_ACCENT        = "#00e5ff"
 CLR_ACCENT_GREEN  = "#00ff88"
@@ -88,6 +89,167 @@ CLR_TEXT_DIM      = "#505f73"
 CLR_TEXT_BODY     = "#a0a0a0"
 CLR_TEXT_BRIGHT   = "#e0e0e0"
 
+# Shared Qt value objects – built once instead of re-parsed on every call
+_ACCENT           = QColor(CLR_ACCENT)
+_TITLE_BLOCK_BG   = QColor("#f5f5f0")
+_TITLE_FONT       = QFont("Arial", 11, QFont.Bold)
+_TB_KEY_FONT      = QFont("Arial", 8, QFont.Bold)
+_TB_VALUE_FONT    = QFont("Arial", 9)
+
+# Main window stylesheet – formatted once at import time
+_MAIN_STYLESHEET = f"""
+    QMainWindow, QWidget {{
+        background-color: {CLR_BG_MAIN};
+        color: {CLR_TEXT_BODY};
+        font-family: 'Segoe UI', 'Helvetica Neue', sans-serif;
+    }}
+    #sidePanel {{
+        background-color: {CLR_BG_PANEL};
+        border-right: 1px solid {CLR_BORDER_LIGHT};
+    }}
+    #tablePanel {{
+        background-color: #111418;
+        border-top: 2px solid {CLR_ACCENT};
+    }}
+    QLabel {{ font-size:10px; color:{CLR_TEXT_DIM}; padding:1px; }}
+
+    #componentTile {{
+        background-color: rgba(28,34,45,200);
+        border: 1px solid #34445c;
+        border-radius: 5px;
+    }}
+    #componentTile:hover  {{ background-color:#252e3e; border-color:{CLR_ACCENT}; }}
+    #componentTile:pressed {{ background-color:#1a2030; }}
+
+    QLineEdit {{
+        background-color: #090b0f;
+        border: 1px solid {CLR_BORDER};
+        color: #fff;
+        padding: 7px 10px;
+        border-radius: 3px;
+        font-size: 11px;
+    }}
+    QLineEdit:focus {{ border-color:{CLR_ACCENT}; }}
+
+    QTreeWidget, QTableWidget {{
+        background-color: {CLR_BG_MAIN};
+        border: none;
+        color: {CLR_TEXT_BRIGHT};
+        font-size: 11px;
+    }}
+    QTreeWidget::item:selected,
+    QTableWidget::item:selected {{
+        background-color: rgba(0,229,255,0.12);
+        color: #fff;
+    }}
+    QHeaderView::section {{
+        background-color: {CLR_BG_CARD};
+        color: {CLR_ACCENT};
+        border: 1px solid {CLR_BG_MAIN};
+        padding: 6px;
+        font-weight: bold;
+        font-size: 10px;
+    }}
+
+    #exportButton {{
+        background-color: {CLR_BG_CARD};
+        color: #fff;
+        font-weight: bold;
+        font-size: 10px;
+        padding: 6px 14px;
+        border-radius: 4px;
+        border: 1px solid {CLR_BORDER};
+    }}
+    #exportButton:hover {{ border-color:{CLR_ACCENT}; background-color:#252e3e; }}
+
+    #toolButton {{
+        background-color: {CLR_BG_CARD};
+        color: {CLR_ACCENT};
+        font-weight: bold;
+        font-size: 10px;
+        border: 1px solid {CLR_BORDER};
+        padding: 7px;
+        border-radius: 4px;
+        margin-top: 4px;
+    }}
+    #toolButton:hover {{ background-color:#252e3e; border-color:{CLR_ACCENT}; }}
+
+    QTabBar::tab {{
+        background: {CLR_BG_PANEL};
+        padding: 10px 22px;
+        border: 1px solid {CLR_BORDER_LIGHT};
+        margin-right: 2px;
+        border-radius: 4px 4px 0 0;
+        color: {CLR_TEXT_DIM};
+        font-size: 11px;
+    }}
+    QTabBar::tab:selected {{ background:{CLR_BG_CARD}; color:{CLR_ACCENT}; border-bottom:2px solid {CLR_ACCENT}; }}
+    QTabBar::tab:hover   {{ background:#1e2530; }}
+
+    QGroupBox {{
+        border: 1px solid {CLR_BORDER};
+        margin-top: 12px;
+        padding-top: 8px;
+        color: {CLR_ACCENT};
+        font-size: 11px;
+        border-radius: 4px;
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 6px;
+    }}
+
+    #summaryBox {{
+        background-color: #0a0c10;
+        color: {CLR_ACCENT};
+        padding: 12px 14px;
+        border-radius: 4px;
+        border: 1px solid {CLR_BORDER};
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 11px;
+    }}
+
+    QMenuBar {{
+        background-color: #1a1f26;
+        color: {CLR_ACCENT};
+        font-size: 12px;
+        padding: 2px 6px;
+    }}
+    QMenuBar::item:selected {{ background-color:#252e3e; border-radius:3px; }}
+    QMenu {{
+        background-color: {CLR_BG_PANEL};
+        border: 1px solid {CLR_BORDER};
+        border-radius: 4px;
+        color: {CLR_TEXT_BRIGHT};
+    }}
+    QMenu::item:selected {{ background-color:rgba(0,229,255,0.10); }}
+
+    QSplitter::handle       {{ background:{CLR_BG_MAIN}; }}
+    QSplitter::handle:hover {{ background:{CLR_BORDER}; }}
+
+    QScrollBar:vertical {{
+        background: {CLR_BG_MAIN};
+        width: 8px;
+        border-radius: 4px;
+    }}
+    QScrollBar::handle:vertical {{
+        background: {CLR_BORDER};
+        border-radius: 4px;
+        min-height: 28px;
+    }}
+    QScrollBar::handle:vertical:hover {{ background:{CLR_ACCENT}; }}
+    QScrollBar::add-line, QScrollBar::sub-line {{ height:0; }}
+
+    QStatusBar {{
+        background: #12151b;
+        border-top: 1px solid {CLR_BORDER_LIGHT};
+        color: {CLR_TEXT_BODY};
+        font-size: 10px;
+        padding: 3px 8px;
+    }}
+"""
+
 
 # ==========================================================================
 # FLOORPLAN IMPORT  –  unified DXF / DWG / PNG pipeline
@@ -400,6 +562,191 @@ class FloorplanImporter:
         return False
 
 
+# ==========================================================================
+# PDF PLOT  –  spool the plotted sheet to disk off the GUI thread
+# ==========================================================================
+class _PdfPlotWorker(QThread):
+    """Writes a recorded floor plan plus the title block to a PDF.
+
+    The scene itself may only be painted on the GUI thread, so it arrives
+    as a QPicture (vector paint commands) that the worker replays into the
+    printer; everything the worker paints with is created here.
+
+    Signals
+    -------
+    finished_ok(str)    – output path on success
+    finished_err(str)   – human-readable error message on failure
+    """
+
+    finished_ok  = Signal(str)
+    finished_err = Signal(str)
+
+    def __init__(self, path: str, picture: QPicture, size: QRectF, rows: list) -> None:
+        super().__init__()
+        self.path    = path
+        self.picture = picture
+        self.size    = size      # recorded area, (0, 0) to the scene rect's size
+        self.rows    = rows
+
+    def run(self) -> None:
+        try:
+            self._plot()
+        except Exception:
+            self.finished_err.emit(f"Unexpected error:\n{traceback.format_exc()}")
+            return
+        self.finished_ok.emit(self.path)
+
+    def _plot(self) -> None:
+        from PySide6.QtPrintSupport import QPrinter
+
+        printer = QPrinter(QPrinter.HighResolution)
+        printer.setOutputFormat(QPrinter.PdfFormat)
+        printer.setOutputFileName(self.path)
+        printer.setPageOrientation(QPageLayout.Landscape)
+        printer.setFullPage(True)
+
+        p = QPainter(printer)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setRenderHint(QPainter.SmoothPixmapTransform)
+
+        # Fit the sheet into the page, centred and keeping aspect (as
+        # QGraphicsScene.render does); replaying keeps it vector
+        page = printer.pageRect(QPrinter.DevicePixel).toRect()
+        scale = min(page.width() / max(self.size.width(), 1.0),
+                    page.height() / max(self.size.height(), 1.0))
+        p.save()
+        p.translate(page.center().x() - self.size.width() * scale / 2,
+                    page.center().y() - self.size.height() * scale / 2)
+        # Replay scales the recording by the printer/picture DPI ratio; undo it
+        dpi = self.picture.logicalDpiX() / printer.logicalDpiX()
+        p.scale(scale * dpi, scale * dpi)
+        p.drawPicture(0, 0, self.picture)
+        p.restore()
+
+        # ── title block ───────────────────────────────────────────────
+        TW, TH = 520, 160
+        tx = page.width()  - TW - 30
+        ty = page.height() - TH - 30
+
+        p.setBrush(_TITLE_BLOCK_BG)
+        p.setPen(QPen(Qt.black, 3))
+        p.drawRect(QRect(tx, ty, TW, TH))
+
+        p.setPen(QPen(Qt.black, 2))
+        p.drawLine(tx, ty + 30, tx + TW, ty + 30)
+
+        p.setFont(_TITLE_FONT)
+        p.setPen(Qt.black)
+        p.drawText(tx + 12, ty + 22, "TITLE BLOCK")
+
+        for i, (k, v) in enumerate(self.rows):
+            y = ty + 52 + i * 24
+            p.setFont(_TB_KEY_FONT);  p.drawText(tx+12,  y, k+":")
+            p.setFont(_TB_VALUE_FONT); p.drawText(tx+100, y, v)
+
+        p.setPen(QPen(Qt.black, 8))
+        p.setBrush(Qt.NoBrush)
+        p.drawRect(page)
+        p.end()
+
+
+# ==========================================================================
+# EXCEL EXPORT  –  build and save the load-schedule workbook off the GUI thread
+# ==========================================================================
+class _ExcelExportWorker(QThread):
+    """Writes the cached load-schedule rows to an .xlsx workbook.
+
+    Schedules longer than ``chunk_size`` rows are split into
+    ``<stem>_part1.xlsx``, ``<stem>_part2.xlsx`` … so each file stays
+    openable and peak memory is bounded per file.
+
+    Signals
+    -------
+    finished_ok(str)    – output path (or part range) on success
+    finished_err(str)   – error message on failure
+    """
+
+    finished_ok  = Signal(str)
+    finished_err = Signal(str)
+
+    def __init__(self, path: str, rows: list, footer: tuple,
+                 chunk_size: int = _EXCEL_CHUNK_ROWS) -> None:
+        super().__init__()
+        self.path       = path
+        self.rows       = rows
+        self.footer     = footer
+        self.chunk_size = chunk_size
+
+    def run(self) -> None:
+        try:
+            if len(self.rows) <= self.chunk_size:
+                self._write(self.path, self.rows)
+                saved = self.path
+            else:
+                stem, ext = os.path.splitext(self.path)
+                n_parts = math.ceil(len(self.rows) / self.chunk_size)
+                for i in range(n_parts):
+                    part = self.rows[i * self.chunk_size:(i + 1) * self.chunk_size]
+                    self._write(f"{stem}_part{i + 1}{ext}", part)
+                saved = f"{stem}_part1…{n_parts}{ext}"
+        except Exception as e:
+            self.finished_err.emit(str(e))
+            return
+        self.finished_ok.emit(saved)
+
+    def _write(self, path: str, rows: list) -> None:
+        import openpyxl
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+
+        # Write-only mode streams rows straight to disk instead of
+        # keeping a styled Cell object per value in memory.
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Load Schedule")
+
+        hf   = Font(name="Calibri", size=10, bold=True, color="FFFFFF")
+        hfil = PatternFill("solid", fgColor="1C222D")
+        ha   = Alignment(horizontal="center", vertical="center")
+        bdr  = Border(
+            left=Side(style="thin", color="2D3646"),
+            right=Side(style="thin", color="2D3646"),
+            top=Side(style="thin", color="2D3646"),
+            bottom=Side(style="thin", color="2D3646"),
+        )
+
+        def styled(value, font, fill=None, alignment=None):
+            c = WriteOnlyCell(ws, value=value)
+            c.font = font; c.border = bdr
+            if fill:      c.fill = fill
+            if alignment: c.alignment = alignment
+            return c
+
+        # column widths must be set before the first row is written
+        widths = [5, 28, 10, 12, 12, 10, 14]
+        for i, w in enumerate(widths, 1):
+            ws.column_dimensions[openpyxl.utils.get_column_letter(i)].width = w
+
+        headers = ["#", "DESCRIPTION", "PANEL", "VOLTAGE", "LOAD (VA)", "AMPS", "WIRE SIZE"]
+        ws.append([styled(h, hf, hfil, ha) for h in headers])
+
+        df   = Font(name="Calibri", size=9)
+        altf = PatternFill("solid", fgColor="F2F4F7")
+
+        for ri, texts in enumerate(rows):
+            fill = altf if ri % 2 == 1 else None
+            ws.append([styled(t, df, fill) for t in texts])
+
+        # footer (one blank row below the schedule)
+        ws.append([])
+        kf = Font(bold=True, size=9)
+        for key, value in self.footer:
+            kc = WriteOnlyCell(ws, value=key)
+            kc.font = kf
+            ws.append([kc, value])
+
+        wb.save(path)
+
+
 # ==========================================================================
 # COLLAPSIBLE BOX  –  animated sidebar section
 # ==========================================================================
@@ -480,6 +827,11 @@ class ElecDraftApp(QMainWindow):
         self._is_modified = False          # track unsaved changes
         self._current_selected_item = None
         self._homerun_folders = {}         # Map homerun name to tree item
+        self._row_cache = []               # schedule rows as strings, rebuilt by _sync_data
+        self._cached_isc = None            # fault current (kA); depends on project_data only
+        self._sync_pending = False         # a coalesced _sync_data is queued
+        self._pdf_worker = None            # running "Plot to PDF" thread, if any
+        self._xlsx_worker = None           # running Excel export thread, if any
 
         self.setWindowOpacity(0.0)
         self.setWindowIcon(QIcon(LOGO_PATH))
@@ -499,6 +851,11 @@ class ElecDraftApp(QMainWindow):
         self._splash_step(10, "Initializing PEC Logic Engine…")
         self._load_component_configs()
 
+        # Theme goes on before any child exists so each widget is polished
+        # once, instead of the whole tree being re-styled after the build.
+        self._splash_step(25, "Applying Theme…")
+        self._apply_stylesheet()
+
         self._splash_step(40, "Building CAD Workspace…")
         self._setup_ui()
 
@@ -506,9 +863,6 @@ class ElecDraftApp(QMainWindow):
         self._create_main_menu()
         self._wire_signals()
 
-        self._splash_step(90, "Applying Theme…")
-        self._apply_stylesheet()
-
         self._splash_step(100, "Ready.")
 
     # ==================================================================
@@ -558,18 +912,16 @@ class ElecDraftApp(QMainWindow):
 
     def _save_to_file(self, filepath):
         """Internal method to save project data to file"""
-        from ui.canvas import ElectricalComponent
         data = {"meta": self.project_data, "items": []}
-        for it in self.canvas.scene.items():
-            if isinstance(it, ElectricalComponent):
-                data["items"].append({
-                    "name": it.name,
-                    "va": it.va,
-                    "x": it.pos().x(),
-                    "y": it.pos().y(),
-                    "type": it.comp_type,
-                    "symbol": it.elementId() # Using elementId to store symbol path if needed, or we can add a property
-                })
+        for it in self.canvas.components:
+            data["items"].append({
+                "name": it.name,
+                "va": it.va,
+                "x": it.pos().x(),
+                "y": it.pos().y(),
+                "type": it.comp_type,
+                "symbol": it.elementId() # Using elementId to store symbol path if needed, or we can add a property
+            })
 
         try:
             with open(filepath, "w", encoding="utf-8") as fh:
@@ -587,13 +939,12 @@ class ElecDraftApp(QMainWindow):
             self.statusBar().showMessage("Nothing to redo.")
             return
 
-        from ui.canvas import ElectricalComponent
         current = [{"name": i.name, "va": i.va, "x": i.pos().x(), "y": i.pos().y(), "type": i.comp_type}
-                   for i in self.canvas.scene.items() if isinstance(i, ElectricalComponent)]
+                   for i in self.canvas.components]
         self._undo_stack.append(current)
 
         snap = self._redo_stack.pop()
-        self.canvas.scene.clear()
+        self.canvas.clear_scene()
         for d in snap:
             c = self.canvas.add_component(d["name"], {"va": d["va"], "type": d.get("type", "General")})
             c.setPos(d["x"], d["y"])
@@ -608,7 +959,6 @@ class ElecDraftApp(QMainWindow):
 
     def copy_selected(self):
         """Copy selected items to clipboard"""
-        from ui.canvas import ElectricalComponent
         items = self.canvas.scene.selectedItems()
         if not items:
             self.statusBar().showMessage("No items selected to copy.")
@@ -616,7 +966,7 @@ class ElecDraftApp(QMainWindow):
 
         self._clipboard_data = []
         for item in items:
-            if isinstance(item, ElectricalComponent):
+            if item.type() == ELEC_COMP_TYPE:
                 self._clipboard_data.append({
                     "name": item.name,
                     "va": item.va,
@@ -644,7 +994,6 @@ class ElecDraftApp(QMainWindow):
 
     def duplicate_selected(self):
         """Duplicate selected items"""
-        from ui.canvas import ElectricalComponent
         items = self.canvas.scene.selectedItems()
         if not items:
             self.statusBar().showMessage("No items selected.")
@@ -652,7 +1001,7 @@ class ElecDraftApp(QMainWindow):
 
         self._push_undo()
         for item in items:
-            if isinstance(item, ElectricalComponent):
+            if item.type() == ELEC_COMP_TYPE:
                 c = self.canvas.add_component(item.name, {"va": item.va, "type": item.comp_type})
                 c.setPos(item.pos().x() + 20, item.pos().y() + 20)
 
@@ -662,12 +1011,10 @@ class ElecDraftApp(QMainWindow):
 
     def select_all(self):
         """Select all items on canvas"""
-        from ui.canvas import ElectricalComponent
         count = 0
-        for item in self.canvas.scene.items():
-            if isinstance(item, ElectricalComponent):
-                item.setSelected(True)
-                count += 1
+        for item in self.canvas.components:
+            item.setSelected(True)
+            count += 1
         self.statusBar().showMessage(f"Selected {count} item(s).")
 
     def deselect_all(self):
@@ -677,8 +1024,7 @@ class ElecDraftApp(QMainWindow):
 
     def calculate_total_load(self):
         """Calculate and display total connected load"""
-        from ui.canvas import ElectricalComponent
-        items = [i for i in self.canvas.scene.items() if isinstance(i, ElectricalComponent)]
+        items = self.canvas.components
         total_va = sum(item.va for item in items)
         total_amps = total_va / self.project_data["system_voltage"]
 
@@ -761,7 +1107,7 @@ class ElecDraftApp(QMainWindow):
     def _splash_step(self, pct, msg):
         if self._splash:
             self._splash.set_progress(pct)
-            self._splash.showMessage(msg, Qt.AlignBottom | Qt.AlignLeft, QColor(CLR_ACCENT))
+            self._splash.showMessage(msg, Qt.AlignBottom | Qt.AlignLeft, _ACCENT)
 
     # ==================================================================
     # MENU BAR - FIXED VERSION (from Claude's guide)
@@ -910,7 +1256,7 @@ class ElecDraftApp(QMainWindow):
     # SIGNAL WIRING - UPDATED
     # ==================================================================
     def _wire_signals(self) -> None:
-        self.canvas.signals.circuit_updated.connect(self._sync_data)
+        self.canvas.signals.circuit_updated.connect(self._schedule_sync)
         self.canvas.signals.circuit_updated.connect(self._mark_modified)
         self.canvas.scene.selectionChanged.connect(self._on_selection_changed)
         self.canvas.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -950,6 +1296,15 @@ class ElecDraftApp(QMainWindow):
                 "🛡️ 1-Pole":      {"va": 0,    "is_continuous": False, "type": "Breaker",    "symbol": SYMBOL_BASE+"breaker.svg"},
             }
 
+        # Split "<emoji> <label>" keys once here rather than on every toolbox build
+        self._tile_labels = {key: self._split_tile_label(key) for key in self.comp_library}
+
+    @staticmethod
+    def _split_tile_label(key):
+        """Return (icon, text) for a library key such as "💡 Light"."""
+        ico, sep, txt = key.partition(" ")
+        return (ico, txt) if sep else ("⚙", key)
+
     # ==================================================================
     # UI LAYOUT
     # ==================================================================
@@ -1064,10 +1419,10 @@ class ElecDraftApp(QMainWindow):
 
         self.tabs = QTabWidget()
         self.canvas  = DesignCanvas()
-        self.view_3d = View3D()
+        self.view_3d = None   # built on first visit to the 3D tab
         self.tabs.addTab(self.canvas,  "📐 Floor Plan View")
         self.tabs.addTab(QWidget(),    "📉 Load Schedule")
-        self.tabs.addTab(self.view_3d, "📦 3D View")
+        self.tabs.addTab(QWidget(),    "📦 3D View")
         self.tabs.currentChanged.connect(self._on_tab)
         vs.addWidget(self.tabs)
 
@@ -1245,6 +1600,7 @@ class ElecDraftApp(QMainWindow):
                 "type": "Custom", 
                 "symbol": dest_path
             }
+            self._tile_labels[key] = self._split_tile_label(key)
             
             # Save to disk
             with open(DEFAULT_COMPONENTS_PATH, "w", encoding="utf-8") as fh:
@@ -1274,7 +1630,7 @@ class ElecDraftApp(QMainWindow):
         if not self._check_unsaved_changes():
             return
         self._push_undo()
-        self.canvas.scene.clear()
+        self.canvas.clear_scene()
         self._current_file = None
         self._is_modified = False
         self._update_window_title()
@@ -1293,8 +1649,9 @@ class ElecDraftApp(QMainWindow):
             with open(p, "r", encoding="utf-8") as fh:
                 data = json.load(fh)
             self._push_undo()
-            self.canvas.scene.clear()
+            self.canvas.clear_scene()
             self.project_data.update(data.get("meta", {}))
+            self._cached_isc = None
             for d in data.get("items", []):
                 c = self.canvas.add_component(d["name"], {"va": d["va"], "type": d.get("type", "General"), "symbol": d.get("symbol")})
                 c.setPos(d["x"], d["y"])
@@ -1310,9 +1667,8 @@ class ElecDraftApp(QMainWindow):
     # UNDO/REDO - UPDATED METHODS
     # ==================================================================
     def _push_undo(self):
-        from ui.canvas import ElectricalComponent
         snap = [{"name": i.name, "va": i.va, "x": i.pos().x(), "y": i.pos().y(), "type": i.comp_type}
-                for i in self.canvas.scene.items() if isinstance(i, ElectricalComponent)]
+                for i in self.canvas.components]
         self._undo_stack.append(snap)
         self._redo_stack.clear()  # Clear redo stack on new action
         if len(self._undo_stack) > 30:
@@ -1324,13 +1680,12 @@ class ElecDraftApp(QMainWindow):
             return
 
         # Save current state to redo stack
-        from ui.canvas import ElectricalComponent
         current = [{"name": i.name, "va": i.va, "x": i.pos().x(), "y": i.pos().y(), "type": i.comp_type}
-                   for i in self.canvas.scene.items() if isinstance(i, ElectricalComponent)]
+                   for i in self.canvas.components]
         self._redo_stack.append(current)
 
         snap = self._undo_stack.pop()
-        self.canvas.scene.clear()
+        self.canvas.clear_scene()
         for d in snap:
             c = self.canvas.add_component(d["name"], {"va": d["va"], "type": d.get("type", "General")})
             c.setPos(d["x"], d["y"])
@@ -1347,18 +1702,18 @@ class ElecDraftApp(QMainWindow):
             self.canvas.add_room(name.strip())
 
     def run_room_analysis(self) -> None:
-        from ui.canvas import ElectricalComponent
-        rooms = [i for i in self.canvas.scene.items() if getattr(i, "is_room_rect", False)]
-        comps = [i for i in self.canvas.scene.items() if isinstance(i, ElectricalComponent)]
+        rooms = list(reversed(self.canvas.rooms))  # newest first, as the scene listed them
+        comps = self.canvas.components
 
         lines = ["ROOM LOAD SUMMARY (PEC COMPLIANCE)", "=" * 44]
         total = 0
         seen  = set()
         for room in rooms:
-            va = 0
-            for c in comps:
-                if room.contains(room.mapFromScene(c.scenePos() + QPointF(20, 20))):
-                    va += c.va; seen.add(id(c))
+            # Rooms are unrotated rectangles: the canvas' anchor index
+            # answers "which components sit in this room" directly
+            inside = self.canvas.components_in_rect(room.sceneBoundingRect())
+            va = sum(c.va for c in inside)
+            seen.update(id(c) for c in inside)
             lines.append(f"  📍 {room.name:<28s}  {va:>6} VA")
             total += va
 
@@ -1375,37 +1730,32 @@ class ElecDraftApp(QMainWindow):
     # PDF EXPORT
     # ==================================================================
     def export_to_pdf(self) -> None:
+        # One plot at a time: replacing the reference would destroy the
+        # running thread
+        if self._pdf_worker is not None and self._pdf_worker.isRunning():
+            self.statusBar().showMessage("🖨️  A PDF is still plotting …")
+            return
         path, _ = QFileDialog.getSaveFileName(self, "Plot to PDF", "", _PDF_FILTER)
         if not path:
             return
 
-        printer = QPrinter(QPrinter.HighResolution)
-        printer.setOutputFormat(QPrinter.PdfFormat)
-        printer.setOutputFileName(path)
-        printer.setPageOrientation(QPrinter.Landscape)
-        printer.setFullPage(True)
-
-        p = QPainter(printer)
-        p.setRenderHint(QPainter.Antialiasing)
-
-        page = printer.pageRect(QPrinter.DevicePixel)
-        self.canvas.scene.render(p, page, self.canvas.scene.sceneRect())
-
-        # ── title block ───────────────────────────────────────────────
-        TW, TH = 520, 160
-        tx = page.width()  - TW - 30
-        ty = page.height() - TH - 30
-
-        p.setBrush(QColor("#f5f5f0"))
-        p.setPen(QPen(Qt.black, 3))
-        p.drawRect(QRect(tx, ty, TW, TH))
-
-        p.setPen(QPen(Qt.black, 2))
-        p.drawLine(tx, ty + 30, tx + TW, ty + 30)
-
-        p.setFont(QFont("Arial", 11, QFont.Bold))
-        p.setPen(Qt.black)
-        p.drawText(tx + 12, ty + 22, "TITLE BLOCK")
+        # Record the scene here – QGraphicsScene may only be painted from
+        # the GUI thread – as vector commands the worker replays while spooling.
+        # Pixmap-cached items would be recorded as their screen rasters, so
+        # caching is off while recording (a printer target skips it anyway).
+        src = self.canvas.scene.sceneRect()
+        size = QRectF(0, 0, src.width(), src.height())
+        cached = [(it, it.cacheMode()) for it in self.canvas.scene.items()
+                  if it.cacheMode() != QGraphicsItem.NoCache]
+        for it, _mode in cached:
+            it.setCacheMode(QGraphicsItem.NoCache)
+        picture = QPicture()
+        pp = QPainter(picture)
+        pp.setRenderHint(QPainter.Antialiasing)
+        self.canvas.scene.render(pp, size, src)
+        pp.end()
+        for it, mode in cached:
+            it.setCacheMode(mode)
 
         rows = [
             ("PROJECT",  self.project_data["name"].upper()),
@@ -1413,15 +1763,14 @@ class ElecDraftApp(QMainWindow):
             ("STANDARD", self.project_data["standard"]),
             ("VOLTAGE",  f"{self.project_data['system_voltage']} V / 1 PH"),
         ]
-        for i, (k, v) in enumerate(rows):
-            y = ty + 52 + i * 24
-            p.setFont(QFont("Arial", 8, QFont.Bold));  p.drawText(tx+12,  y, k+":")
-            p.setFont(QFont("Arial", 9));              p.drawText(tx+100, y, v)
 
-        p.setPen(QPen(Qt.black, 8))
-        p.drawRect(page)
-        p.end()
-        self.statusBar().showMessage(f"🖨️  PDF plotted → {path}")
+        self.statusBar().showMessage("🖨️  Plotting PDF …")
+        self._pdf_worker = _PdfPlotWorker(path, picture, size, rows)
+        self._pdf_worker.finished_ok.connect(
+            lambda out: self.statusBar().showMessage(f"🖨️  PDF plotted → {out}"))
+        self._pdf_worker.finished_err.connect(
+            lambda msg: QMessageBox.critical(self, "PDF Export Failed", msg))
+        self._pdf_worker.start()
 
     # ==================================================================
     # KEYBOARD & CONTEXT MENUS
@@ -1442,8 +1791,7 @@ class ElecDraftApp(QMainWindow):
         menu = QMenu()
 
         if item:
-            from ui.canvas import ElectricalComponent
-            if isinstance(item, ElectricalComponent):
+            if item.type() == ELEC_COMP_TYPE:
                 menu.addAction("📋  Copy",             lambda: self._copy(item))
                 menu.addAction("📄  Paste",            self._paste)
                 menu.addAction("⬡   Duplicate",       lambda: self._duplicate(item))
@@ -1476,8 +1824,7 @@ class ElecDraftApp(QMainWindow):
 
     # ── inline property editor ────────────────────────────────────────
     def _edit_props_dlg(self, item) -> None:
-        from ui.canvas import ElectricalComponent
-        if not isinstance(item, ElectricalComponent):
+        if item.type() != ELEC_COMP_TYPE:
             return
 
         dlg = QDialog(self)
@@ -1519,7 +1866,7 @@ class ElecDraftApp(QMainWindow):
                                 QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
             self._push_undo()
             for it in items:
-                self.canvas.scene.removeItem(it)
+                self.canvas.remove_item(it)
             self._sync_data()
             self._mark_modified()
 
@@ -1601,9 +1948,7 @@ class ElecDraftApp(QMainWindow):
             btn.setFixedSize(80, 86)
             btn.setObjectName("componentTile")
 
-            parts = name.split(" ", 1)
-            ico  = parts[0] if len(parts) > 1 else "⚙"
-            txt  = parts[1] if len(parts) > 1 else name
+            ico, txt = self._tile_labels[name]
 
             inner = QVBoxLayout(btn)
             inner.setContentsMargins(0, 4, 0, 2)
@@ -1668,54 +2013,96 @@ class ElecDraftApp(QMainWindow):
     # ==================================================================
     def _on_tab(self, idx):
         if idx == 2:
-            from ui.canvas import ElectricalComponent
-            self.view_3d.update_3d_scene(
-                [i for i in self.canvas.scene.items() if isinstance(i, ElectricalComponent)]
-            )
+            if self.view_3d is None:
+                self._create_view_3d()
+            self.view_3d.update_3d_scene(self.canvas.components)
+
+    def _create_view_3d(self) -> None:
+        """Swap the 3D tab placeholder for the real View3D on first use."""
+        from ui.view_3d import View3D
+
+        self.view_3d = View3D()
+        placeholder = self.tabs.widget(2)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(2)
+        self.tabs.insertTab(2, self.view_3d, "📦 3D View")
+        self.tabs.setCurrentIndex(2)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
 
     # ==================================================================
     # DATA SYNC
     # ==================================================================
     def _sync_data(self) -> None:
-        from ui.canvas import ElectricalComponent
-        items = [i for i in self.canvas.scene.items() if isinstance(i, ElectricalComponent)]
-        self.table.setRowCount(len(items))
+        items = list(reversed(self.canvas.components))  # newest first, as the scene listed them
+        table = self.table
 
         total = 0
-        
+        selected = None
+
         # Clear existing homerun folders in tree
         # We will rebuild them based on current items
         # Note: This is a simplified approach. For a robust system, we should manage tree items more carefully.
         # For now, let's just ensure we have the structure.
-        
-        for row, item in enumerate(items):
-            amps, breaker, wire, vd = PECCalculator.calculate_load(item.va)
-            total += item.va
-
-            self.table.setItem(row, 0, QTableWidgetItem(str(row + 1)))
-            self.table.setItem(row, 1, QTableWidgetItem(item.name))
-            self.table.setItem(row, 2, QTableWidgetItem("MAIN"))
-            self.table.setItem(row, 3, QTableWidgetItem("230 V"))
-            self.table.setItem(row, 4, QTableWidgetItem(f"{item.va} VA"))
-            self.table.setItem(row, 5, QTableWidgetItem(f"{amps} A"))
-            self.table.setItem(row, 6, QTableWidgetItem(wire))
-
-            if item is self._current_selected_item:
-                self._summary.setText(
-                    f"Required Breaker : {breaker} A\n"
-                    f"Required Wire    : {wire}\n"
-                    f"Voltage Drop     : {vd} %"
-                )
-                self._lbl_acc.setText(f"Load Accuracy  : {min(100,(item.va/180)*100):.1f} %")
-                self._lbl_isc.setText(f"Short Circuit  : {self._calc_isc(item.va)} kA")
-                self._lbl_vd.setText(f"V-Drop Sync    : {vd} %")
-            
-            # Check for Homerun/Feeder to update tree
-            if item.comp_type == "Feeder" or "Homerun" in item.name:
-                self._update_homerun_folder(item)
+
+        # One vectorised PEC pass for the whole schedule instead of per row
+        va = np.fromiter((item.va for item in items), dtype=np.float64, count=len(items))
+        amps_arr, breaker_arr, wires, vd_arr = PECCalculator.calculate_load_batch(va)
+        rows = zip(amps_arr.tolist(), breaker_arr.tolist(), wires, vd_arr.tolist())
+
+        # Fill the whole table with signals/repaints off, reusing cells in place
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        try:
+            if table.rowCount() != len(items):
+                table.setRowCount(len(items))
+
+            row_cache = []
+            for row, (item, calc) in enumerate(zip(items, rows)):
+                amps, breaker, wire, vd = calc
+                total += item.va
+
+                texts = (str(row + 1), item.name, "MAIN", "230 V",
+                         f"{item.va} VA", f"{amps} A", wire)
+                row_cache.append(texts)
+                for col, text in enumerate(texts):
+                    self._set_cell(row, col, text)
+
+                if item is self._current_selected_item:
+                    selected = (item, breaker, wire, vd)
+
+                # Check for Homerun/Feeder to update tree
+                if item.comp_type == "Feeder" or "Homerun" in item.name:
+                    self._update_homerun_folder(item)
+            self._row_cache = row_cache
+        finally:
+            table.setSortingEnabled(sorting)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+        if selected:
+            item, breaker, wire, vd = selected
+            self._summary.setText(
+                f"Required Breaker : {breaker} A\n"
+                f"Required Wire    : {wire}\n"
+                f"Voltage Drop     : {vd} %"
+            )
+            self._lbl_acc.setText(f"Load Accuracy  : {min(100,(item.va/180)*100):.1f} %")
+            self._lbl_isc.setText(f"Short Circuit  : {self._calc_isc(item.va)} kA")
+            self._lbl_vd.setText(f"V-Drop Sync    : {vd} %")
 
         self._lbl_total.setText(f"Total: {total} VA")
 
+    def _set_cell(self, row, col, text):
+        """Update a schedule cell in place, creating the item only once."""
+        cell = self.table.item(row, col)
+        if cell is None:
+            self.table.setItem(row, col, QTableWidgetItem(text))
+        elif cell.text() != text:
+            cell.setText(text)
+
     def _update_homerun_folder(self, item):
         """Updates or creates a folder in the sidebar tree for a homerun."""
         name = item.name
@@ -1777,8 +2164,7 @@ class ElecDraftApp(QMainWindow):
         except RuntimeError:
             return
 
-        from ui.canvas import ElectricalComponent
-        if items and isinstance(items[0], ElectricalComponent):
+        if items and items[0].type() == ELEC_COMP_TYPE:
             self._current_selected_item = items[0]
             self._name_edit.blockSignals(True)
             self._va_edit.blockSignals(True)
@@ -1786,11 +2172,25 @@ class ElecDraftApp(QMainWindow):
             self._va_edit.setText(str(items[0].va))
             self._name_edit.blockSignals(False)
             self._va_edit.blockSignals(False)
-            self._sync_data()
+            self._schedule_sync()
         else:
             self._current_selected_item = None
             self._reset_sidebar()
 
+    def _schedule_sync(self) -> None:
+        """Queue one _sync_data for when the event loop drains.
+
+        Rubber-band selections and bulk adds emit a signal per item; this
+        collapses the burst into a single table rebuild.
+        """
+        if not self._sync_pending:
+            self._sync_pending = True
+            QTimer.singleShot(0, self._flush_sync)
+
+    def _flush_sync(self) -> None:
+        self._sync_pending = False
+        self._sync_data()
+
     def _apply_props(self) -> None:
         if not self._current_selected_item:
             return
@@ -1820,15 +2220,17 @@ class ElecDraftApp(QMainWindow):
     # SLD
     # ==================================================================
     def _open_sld(self) -> None:
-        from ui.canvas import ElectricalComponent
-        items = [i for i in self.canvas.scene.items() if isinstance(i, ElectricalComponent)]
+        items = list(reversed(self.canvas.components))  # circuit numbers follow the schedule rows
         if not items:
             QMessageBox.warning(self, "SLD", "No components on the canvas.")
             return
-        sld = []
-        for i in items:
-            _, b, w, _ = PECCalculator.calculate_load(i.va)
-            sld.append({"name": i.name, "breaker": b, "wire": w})
+        va = np.fromiter((i.va for i in items), dtype=np.float64, count=len(items))
+        _, breakers, wires, _ = PECCalculator.calculate_load_batch(va)
+        sld = [{"name": i.name, "breaker": b, "wire": w, "kind": i.load_kind}
+               for i, b, w in zip(items, breakers.tolist(), wires)]
+
+        from ui.sld_viewer import SLDViewer
+
         self._sld_win = SLDViewer(sld)
         self._sld_win.show()
 
@@ -1836,8 +2238,7 @@ class ElecDraftApp(QMainWindow):
     # USABILITY
     # ==================================================================
     def run_usability_evaluation(self) -> None:
-        from ui.canvas import ElectricalComponent
-        comps = [i for i in self.canvas.scene.items() if isinstance(i, ElectricalComponent)]
+        comps = self.canvas.components
         if not comps:
             QMessageBox.warning(self, "Usability", "No components to evaluate.")
             return
@@ -1859,74 +2260,43 @@ class ElecDraftApp(QMainWindow):
     def _calc_isc(self, va) -> float:
         if va == 0:
             return 0.0
-        v   = self.project_data["system_voltage"]
-        kva = self.project_data["transformer_kva"]
-        z   = self.project_data["transformer_z"]
-        return round((kva * 1000) / (v * z) / 1000, 2)
+        if self._cached_isc is None:
+            v   = self.project_data["system_voltage"]
+            kva = self.project_data["transformer_kva"]
+            z   = self.project_data["transformer_z"]
+            self._cached_isc = round((kva * 1000) / (v * z) / 1000, 2)
+        return self._cached_isc
 
     # ==================================================================
     # EXCEL EXPORT
     # ==================================================================
     def export_to_excel(self) -> None:
+        # One export at a time: replacing the reference would destroy the
+        # running thread
+        if self._xlsx_worker is not None and self._xlsx_worker.isRunning():
+            self.statusBar().showMessage("📊  An Excel export is still running …")
+            return
         path, _ = QFileDialog.getSaveFileName(self, "Export Schedule", "", _EXCEL_FILTER)
         if not path:
             return
-        try:
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Load Schedule"
-
-            hf   = Font(name="Calibri", size=10, bold=True, color="FFFFFF")
-            hfil = PatternFill("solid", fgColor="1C222D")
-            ha   = Alignment(horizontal="center", vertical="center")
-            bdr  = Border(
-                left=Side(style="thin", color="2D3646"),
-                right=Side(style="thin", color="2D3646"),
-                top=Side(style="thin", color="2D3646"),
-                bottom=Side(style="thin", color="2D3646"),
-            )
+        footer = (("PROJECT:",  self.project_data["name"]),
+                  ("ENGINEER:", self.project_data["author"]),
+                  ("STANDARD:", self.project_data["standard"]))
 
-            headers = ["#", "DESCRIPTION", "PANEL", "VOLTAGE", "LOAD (VA)", "AMPS", "WIRE SIZE"]
-            ws.append(headers)
-            for cell in ws[1]:
-                cell.font = hf; cell.fill = hfil; cell.alignment = ha; cell.border = bdr
-
-            widths = [5, 28, 10, 12, 12, 10, 14]
-            for i, w in enumerate(widths, 1):
-                ws.column_dimensions[ws.cell(1, i).column_letter].width = w
-
-            df   = Font(name="Calibri", size=9)
-            altf = PatternFill("solid", fgColor="F2F4F7")
-
-            for ri in range(self.table.rowCount()):
-                row_data = []
-                for ci in range(self.table.columnCount()):
-                    cell = self.table.item(ri, ci)
-                    row_data.append(cell.text() if cell else "")
-                ws.append(row_data)
-
-                er = ri + 2
-                for ci in range(1, len(headers) + 1):
-                    c = ws.cell(er, ci)
-                    c.font = df; c.border = bdr
-                    if ri % 2 == 1:
-                        c.fill = altf
-
-            # footer
-            fr = self.table.rowCount() + 3
-            for offset, key in enumerate(["PROJECT:", "ENGINEER:", "STANDARD:"]):
-                ws.cell(fr + offset, 1, key).font = Font(bold=True, size=9)
-            ws.cell(fr,   2, self.project_data["name"])
-            ws.cell(fr+1, 2, self.project_data["author"])
-            ws.cell(fr+2, 2, self.project_data["standard"])
-
-            wb.save(path)
-            self.statusBar().showMessage(f"📊  Excel saved → {path}")
-            QMessageBox.information(self, "Export OK", "Load schedule exported successfully.")
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed:\n\n{e}")
+        # A queued rebuild means _row_cache is behind the canvas; run it now
+        if self._sync_pending:
+            self._flush_sync()
+
+        self.statusBar().showMessage("📊  Writing Excel schedule …")
+        self._xlsx_worker = _ExcelExportWorker(path, list(self._row_cache), footer)
+        self._xlsx_worker.finished_ok.connect(self._on_excel_saved)
+        self._xlsx_worker.finished_err.connect(
+            lambda msg: QMessageBox.critical(self, "Export Error", f"Failed:\n\n{msg}"))
+        self._xlsx_worker.start()
+
+    def _on_excel_saved(self, path: str) -> None:
+        self.statusBar().showMessage(f"📊  Excel saved → {path}")
+        QMessageBox.information(self, "Export OK", "Load schedule exported successfully.")
 
     # ==================================================================
     # SETTINGS / ABOUT
@@ -1935,6 +2305,7 @@ class ElecDraftApp(QMainWindow):
         dlg = ProjectSettingsDialog(self.project_data, self)
         if dlg.exec():
             self.project_data.update(dlg.get_settings())
+            self._cached_isc = None
             self._sync_data()
 
     @staticmethod
@@ -1952,158 +2323,7 @@ class ElecDraftApp(QMainWindow):
     # STYLESHEET
     # ==================================================================
     def _apply_stylesheet(self) -> None:
-        self.setStyleSheet(f"""
-            QMainWindow, QWidget {{
-                background-color: {CLR_BG_MAIN};
-                color: {CLR_TEXT_BODY};
-                font-family: 'Segoe UI', 'Helvetica Neue', sans-serif;
-            }}
-            #sidePanel {{
-                background-color: {CLR_BG_PANEL};
-                border-right: 1px solid {CLR_BORDER_LIGHT};
-            }}
-            #tablePanel {{
-                background-color: #111418;
-                border-top: 2px solid {CLR_ACCENT};
-            }}
-            QLabel {{ font-size:10px; color:{CLR_TEXT_DIM}; padding:1px; }}
-
-            #componentTile {{
-                background-color: rgba(28,34,45,200);
-                border: 1px solid #34445c;
-                border-radius: 5px;
-            }}
-            #componentTile:hover  {{ background-color:#252e3e; border-color:{CLR_ACCENT}; }}
-            #componentTile:pressed {{ background-color:#1a2030; }}
-
-            QLineEdit {{
-                background-color: #090b0f;
-                border: 1px solid {CLR_BORDER};
-                color: #fff;
-                padding: 7px 10px;
-                border-radius: 3px;
-                font-size: 11px;
-            }}
-            QLineEdit:focus {{ border-color:{CLR_ACCENT}; }}
-
-            QTreeWidget, QTableWidget {{
-                background-color: {CLR_BG_MAIN};
-                border: none;
-                color: {CLR_TEXT_BRIGHT};
-                font-size: 11px;
-            }}
-            QTreeWidget::item:selected,
-            QTableWidget::item:selected {{
-                background-color: rgba(0,229,255,0.12);
-                color: #fff;
-            }}
-            QHeaderView::section {{
-                background-color: {CLR_BG_CARD};
-                color: {CLR_ACCENT};
-                border: 1px solid {CLR_BG_MAIN};
-                padding: 6px;
-                font-weight: bold;
-                font-size: 10px;
-            }}
-
-            #exportButton {{
-                background-color: {CLR_BG_CARD};
-                color: #fff;
-                font-weight: bold;
-                font-size: 10px;
-                padding: 6px 14px;
-                border-radius: 4px;
-                border: 1px solid {CLR_BORDER};
-            }}
-            #exportButton:hover {{ border-color:{CLR_ACCENT}; background-color:#252e3e; }}
-
-            #toolButton {{
-                background-color: {CLR_BG_CARD};
-                color: {CLR_ACCENT};
-                font-weight: bold;
-                font-size: 10px;
-                border: 1px solid {CLR_BORDER};
-                padding: 7px;
-                border-radius: 4px;
-                margin-top: 4px;
-            }}
-            #toolButton:hover {{ background-color:#252e3e; border-color:{CLR_ACCENT}; }}
-
-            QTabBar::tab {{
-                background: {CLR_BG_PANEL};
-                padding: 10px 22px;
-                border: 1px solid {CLR_BORDER_LIGHT};
-                margin-right: 2px;
-                border-radius: 4px 4px 0 0;
-                color: {CLR_TEXT_DIM};
-                font-size: 11px;
-            }}
-            QTabBar::tab:selected {{ background:{CLR_BG_CARD}; color:{CLR_ACCENT}; border-bottom:2px solid {CLR_ACCENT}; }}
-            QTabBar::tab:hover   {{ background:#1e2530; }}
-
-            QGroupBox {{
-                border: 1px solid {CLR_BORDER};
-                margin-top: 12px;
-                padding-top: 8px;
-                color: {CLR_ACCENT};
-                font-size: 11px;
-                border-radius: 4px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 6px;
-            }}
-
-            #summaryBox {{
-                background-color: #0a0c10;
-                color: {CLR_ACCENT};
-                padding: 12px 14px;
-                border-radius: 4px;
-                border: 1px solid {CLR_BORDER};
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 11px;
-            }}
-
-            QMenuBar {{
-                background-color: #1a1f26;
-                color: {CLR_ACCENT};
-                font-size: 12px;
-                padding: 2px 6px;
-            }}
-            QMenuBar::item:selected {{ background-color:#252e3e; border-radius:3px; }}
-            QMenu {{
-                background-color: {CLR_BG_PANEL};
-                border: 1px solid {CLR_BORDER};
-                border-radius: 4px;
-                color: {CLR_TEXT_BRIGHT};
-            }}
-            QMenu::item:selected {{ background-color:rgba(0,229,255,0.10); }}
-
-            QSplitter::handle       {{ background:{CLR_BG_MAIN}; }}
-            QSplitter::handle:hover {{ background:{CLR_BORDER}; }}
-
-            QScrollBar:vertical {{
-                background: {CLR_BG_MAIN};
-                width: 8px;
-                border-radius: 4px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {CLR_BORDER};
-                border-radius: 4px;
-                min-height: 28px;
-            }}
-            QScrollBar::handle:vertical:hover {{ background:{CLR_ACCENT}; }}
-            QScrollBar::add-line, QScrollBar::sub-line {{ height:0; }}
-
-            QStatusBar {{
-                background: #12151b;
-                border-top: 1px solid {CLR_BORDER_LIGHT};
-                color: {CLR_TEXT_BODY};
-                font-size: 10px;
-                padding: 3px 8px;
-            }}
-        """)
+        self.setStyleSheet(_MAIN_STYLESHEET)
 
 
 # ==========================================================================
@@ -1,6 +1,8 @@
 # modules/analysis_engine.py
 import math
 
+import numpy as np
+
 class AnalysisEngine:
     @staticmethod
     def calculate_voltage_drop(current, length, resistance, voltage=230):
@@ -9,9 +11,18 @@ class AnalysisEngine:
         percent_drop = (v_drop / voltage) * 100
         return round(v_drop, 2), round(percent_drop, 2)
 
+    @staticmethod
+    def calculate_voltage_drop_batch(currents, lengths, resistances, voltage=230):
+        # Same formula as calculate_voltage_drop, evaluated over whole arrays
+        v_drop = (2 * np.asarray(lengths, dtype=np.float64)
+                  * np.asarray(currents, dtype=np.float64)
+                  * np.asarray(resistances, dtype=np.float64)) / 1000
+        percent_drop = (v_drop / voltage) * 100
+        return np.round(v_drop, 2), np.round(percent_drop, 2)
+
     @staticmethod
     def calculate_short_circuit(transformer_kva, impedance_z, voltage=230):
         # Simple Point-to-Point method logic
         full_load_amps = (transformer_kva * 1000) / (voltage * 1.732)
         short_circuit_current = full_load_amps / (impedance_z / 100)
-        return round(short_circuit_current, 2)
\ No newline at end of file
+        return round(short_circuit_current, 2)
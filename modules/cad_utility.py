@@ -1,11 +1,48 @@
+import hashlib
+import pathlib
+import shutil
+import threading
+
 import ezdxf
 from ezdxf.addons.drawing import RenderContext, Frontend
 from ezdxf.addons.drawing.matplotlib import MatplotlibBackend
 import matplotlib.pyplot as plt
 
+# Default rasterisation settings. 20x20 in at 100 dpi gives a 2000 px sheet,
+# plenty for the canvas; 300 dpi produced a 6000 px (~144 MB RGBA) buffer.
+_FIGSIZE = (20, 20)
+_DPI = 100
+
+_CACHE_DIR = pathlib.Path.home() / ".cache" / "elecdraft" / "dxf"
+
+# One long-lived figure, cleared between conversions; Agg is not reentrant
+_fig = None
+_fig_lock = threading.Lock()
+
 
-def convert_dxf_to_png(dxf_path, output_png_path):
+def _get_axes(figsize):
+    """Return the shared figure's axes, creating the figure on first use."""
+    global _fig
+    if _fig is None:
+        _fig = plt.figure(figsize=figsize)
+        return _fig.add_axes([0, 0, 1, 1])
+    _fig.set_size_inches(figsize)
+    ax = _fig.axes[0]
+    ax.cla()
+    return ax
+
+
+def convert_dxf_to_png(dxf_path, output_png_path, dpi=_DPI, figsize=_FIGSIZE):
     try:
+        # 0. Reuse a previous render of identical DXF content if we have one
+        with open(dxf_path, "rb") as fh:
+            digest = hashlib.blake2b(fh.read(), digest_size=16)
+        digest.update(f"{dpi}:{tuple(figsize)}".encode())
+        cached_png = _CACHE_DIR / f"{digest.hexdigest()}.png"
+        if cached_png.exists():
+            shutil.copyfile(cached_png, output_png_path)
+            return True
+
         # 1. Load the DXF document
         doc = ezdxf.readfile(dxf_path)
         msp = doc.modelspace()
@@ -13,18 +50,24 @@ def convert_dxf_to_png(dxf_path, output_png_path):
         # 2. Set up the rendering context (handles colors/layers)
         ctx = RenderContext(doc)
 
-        # 3. Create a Matplotlib figure
-        fig = plt.figure(figsize=(20, 20))
-        ax = fig.add_axes([0, 0, 1, 1])
+        with _fig_lock:
+            # 3. Reuse the Matplotlib figure
+            ax = _get_axes(figsize)
+
+            # 4. Use ezdxf's Frontend to draw onto Matplotlib
+            out = MatplotlibBackend(ax)
+            Frontend(ctx, out).draw_layout(msp, finalize=True)
 
-        # 4. Use ezdxf's Frontend to draw onto Matplotlib
-        out = MatplotlibBackend(ax)
-        Frontend(ctx, out).draw_layout(msp, finalize=True)
+            # 5. Save as PNG with high resolution for the canvas
+            _fig.savefig(output_png_path, dpi=dpi, bbox_inches='tight', pad_inches=0)
 
-        # 5. Save as PNG with high resolution for the canvas
-        fig.savefig(output_png_path, dpi=300, bbox_inches='tight', pad_inches=0)
-        plt.close(fig)
+        # 6. Keep a copy for next time; a cache write failure is not an error
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_png_path, cached_png)
+        except OSError:
+            pass
         return True
     except Exception as e:
         print(f"CAD Conversion Error: {e}")
-        return False
\ No newline at end of file
+        return False
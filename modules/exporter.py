@@ -2,7 +2,8 @@ from reportlab.lib.pagesizes import letter, landscape
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib import colors
-import os
+from io import BytesIO
+from PySide6.QtCore import QBuffer, QIODevice
 
 class PDFExporter:
     @staticmethod
@@ -33,14 +34,13 @@ class PDFExporter:
         elements.append(Spacer(1, 20))
 
         # 2. SLD Snapshot
-        # Note: You must save the SLD pixmap to a temporary file first
+        # Encoded to PNG in memory and handed to reportlab without a temp file
         elements.append(Paragraph("<b>II. Single-Line Diagram Schematic</b>", styles['Heading2']))
-        temp_img = "temp_sld.png"
-        sld_pixmap.save(temp_img)
-        img = Image(temp_img, width=400, height=300)
+        buf = QBuffer()
+        buf.open(QIODevice.WriteOnly)
+        sld_pixmap.save(buf, "PNG")
+        img = Image(BytesIO(bytes(buf.data())), width=400, height=300)
         elements.append(img)
 
         doc.build(elements)
-        if os.path.exists(temp_img):
-            os.remove(temp_img)
         return filename
\ No newline at end of file
@@ -1,8 +1,36 @@
 import math
+from bisect import bisect_left
+from functools import lru_cache
+
+import numpy as np
+
+from modules.analysis_engine import AnalysisEngine
+
+# Standard Philippine Breaker Ratings (Ampere Trip - AT)
+_STD_BREAKERS = (15, 20, 30, 40, 50, 60, 70, 80, 100, 125)
+
+# Wire Sizing & Resistance (Based on PEC Table 3.10.1.16)
+# Copper THHN/THWN-2 in Raceway (75°C insulation column). _WIRE_THRESHOLDS[i] is
+# the largest breaker _WIRES[i] may sit behind; anything above uses the last size.
+_WIRE_THRESHOLDS = (20, 30, 50, 60)
+_WIRES = (
+    ("3.5mm² THHN",  5.2),   # Ohms/km (approximate)
+    ("5.5mm² THHN",  3.3),
+    ("8.0mm² THHN",  2.1),
+    ("14.0mm² THHN", 1.3),
+    ("22.0mm² THHN", 0.85),
+)
+
+# Array views of the same tables for calculate_load_batch
+_STD_BREAKERS_ARR = np.array(_STD_BREAKERS, dtype=np.float64)
+_WIRE_THRESHOLDS_ARR = np.array(_WIRE_THRESHOLDS, dtype=np.float64)
+_WIRE_NAMES = tuple(w for w, _ in _WIRES)
+_WIRE_RESISTANCE = np.array([r for _, r in _WIRES])
 
 
 class PECCalculator:
     @staticmethod
+    @lru_cache(maxsize=512)   # pure function of its args; many loads share a rating
     def calculate_load(va, voltage=230, length=30, is_continuous=False):
         """
         Comprehensive PEC-compliant branch circuit calculation.
@@ -24,27 +52,12 @@ class PECCalculator:
         # PEC requires branch circuit protection to be at least 125% of continuous load
         req_ampacity = amps * 1.25 if not is_continuous else amps
 
-        # Standard Philippine Breaker Ratings (Ampere Trip - AT)
-        standard_breakers = [15, 20, 30, 40, 50, 60, 70, 80, 100, 125]
-        breaker = next((b for b in standard_breakers if b >= req_ampacity), 20)
-
-        # 4. Wire Sizing & Resistance (Based on PEC Table 3.10.1.16)
-        # Assuming Copper THHN/THWN-2 in Raceway (75°C insulation column)
-        if breaker <= 20:
-            wire = "3.5mm² THHN"
-            resistance = 5.2  # Ohms/km (Approximate for 3.5mm²)
-        elif breaker <= 30:
-            wire = "5.5mm² THHN"
-            resistance = 3.3  # Ohms/km (Approximate for 5.5mm²)
-        elif breaker <= 50:
-            wire = "8.0mm² THHN"
-            resistance = 2.1  # Ohms/km (Approximate for 8.0mm²)
-        elif breaker <= 60:
-            wire = "14.0mm² THHN"
-            resistance = 1.3  # Ohms/km (Approximate for 14.0mm²)
-        else:
-            wire = "22.0mm² THHN"
-            resistance = 0.85  # Ohms/km (Approximate for 22.0mm²)
+        # Smallest standard rating that covers it (oversize loads fall back to 20 AT)
+        idx = bisect_left(_STD_BREAKERS, req_ampacity)
+        breaker = _STD_BREAKERS[idx] if idx < len(_STD_BREAKERS) else 20
+
+        # 4. Wire Sizing & Resistance
+        wire, resistance = _WIRES[bisect_left(_WIRE_THRESHOLDS, breaker)]
 
         # 5. Voltage Drop Calculation (PEC Recommendation: Max 3% for branch circuits)
         # Formula: VD = (2 * L * I * R) / 1000 for single phase
@@ -53,6 +66,36 @@ class PECCalculator:
 
         return round(amps, 2), breaker, wire, round(vd_percentage, 2)
 
+    @staticmethod
+    def calculate_load_batch(va, voltage=230, length=30, is_continuous=False):
+        """
+        Vectorised form of calculate_load for a whole schedule at once.
+        Args:
+            va: Sequence / array of Volt-Ampere loads
+            voltage, length: Scalars or arrays broadcastable against va
+            is_continuous: Bool scalar or per-load bool array
+        Returns: (amps, breakers, wires, vd_percent) – NumPy arrays except
+                 wires, which is a list of wire designations.
+        """
+        va = np.asarray(va, dtype=np.float64)
+        cont = np.asarray(is_continuous, dtype=bool)
+
+        amps = np.where(cont, va * 1.25, va) / voltage
+        req_ampacity = np.where(cont, amps, amps * 1.25)
+
+        # First standard rating >= requirement; oversize loads fall back to 20 AT
+        idx = np.searchsorted(_STD_BREAKERS_ARR, req_ampacity, side="left")
+        over = idx >= len(_STD_BREAKERS)
+        breakers = np.where(over, 20, _STD_BREAKERS_ARR[np.minimum(idx, len(_STD_BREAKERS) - 1)]).astype(int)
+
+        wire_idx = np.searchsorted(_WIRE_THRESHOLDS_ARR, breakers, side="left")
+        resistance = _WIRE_RESISTANCE[wire_idx]
+
+        _, vd_percentage = AnalysisEngine.calculate_voltage_drop_batch(va / voltage, length, resistance, voltage)
+
+        wires = [_WIRE_NAMES[i] for i in wire_idx.tolist()]
+        return np.round(amps, 2), breakers, wires, vd_percentage
+
     @staticmethod
     def calculate_short_circuit(kva_trans=50, z_percent=2.0, voltage=230):
         """
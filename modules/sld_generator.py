@@ -14,11 +14,16 @@ Features:
 
 from PySide6.QtGui import (
     QPainter, QPen, QBrush, QColor, QFont, QPainterPath,
-    QLinearGradient, QRadialGradient, QPolygonF
+    QLinearGradient, QRadialGradient, QPolygonF, QImage, QPaintEngine
 )
 from PySide6.QtCore import Qt, QPointF, QRectF
+from bisect import bisect_left
+from enum import IntEnum
+from functools import lru_cache
 import math
 
+import numpy as np
+
 
 # ==========================================================================
 # PROFESSIONAL COLOR PALETTE  (matching main UI)
@@ -52,6 +57,54 @@ class SLDColors:
     GRID_MAJOR = QColor("#E1E4E8")  # major grid
     GRID_MINOR = QColor("#F6F8FA")  # minor grid
 
+    # Symbol fills
+    PANEL_LIGHT = QColor("#1A1F26")  # panel gradient edges
+    PANEL_LABEL = QColor("#ECEFF4")  # text on the dark panel
+    LOAD_GENERIC = QColor("#8B949E")  # unclassified loads
+
+    # Shared pens – built once, reused on every paint (read-only; Qt copies on write)
+    PEN_MAIN = QPen(LINE_MAIN, 3, Qt.SolidLine)
+    PEN_FEEDER = QPen(LINE_MAIN, 2.5, Qt.SolidLine)
+    PEN_BRANCH = QPen(LINE_BRANCH, 1.5, Qt.SolidLine)
+    PEN_GROUND = QPen(LINE_GROUND, 2, Qt.DashLine)
+    PEN_OUTLINE = QPen(BREAKER, 1.5)  # symbol outlines
+    PEN_OUTLINE_HEAVY = QPen(BREAKER, 2)  # housings, receptacle slots
+    PEN_CONTACT = QPen(BREAKER, 3)  # main breaker contacts
+    PEN_BUS = QPen(LOAD_RECEPT, 2)  # panel bus bars
+
+    # Brushes (built once; setBrush(QColor) would wrap a new QBrush per call)
+    BRUSH_BREAKER_1P = QBrush(BG_CANVAS)
+    BRUSH_BREAKER_2P = QBrush(GRID_MINOR)
+    BRUSH_BREAKER_3P = QBrush(GRID_MAJOR)
+    BRUSH_LOAD_LIGHT = QBrush(LOAD_LIGHT)
+    BRUSH_LOAD_RECEPT = QBrush(LOAD_RECEPT)
+    BRUSH_LOAD_MOTOR = QBrush(LOAD_MOTOR)
+    BRUSH_LOAD_AC = QBrush(LOAD_AC)
+    BRUSH_LOAD_GENERIC = QBrush(LOAD_GENERIC)
+
+    # Shared fonts (read-only: copy before modifying)
+    FONT_TITLE = QFont("Segoe UI", 16, QFont.Bold)
+    FONT_PROJECT = QFont("Segoe UI", 9)
+    FONT_RATING_MAIN = QFont("Segoe UI", 10, QFont.Bold)
+    FONT_CAPTION = QFont("Segoe UI", 8)
+    FONT_CIRCUIT = QFont("Segoe UI", 8, QFont.Bold)
+    FONT_RATING = QFont("Consolas", 7, QFont.Bold)
+    FONT_LABEL = QFont("Segoe UI", 9, QFont.Bold)
+    FONT_WIRE = QFont("Consolas", 7)
+
+
+class LoadKind(IntEnum):
+    """SLD load symbol families."""
+    LIGHT = 0
+    RECEPT = 1
+    MOTOR = 2
+    AC = 3
+    GENERIC = 4
+
+
+# AC diamond outlines keyed by symbol size (see ElectricalSymbols._draw_ac_load)
+_AC_POLY_CACHE: dict[float, QPolygonF] = {}
+
 
 # ==========================================================================
 # ELECTRICAL SYMBOL LIBRARY
@@ -69,26 +122,26 @@ class ElectricalSymbols:
 
         # Gradient fill
         grad = QLinearGradient(x - width / 2, y, x - width / 2, y + h)
-        grad.setColorAt(0.0, QColor("#F6F8FA"))
-        grad.setColorAt(1.0, QColor("#E1E4E8"))
+        grad.setColorAt(0.0, SLDColors.GRID_MINOR)
+        grad.setColorAt(1.0, SLDColors.GRID_MAJOR)
 
         painter.setBrush(grad)
-        painter.setPen(QPen(SLDColors.BREAKER, 2))
+        painter.setPen(SLDColors.PEN_OUTLINE_HEAVY)
         painter.drawRect(rect)
 
         # Internal contacts (two parallel lines)
         contact_y = y + h * 0.3
-        painter.setPen(QPen(SLDColors.BREAKER, 3))
+        painter.setPen(SLDColors.PEN_CONTACT)
         painter.drawLine(x - 15, contact_y, x + 15, contact_y)
         painter.drawLine(x - 15, contact_y + 8, x + 15, contact_y + 8)
 
         # Rating label
         painter.setPen(SLDColors.TEXT_PRIMARY)
-        painter.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        painter.setFont(SLDColors.FONT_RATING_MAIN)
         painter.drawText(rect.adjusted(0, h - 25, 0, 0), Qt.AlignCenter, rating)
 
         # "MAIN" label
-        painter.setFont(QFont("Segoe UI", 8))
+        painter.setFont(SLDColors.FONT_CAPTION)
         painter.drawText(rect.adjusted(0, 8, 0, 0), Qt.AlignCenter, "MAIN")
 
     @staticmethod
@@ -101,13 +154,13 @@ class ElectricalSymbols:
 
         # Fill based on pole count
         if pole == 1:
-            painter.setBrush(QColor("#FFFFFF"))
+            painter.setBrush(SLDColors.BRUSH_BREAKER_1P)
         elif pole == 2:
-            painter.setBrush(QColor("#F6F8FA"))
+            painter.setBrush(SLDColors.BRUSH_BREAKER_2P)
         else:
-            painter.setBrush(QColor("#E1E4E8"))
+            painter.setBrush(SLDColors.BRUSH_BREAKER_3P)
 
-        painter.setPen(QPen(SLDColors.BREAKER, 1.5))
+        painter.setPen(SLDColors.PEN_OUTLINE)
         painter.drawRect(rect)
 
         # Internal representation
@@ -120,7 +173,7 @@ class ElectricalSymbols:
             painter.drawLine(x - 10, y, x + 10, y)
 
         # Rating
-        painter.setFont(QFont("Consolas", 7, QFont.Bold))
+        painter.setFont(SLDColors.FONT_RATING)
         painter.setPen(SLDColors.TEXT_PRIMARY)
         painter.drawText(rect, Qt.AlignCenter, f"{rating}A")
 
@@ -132,87 +185,98 @@ class ElectricalSymbols:
 
         # Panel housing
         grad = QLinearGradient(x - width / 2, y, x + width / 2, y)
-        grad.setColorAt(0.0, QColor("#1A1F26"))
-        grad.setColorAt(0.5, QColor("#161A1F"))
-        grad.setColorAt(1.0, QColor("#1A1F26"))
+        grad.setColorAt(0.0, SLDColors.PANEL_LIGHT)
+        grad.setColorAt(0.5, SLDColors.PANEL)
+        grad.setColorAt(1.0, SLDColors.PANEL_LIGHT)
 
         painter.setBrush(grad)
-        painter.setPen(QPen(SLDColors.BREAKER, 2))
+        painter.setPen(SLDColors.PEN_OUTLINE_HEAVY)
         painter.drawRect(rect)
 
         # Bus bars (three vertical lines)
         bus_spacing = width / 4
-        painter.setPen(QPen(QColor("#00D9FF"), 2))
+        painter.setPen(SLDColors.PEN_BUS)
         for i in range(3):
             bx = x - width / 2 + bus_spacing * (i + 1)
             painter.drawLine(bx, y + 15, bx, y + h - 15)
 
         # Label
-        painter.setPen(QColor("#ECEFF4"))
-        painter.setFont(QFont("Segoe UI", 9, QFont.Bold))
+        painter.setPen(SLDColors.PANEL_LABEL)
+        painter.setFont(SLDColors.FONT_LABEL)
         painter.drawText(rect.adjusted(0, h - 20, 0, 0), Qt.AlignCenter, name)
 
     @staticmethod
-    def draw_load_symbol(painter: QPainter, x: float, y: float, load_type: str, size: float = 20) -> None:
-        """Load symbols (lighting, receptacle, motor, AC)."""
-        if "Light" in load_type or "Emergency" in load_type:
-            # Circle with cross (lighting)
-            painter.setBrush(SLDColors.LOAD_LIGHT)
-            painter.setPen(QPen(SLDColors.BREAKER, 1.5))
-            painter.drawEllipse(QPointF(x, y), size / 2, size / 2)
-            painter.drawLine(x - size / 3, y, x + size / 3, y)
-            painter.drawLine(x, y - size / 3, x, y + size / 3)
-
-        elif "Duplex" in load_type or "Outlet" in load_type or "GFCI" in load_type:
-            # Square (receptacle)
-            rect = QRectF(x - size / 2, y - size / 2, size, size)
-            painter.setBrush(SLDColors.LOAD_RECEPT)
-            painter.setPen(QPen(SLDColors.BREAKER, 1.5))
-            painter.drawRect(rect)
-            # Two vertical slots
-            painter.setPen(QPen(SLDColors.BREAKER, 2))
-            painter.drawLine(x - 4, y - 6, x - 4, y + 6)
-            painter.drawLine(x + 4, y - 6, x + 4, y + 6)
-
-        elif "Motor" in load_type or "Pump" in load_type:
-            # Circle with M (motor)
-            painter.setBrush(SLDColors.LOAD_MOTOR)
-            painter.setPen(QPen(SLDColors.BREAKER, 1.5))
-            painter.drawEllipse(QPointF(x, y), size / 2, size / 2)
-            painter.setFont(QFont("Segoe UI", 10, QFont.Bold))
-            painter.setPen(SLDColors.TEXT_PRIMARY)
-            painter.drawText(QRectF(x - size / 2, y - size / 2, size, size), Qt.AlignCenter, "M")
-
-        elif "AC" in load_type:
-            # Diamond (HVAC)
-            points = QPolygonF([
-                QPointF(x, y - size / 2),
-                QPointF(x + size / 2, y),
-                QPointF(x, y + size / 2),
-                QPointF(x - size / 2, y)
+    def draw_load_symbol(painter: QPainter, x: float, y: float, kind: LoadKind, size: float = 20) -> None:
+        """Load symbols (lighting, receptacle, motor, AC). See classify_load for kind."""
+        _LOAD_RENDERERS[kind](painter, x, y, size)
+
+    @staticmethod
+    def _draw_light_load(painter: QPainter, x: float, y: float, size: float) -> None:
+        # Circle with cross (lighting)
+        painter.setBrush(SLDColors.BRUSH_LOAD_LIGHT)
+        painter.setPen(SLDColors.PEN_OUTLINE)
+        painter.drawEllipse(QPointF(x, y), size / 2, size / 2)
+        painter.drawLine(x - size / 3, y, x + size / 3, y)
+        painter.drawLine(x, y - size / 3, x, y + size / 3)
+
+    @staticmethod
+    def _draw_receptacle_load(painter: QPainter, x: float, y: float, size: float) -> None:
+        # Square (receptacle)
+        rect = QRectF(x - size / 2, y - size / 2, size, size)
+        painter.setBrush(SLDColors.BRUSH_LOAD_RECEPT)
+        painter.setPen(SLDColors.PEN_OUTLINE)
+        painter.drawRect(rect)
+        # Two vertical slots
+        painter.setPen(SLDColors.PEN_OUTLINE_HEAVY)
+        painter.drawLine(x - 4, y - 6, x - 4, y + 6)
+        painter.drawLine(x + 4, y - 6, x + 4, y + 6)
+
+    @staticmethod
+    def _draw_motor_load(painter: QPainter, x: float, y: float, size: float) -> None:
+        # Circle with M (motor)
+        painter.setBrush(SLDColors.BRUSH_LOAD_MOTOR)
+        painter.setPen(SLDColors.PEN_OUTLINE)
+        painter.drawEllipse(QPointF(x, y), size / 2, size / 2)
+        painter.setFont(SLDColors.FONT_RATING_MAIN)
+        painter.setPen(SLDColors.TEXT_PRIMARY)
+        painter.drawText(QRectF(x - size / 2, y - size / 2, size, size), Qt.AlignCenter, "M")
+
+    @staticmethod
+    def _draw_ac_load(painter: QPainter, x: float, y: float, size: float) -> None:
+        # Diamond (HVAC) – origin-centred polygon cached per size
+        points = _AC_POLY_CACHE.get(size)
+        if points is None:
+            points = _AC_POLY_CACHE[size] = QPolygonF([
+                QPointF(0, -size / 2),
+                QPointF(size / 2, 0),
+                QPointF(0, size / 2),
+                QPointF(-size / 2, 0)
             ])
-            painter.setBrush(SLDColors.LOAD_AC)
-            painter.setPen(QPen(SLDColors.BREAKER, 1.5))
-            painter.drawPolygon(points)
+        painter.setBrush(SLDColors.BRUSH_LOAD_AC)
+        painter.setPen(SLDColors.PEN_OUTLINE)
+        painter.translate(x, y)
+        painter.drawPolygon(points)
+        painter.translate(-x, -y)
 
-        else:
-            # Generic (circle)
-            painter.setBrush(QColor("#8B949E"))
-            painter.setPen(QPen(SLDColors.BREAKER, 1.5))
-            painter.drawEllipse(QPointF(x, y), size / 2, size / 2)
+    @staticmethod
+    def _draw_generic_load(painter: QPainter, x: float, y: float, size: float) -> None:
+        # Generic (circle)
+        painter.setBrush(SLDColors.BRUSH_LOAD_GENERIC)
+        painter.setPen(SLDColors.PEN_OUTLINE)
+        painter.drawEllipse(QPointF(x, y), size / 2, size / 2)
 
     @staticmethod
     def draw_wire(painter: QPainter, x1: float, y1: float, x2: float, y2: float,
                   wire_type: str = "branch", label: str = "") -> None:
         """Draw wire/conductor with proper styling."""
         if wire_type == "main":
-            pen = QPen(SLDColors.LINE_MAIN, 3, Qt.SolidLine)
+            pen = SLDColors.PEN_MAIN
         elif wire_type == "feeder":
-            pen = QPen(SLDColors.LINE_MAIN, 2.5, Qt.SolidLine)
+            pen = SLDColors.PEN_FEEDER
         elif wire_type == "ground":
-            pen = QPen(SLDColors.LINE_GROUND, 2, Qt.DashLine)
+            pen = SLDColors.PEN_GROUND
         else:  # branch
-            pen = QPen(SLDColors.LINE_BRANCH, 1.5, Qt.SolidLine)
+            pen = SLDColors.PEN_BRANCH
 
         painter.setPen(pen)
         painter.drawLine(x1, y1, x2, y2)
@@ -221,14 +285,51 @@ class ElectricalSymbols:
         if label:
             mid_x = (x1 + x2) / 2
             mid_y = (y1 + y2) / 2
-            painter.setFont(QFont("Consolas", 7))
+            painter.setFont(SLDColors.FONT_WIRE)
             painter.setPen(SLDColors.TEXT_SECONDARY)
             painter.drawText(QPointF(mid_x + 5, mid_y - 5), label)
 
 
+# Load-type keywords in priority order; first substring hit decides the symbol
+_LOAD_KEYWORDS = (
+    (("Light", "Emergency"),         LoadKind.LIGHT),
+    (("Duplex", "Outlet", "GFCI"),   LoadKind.RECEPT),
+    (("Motor", "Pump"),              LoadKind.MOTOR),
+    (("AC",),                        LoadKind.AC),
+)
+
+_LOAD_RENDERERS = {
+    LoadKind.LIGHT:   ElectricalSymbols._draw_light_load,
+    LoadKind.RECEPT:  ElectricalSymbols._draw_receptacle_load,
+    LoadKind.MOTOR:   ElectricalSymbols._draw_motor_load,
+    LoadKind.AC:      ElectricalSymbols._draw_ac_load,
+    LoadKind.GENERIC: ElectricalSymbols._draw_generic_load,
+}
+
+
+@lru_cache(maxsize=256)
+def classify_load(load_type: str) -> LoadKind:
+    """Map a load name to its symbol kind; callers should classify once and keep it."""
+    for keywords, kind in _LOAD_KEYWORDS:
+        if any(kw in load_type for kw in keywords):
+            return kind
+    return LoadKind.GENERIC
+
+
 # ==========================================================================
 # INTELLIGENT LAYOUT ENGINE
 # ==========================================================================
+@lru_cache(maxsize=64)
+def _circuit_positions(x_center: int, start_y: int, spacing: int, total: int) -> np.ndarray:
+    """Branch circuit (x, y) positions, alternating right/left of x_center."""
+    idx = np.arange(total)
+    out = np.empty((total, 2))
+    out[:, 0] = np.where(idx % 2 == 0, x_center + 120, x_center - 120)
+    out[:, 1] = start_y + idx * spacing
+    out.setflags(write=False)  # shared between calls via the cache
+    return out
+
+
 class SLDLayoutEngine:
     """Automatic layout calculator for SLD diagrams."""
 
@@ -245,23 +346,25 @@ class SLDLayoutEngine:
         self.circuits_start_y = self.panel_y + 120
         self.circuit_spacing = 70
 
-    def get_circuit_position(self, index: int, total: int) -> tuple[float, float]:
-        """Calculate position for a branch circuit."""
-        y = self.circuits_start_y + index * self.circuit_spacing
-
-        # Alternate left/right for cleaner layout
-        if index % 2 == 0:
-            x = self.x_center + 120
-        else:
-            x = self.x_center - 120
-
-        return x, y
+    def compute_positions(self, total: int) -> np.ndarray:
+        """All circuit positions at once as a read-only (total, 2) array of (x, y)."""
+        return _circuit_positions(self.x_center, self.circuits_start_y, self.circuit_spacing, total)
 
     def estimate_height(self, circuit_count: int) -> int:
         """Estimate total diagram height."""
         return self.circuits_start_y + (circuit_count * self.circuit_spacing) + self.margin
 
 
+# Standard breaker frames (A) for _round_breaker; larger loads get 400 A
+_STANDARD_BREAKERS = (15, 20, 30, 40, 50, 60, 70, 80, 90, 100, 125, 150, 175, 200, 225, 250, 300, 400)
+_STANDARD_BREAKERS_ARR = np.array(_STANDARD_BREAKERS)
+
+# Feeder conductor per breaker rating: _FEEDER_WIRE_LIMITS[i] is the largest
+# rating _FEEDER_WIRES[i] may feed; anything above uses the last size.
+_FEEDER_WIRE_LIMITS = (20, 30, 40, 60, 80, 100, 125, 150)
+_FEEDER_WIRES = ("3.5mm²", "5.5mm²", "8mm²", "14mm²", "22mm²", "30mm²", "38mm²", "50mm²", "60mm²")
+
+
 # ==========================================================================
 # MAIN SLD GENERATOR
 # ==========================================================================
@@ -273,20 +376,80 @@ class SLDGenerator:
         self.layout = SLDLayoutEngine()
         self.symbols = ElectricalSymbols()
 
+        # Raster cache of everything except the branch circuits: an "under"
+        # layer (background → main panel) and an "over" layer (legend, notes),
+        # rebuilt only when the inputs they depend on change.
+        self._static_key = None
+        self._static_cache = None
+
+    _shared = None  # generator reused by draw_diagram so its cache survives calls
+
     # ══════════════════════════════════════════════════════════════════
     # PUBLIC API
     # ══════════════════════════════════════════════════════════════════
     @staticmethod
     def draw_diagram(painter: QPainter, items: list, project_data: dict = None) -> None:
         """Main entry point for drawing SLD. Compatible with existing code."""
-        generator = SLDGenerator()
-        generator.render(painter, items, project_data or {})
+        if SLDGenerator._shared is None:
+            SLDGenerator._shared = SLDGenerator()
+        SLDGenerator._shared.render(painter, items, project_data or {})
 
     def render(self, painter: QPainter, items: list, project_data: dict) -> None:
         """Render complete SLD diagram."""
         painter.setRenderHint(QPainter.Antialiasing)
         painter.setRenderHint(QPainter.TextAntialiasing)
 
+        # One pass over the loads feeds both the main and branch breaker sizing
+        va = np.fromiter((item.get("va", 0) for item in items), dtype=np.float64, count=len(items))
+        total_va = float(va.sum())
+        main_amps = int(total_va / project_data.get("system_voltage", 230) * 1.25)
+        main_rating = self._round_breaker(main_amps)
+        ratings = self._branch_ratings(va, project_data.get("system_voltage", 230))
+
+        # Vector targets (PDF/printer) get every primitive; raster targets
+        # blit the cached static layers around the live branch circuits.
+        if painter.paintEngine().type() != QPaintEngine.Raster:
+            self._draw_static_under(painter, project_data, main_rating)
+            self._draw_branch_circuits(painter, items, ratings)
+            self._draw_static_over(painter, project_data)
+            return
+
+        under, over = self._static_layers(project_data, main_rating)
+        painter.drawImage(0, 0, under)
+        self._draw_branch_circuits(painter, items, ratings)
+        painter.drawImage(0, 0, over)
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached static layers (e.g. after changing dark_mode or layout)."""
+        self._static_key = None
+        self._static_cache = None
+
+    def _static_layers(self, project_data: dict, main_rating: int) -> tuple:
+        """Return (under, over) images, re-rasterising only when inputs change."""
+        key = (
+            self.dark_mode, self.layout.canvas_w, self.layout.canvas_h, main_rating,
+            project_data.get("name"), project_data.get("system_voltage"),
+            project_data.get("standard"),
+        )
+        if key != self._static_key:
+            layers = []
+            for draw in (lambda p: self._draw_static_under(p, project_data, main_rating),
+                         lambda p: self._draw_static_over(p, project_data)):
+                img = QImage(self.layout.canvas_w, self.layout.canvas_h,
+                             QImage.Format_ARGB32_Premultiplied)
+                img.fill(Qt.transparent)
+                p = QPainter(img)
+                p.setRenderHint(QPainter.Antialiasing)
+                p.setRenderHint(QPainter.TextAntialiasing)
+                draw(p)
+                p.end()
+                layers.append(img)
+            self._static_cache = tuple(layers)
+            self._static_key = key
+        return self._static_cache
+
+    def _draw_static_under(self, painter: QPainter, project_data: dict, main_rating: int) -> None:
+        """Background, title, utility, main service and panel (below the branches)."""
         # Background
         if self.dark_mode:
             painter.fillRect(0, 0, self.layout.canvas_w, self.layout.canvas_h, SLDColors.BG_DARK)
@@ -300,18 +463,13 @@ class SLDGenerator:
         self._draw_utility_source(painter)
 
         # ── 3. Main service disconnect ────────────────────────────────
-        total_va = sum(item.get("va", 0) for item in items)
-        main_amps = int(total_va / project_data.get("system_voltage", 230) * 1.25)
-        main_rating = self._round_breaker(main_amps)
-
         self._draw_main_service(painter, main_rating)
 
         # ── 4. Main panel ─────────────────────────────────────────────
         self._draw_main_panel(painter, project_data.get("name", "MAIN PANEL"))
 
-        # ── 5. Branch circuits ────────────────────────────────────────
-        self._draw_branch_circuits(painter, items, project_data)
-
+    def _draw_static_over(self, painter: QPainter, project_data: dict) -> None:
+        """Legend and notes (drawn over the branch circuits)."""
         # ── 6. Legend ─────────────────────────────────────────────────
         self._draw_legend(painter)
 
@@ -323,7 +481,7 @@ class SLDGenerator:
     # ══════════════════════════════════════════════════════════════════
     def _draw_title_block(self, painter: QPainter, project_data: dict) -> None:
         """Professional title block at top."""
-        painter.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        painter.setFont(SLDColors.FONT_TITLE)
         painter.setPen(SLDColors.TEXT_PRIMARY)
         painter.drawText(
             QRectF(self.layout.margin, 20, self.layout.canvas_w - 2 * self.layout.margin, 30),
@@ -332,7 +490,7 @@ class SLDGenerator:
         )
 
         # Project info
-        painter.setFont(QFont("Segoe UI", 9))
+        painter.setFont(SLDColors.FONT_PROJECT)
         painter.setPen(SLDColors.TEXT_SECONDARY)
         info_y = 55
         info_x = self.layout.margin
@@ -353,11 +511,11 @@ class SLDGenerator:
             QPointF(x + 10, y - 20)
         ])
         painter.setBrush(SLDColors.TEXT_ACCENT)
-        painter.setPen(QPen(SLDColors.BREAKER, 1.5))
+        painter.setPen(SLDColors.PEN_OUTLINE)
         painter.drawPolygon(arrow)
 
         # Label
-        painter.setFont(QFont("Segoe UI", 9, QFont.Bold))
+        painter.setFont(SLDColors.FONT_LABEL)
         painter.setPen(SLDColors.TEXT_PRIMARY)
         painter.drawText(QPointF(x + 15, y - 5), "UTILITY")
 
@@ -383,76 +541,87 @@ class SLDGenerator:
 
         self.symbols.draw_panel(painter, x, y, name)
 
-    def _draw_branch_circuits(self, painter: QPainter, items: list, project_data: dict) -> None:
-        """All branch circuits with automatic layout."""
+    def _draw_branch_circuits(self, painter: QPainter, items: list, ratings: list) -> None:
+        """All branch circuits with automatic layout; ratings[i] is items[i]'s breaker."""
         panel_x = self.layout.x_center
         panel_bottom = self.layout.panel_y + 60
 
-        system_v = project_data.get("system_voltage", 230)
+        # Geometry for every circuit at once, so the passes below only
+        # index precomputed values and set each pen/font once.
+        positions = self.layout.compute_positions(len(items))
+        breaker_xs = np.where(np.arange(len(items)) % 2 == 1, panel_x - 50, panel_x + 50)
 
-        for idx, item in enumerate(items):
-            # Calculate position
-            circuit_x, circuit_y = self.layout.get_circuit_position(idx, len(items))
-            is_left = (idx % 2 == 1)
+        # (idx, item, circuit_x, circuit_y, breaker_x, breaker_y)
+        rows = [
+            (idx, item, circuit_x, circuit_y, breaker_x, circuit_y)
+            for idx, (item, circuit_x, circuit_y, breaker_x) in enumerate(zip(
+                items, positions[:, 0].tolist(), positions[:, 1].tolist(), breaker_xs.tolist()))
+        ]
 
-            # ── Branch breaker ────────────────────────────────────────
-            va = item.get("va", 0)
-            amps = va / system_v if system_v > 0 else 0
-            breaker_rating = self._round_breaker(int(amps * 1.25))
+        # ── Branch breakers ───────────────────────────────────────────
+        for idx, _, _, _, breaker_x, breaker_y in rows:
+            self.symbols.draw_branch_breaker(painter, breaker_x, breaker_y, str(ratings[idx]))
+
+        # ── Panel feeds and breaker-to-load wires: one path, one pen ─
+        wires = QPainterPath()
+        for _, _, _, _, breaker_x, breaker_y in rows:
+            wires.moveTo(panel_x, panel_bottom)
+            wires.lineTo(breaker_x, breaker_y)
+        for _, _, circuit_x, circuit_y, breaker_x, breaker_y in rows:
+            wires.moveTo(breaker_x, breaker_y)
+            wires.lineTo(circuit_x, circuit_y)
+        painter.strokePath(wires, SLDColors.PEN_BRANCH)
+
+        # ── Wire size labels ──────────────────────────────────────────
+        painter.setFont(SLDColors.FONT_WIRE)
+        painter.setPen(SLDColors.TEXT_SECONDARY)
+        for _, item, circuit_x, circuit_y, breaker_x, breaker_y in rows:
             wire_size = item.get("wire", "2.0mm²")
+            if wire_size:
+                mid = QPointF((breaker_x + circuit_x) / 2 + 5, (breaker_y + circuit_y) / 2 - 5)
+                painter.drawText(mid, wire_size)
+
+        # ── Load symbols ──────────────────────────────────────────────
+        for _, item, circuit_x, circuit_y, _, _ in rows:
+            kind = item.get("kind")
+            if kind is None:
+                kind = classify_load(item.get("name", "Load"))
+            self.symbols.draw_load_symbol(painter, circuit_x, circuit_y, kind)
+
+        # ── Circuit labels, grouped by font ──────────────────────────
+        painter.setFont(SLDColors.FONT_CIRCUIT)
+        painter.setPen(SLDColors.TEXT_PRIMARY)
+        for idx, _, circuit_x, circuit_y, _, _ in rows:
+            painter.drawText(QPointF(circuit_x + 25, circuit_y - 5), f"CKT {idx + 1}")
 
-            # Breaker position (on the panel edge)
-            breaker_x = panel_x - 50 if is_left else panel_x + 50
-            breaker_y = circuit_y
-
-            self.symbols.draw_branch_breaker(painter, breaker_x, breaker_y, str(breaker_rating))
-
-            # ── Wire from panel to breaker ───────────────────────────
-            painter.setPen(QPen(SLDColors.LINE_BRANCH, 1.5))
-            painter.drawLine(panel_x, panel_bottom, breaker_x, breaker_y)
-
-            # ── Wire from breaker to load ────────────────────────────
-            self.symbols.draw_wire(
-                painter, breaker_x, breaker_y, circuit_x, circuit_y, "branch", wire_size
-            )
-
-            # ── Load symbol ───────────────────────────────────────────
-            self.symbols.draw_load_symbol(painter, circuit_x, circuit_y, item.get("name", "Load"))
-
-            # ── Circuit label ─────────────────────────────────────────
+        painter.setFont(SLDColors.FONT_CAPTION)
+        painter.setPen(SLDColors.TEXT_SECONDARY)
+        for _, item, circuit_x, circuit_y, _, _ in rows:
             label_x = circuit_x + 25
-            label_y = circuit_y
-
-            painter.setFont(QFont("Segoe UI", 8, QFont.Bold))
-            painter.setPen(SLDColors.TEXT_PRIMARY)
-            painter.drawText(QPointF(label_x, label_y - 5), f"CKT {idx + 1}")
-
-            painter.setFont(QFont("Segoe UI", 8))
-            painter.setPen(SLDColors.TEXT_SECONDARY)
-            painter.drawText(QPointF(label_x, label_y + 8), item.get("name", "Load"))
-            painter.drawText(QPointF(label_x, label_y + 20), f"{va} VA")
+            painter.drawText(QPointF(label_x, circuit_y + 8), item.get("name", "Load"))
+            painter.drawText(QPointF(label_x, circuit_y + 20), f"{item.get('va', 0)} VA")
 
     def _draw_legend(self, painter: QPainter) -> None:
         """Symbol legend in bottom-left corner."""
         legend_x = self.layout.margin
         legend_y = self.layout.canvas_h - 180
 
-        painter.setFont(QFont("Segoe UI", 9, QFont.Bold))
+        painter.setFont(SLDColors.FONT_LABEL)
         painter.setPen(SLDColors.TEXT_PRIMARY)
         painter.drawText(legend_x, legend_y, "LEGEND")
 
         legend_y += 25
 
         symbols_info = [
-            ("Lighting", "Light"),
-            ("Receptacle", "Duplex"),
-            ("Motor Load", "Motor"),
-            ("AC/HVAC", "AC"),
+            ("Lighting", LoadKind.LIGHT),
+            ("Receptacle", LoadKind.RECEPT),
+            ("Motor Load", LoadKind.MOTOR),
+            ("AC/HVAC", LoadKind.AC),
         ]
 
-        painter.setFont(QFont("Segoe UI", 8))
-        for label, stype in symbols_info:
-            self.symbols.draw_load_symbol(painter, legend_x + 10, legend_y, stype, 16)
+        painter.setFont(SLDColors.FONT_CAPTION)
+        for label, kind in symbols_info:
+            self.symbols.draw_load_symbol(painter, legend_x + 10, legend_y, kind, 16)
             painter.drawText(legend_x + 30, legend_y + 5, label)
             legend_y += 25
 
@@ -461,7 +630,7 @@ class SLDGenerator:
         notes_x = self.layout.margin + 200
         notes_y = self.layout.canvas_h - 180
 
-        painter.setFont(QFont("Segoe UI", 9, QFont.Bold))
+        painter.setFont(SLDColors.FONT_LABEL)
         painter.setPen(SLDColors.TEXT_PRIMARY)
         painter.drawText(notes_x, notes_y, "NOTES")
 
@@ -475,7 +644,7 @@ class SLDGenerator:
             "5. All circuits include equipment grounding conductor",
         ]
 
-        painter.setFont(QFont("Segoe UI", 8))
+        painter.setFont(SLDColors.FONT_CAPTION)
         painter.setPen(SLDColors.TEXT_SECONDARY)
         for note in notes:
             painter.drawText(notes_x, notes_y, note)
@@ -485,32 +654,21 @@ class SLDGenerator:
     # UTILITY METHODS
     # ══════════════════════════════════════════════════════════════════
     @staticmethod
+    @lru_cache(maxsize=512)
     def _round_breaker(amps: float) -> int:
         """Round to standard breaker size."""
-        standard_sizes = [15, 20, 30, 40, 50, 60, 70, 80, 90, 100, 125, 150, 175, 200, 225, 250, 300, 400]
-        for size in standard_sizes:
-            if amps <= size:
-                return size
-        return 400
+        idx = bisect_left(_STANDARD_BREAKERS, amps)
+        return _STANDARD_BREAKERS[idx] if idx < len(_STANDARD_BREAKERS) else 400
 
     @staticmethod
+    def _branch_ratings(va: np.ndarray, system_v: float) -> list:
+        """Vectorised _round_breaker(int(va / system_v * 1.25)) for every load."""
+        required = np.trunc(va / system_v * 1.25)
+        idx = np.searchsorted(_STANDARD_BREAKERS_ARR, required, side="left")
+        return _STANDARD_BREAKERS_ARR[np.minimum(idx, len(_STANDARD_BREAKERS) - 1)].tolist()
+
+    @staticmethod
+    @lru_cache(maxsize=512)
     def _get_feeder_wire(amps: int) -> str:
         """Get feeder wire size based on ampacity."""
-        if amps <= 20:
-            return "3.5mm²"
-        elif amps <= 30:
-            return "5.5mm²"
-        elif amps <= 40:
-            return "8mm²"
-        elif amps <= 60:
-            return "14mm²"
-        elif amps <= 80:
-            return "22mm²"
-        elif amps <= 100:
-            return "30mm²"
-        elif amps <= 125:
-            return "38mm²"
-        elif amps <= 150:
-            return "50mm²"
-        else:
-            return "60mm²"
\ No newline at end of file
+        return _FEEDER_WIRES[bisect_left(_FEEDER_WIRE_LIMITS, amps)]
\ No newline at end of file
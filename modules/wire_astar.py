@@ -0,0 +1,115 @@
+import heapq
+
+import numpy as np
+
+# Numba is optional: with it the search compiles to native code, without it
+# the same kernel runs as plain Python over the precomputed grid.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+# Lightness below this marks a floorplan pixel as wall (same as is_wall_at)
+WALL_LIGHTNESS = 120
+
+# cost_so_far value for nodes the search has not reached
+_UNVISITED = 1 << 30
+
+
+def pack_walls(grid):
+    """
+    Bit-pack a (rows, cols) 0/1 wall grid into (rows, ceil(cols / 64)) 64-bit
+    words: cell (y, x) is bit x & 63 of word [y, x >> 6]. Words are signed so
+    shifts stay in int64 under numba (uint64 mixed with int64 gives float).
+    """
+    rows, cols = grid.shape
+    padded = np.zeros((rows, -(-cols // 64) * 64), np.uint8)
+    padded[:, :cols] = grid
+    return np.packbits(padded, axis=1, bitorder="little").view("<i8")
+
+
+def l_route(grid, sx, sy, ex, ey):
+    """
+    Cheap pre-check before astar: return the corner (x, y) of a wall-free
+    L-shaped route, trying horizontal-first then vertical-first, or None
+    when both are blocked. Such a route is already a shortest path.
+    """
+    x0, x1 = min(sx, ex), max(sx, ex) + 1
+    y0, y1 = min(sy, ey), max(sy, ey) + 1
+    if not (grid[sy, x0:x1].any() or grid[y0:y1, ex].any()):
+        return ex, sy
+    if not (grid[y0:y1, sx].any() or grid[ey, x0:x1].any()):
+        return sx, ey
+    return None
+
+
+@njit(cache=True, fastmath=True)
+def astar(wall_bits, cols, sx, sy, ex, ey):
+    """
+    4-connected A* over a bit-packed wall grid (see pack_walls).
+    Args:
+        wall_bits: Packed walls, one row of int64 words per grid row
+        cols: Grid width in cells (the last word of a row may be padding)
+        sx, sy, ex, ey: Start / end cell indices
+    Returns: int32 array of (x, y) cells from start to end, or an empty
+             (0, 2) array when the end cannot be reached.
+    """
+    rows = wall_bits.shape[0]
+    n = rows * cols
+
+    # Nodes are numbered x * rows + y so equal priorities pop in (x, y) order.
+    # Heap entries are single ints, priority * n + node, so heapq compares
+    # plain integers instead of tuples.
+    came_from = np.full(n, -1, np.int32)
+    cost_so_far = np.full(n, _UNVISITED, np.int32)
+
+    start = sx * rows + sy
+    goal = ex * rows + ey
+    cost_so_far[start] = 0
+    came_from[start] = start
+    heap = [start]
+
+    dxs = (1, -1, 0, 0)
+    dys = (0, 0, 1, -1)
+    while heap:
+        current = heapq.heappop(heap) % n
+        if current == goal:
+            break
+        cx = current // rows
+        cy = current % rows
+
+        for k in range(4):
+            nx = cx + dxs[k]
+            ny = cy + dys[k]
+            if nx < 0 or ny < 0 or nx >= cols or ny >= rows:
+                continue
+            if (int(wall_bits[ny, nx >> 6]) >> (nx & 63)) & 1:
+                continue
+
+            nxt = nx * rows + ny
+            new_cost = int(cost_so_far[current]) + 1  # widen: priority * n can exceed int32
+            if new_cost < cost_so_far[nxt]:
+                cost_so_far[nxt] = new_cost
+                priority = new_cost + abs(ex - nx) + abs(ey - ny)
+                heapq.heappush(heap, priority * n + nxt)
+                came_from[nxt] = current
+
+    if came_from[goal] < 0:
+        return np.empty((0, 2), np.int32)
+
+    # Walk back from the goal, then flip into start -> end order
+    length = 1
+    node = goal
+    while node != start:
+        node = came_from[node]
+        length += 1
+    path = np.empty((length, 2), np.int32)
+    node = goal
+    for i in range(length - 1, -1, -1):
+        path[i, 0] = node // rows
+        path[i, 1] = node % rows
+        node = came_from[node]
+    return path
@@ -1,16 +1,44 @@
-import heapq
+import json
+import math
 import os
+from functools import lru_cache
+import numpy as np
 import matplotlib.pyplot as plt
 import ezdxf
 from ezdxf.addons.drawing import RenderContext, Frontend
 from ezdxf.addons.drawing.matplotlib import MatplotlibBackend
 
 from PySide6.QtWidgets import (QGraphicsView, QGraphicsScene, QGraphicsItem,
-                               QGraphicsTextItem, QGraphicsLineItem, QGraphicsEllipseItem,
+                               QGraphicsSimpleTextItem, QGraphicsLineItem, QGraphicsEllipseItem,
                                QGraphicsPixmapItem, QGraphicsRectItem, QFileDialog, QGraphicsObject)
-from PySide6.QtGui import QBrush, QColor, QPen, QPainter, QFont, QPixmap, QWheelEvent, QImage, QCursor
-from PySide6.QtCore import Qt, QPointF, QRectF, Signal, QObject
+from PySide6.QtGui import QBrush, QColor, QPen, QPainter, QFont, QPixmap, QWheelEvent, QImage, QCursor, QOpenGLContext, QPolygonF
+from PySide6.QtCore import Qt, QPointF, QRectF, QLineF, Signal, QObject
 from PySide6.QtSvgWidgets import QGraphicsSvgItem
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
+
+from modules.sld_generator import classify_load
+from modules.wire_astar import astar, l_route, pack_walls, WALL_LIGHTNESS
+
+# Custom QGraphicsItem.type() id – lets callers filter scene items with an
+# integer compare instead of a Python-level isinstance() per item.
+ELEC_COMP_TYPE = QGraphicsItem.UserType + 1
+
+# Shared colours and pens, parsed once instead of per item or per paint
+_ACCENT = QColor("#00e5ff")
+_SELECTION_PEN = QPen(Qt.white, 2, Qt.DashLine)
+_BACKGROUND = QColor("#0d0f14")
+# Share of a grid cell's floorplan pixels that must be dark for its node to
+# be a wall: a 1 px line across the cell, but not stray specks of noise
+_WALL_FRACTION = 0.05
+# Half-pixel hairline at every zoom level and device pixel ratio
+_GRID_PEN = QPen(QColor("#1c222d"), 0.5)
+_GRID_PEN.setCosmetic(True)
+
+
+def _va_total(vas):
+    """Sum of a float64 VA array, as an int when it is whole (as the int loads sum)."""
+    total = float(vas.sum())
+    return int(total) if total.is_integer() else total
 
 
 class CanvasSignals(QObject):
@@ -26,13 +54,14 @@ class RoomItem(QGraphicsRectItem):
         self.name = name
         self.is_room_rect = True
         self.setZValue(-1.5)
-        self.setPen(QPen(QColor("#00e5ff"), 2, Qt.DashLine))
+        self.setPen(QPen(_ACCENT, 2, Qt.DashLine))
         self.setBrush(QColor(0, 229, 255, 25))
         self.setFlags(QGraphicsItem.ItemIsMovable | QGraphicsItem.ItemIsSelectable)
 
-        self.label = QGraphicsTextItem(self.name, self)
-        self.label.setDefaultTextColor(QColor("#00e5ff"))
+        self.label = QGraphicsSimpleTextItem(self.name, self)
+        self.label.setBrush(_ACCENT)
         self.label.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        self.label.setPos(4, 4)
 
 
 class WireItem(QGraphicsLineItem):
@@ -47,74 +76,97 @@ class WireItem(QGraphicsLineItem):
         self.is_feeder_line = "Feeder" in [start_item.comp_type, end_item.comp_type]
         self.setZValue(-1)
         self.path_points = []
+        self._polyline = QPolygonF()
+        self._preview = False  # straight-bend preview while an end is dragged
+        self._routed = False   # path_points came from A* (not a preview)
+
+        glow_color = QColor(self.base_color)
+        glow_color.setAlpha(60)
+        self._glow_pen = QPen(glow_color, 10 if self.is_feeder_line else 6)
+        self._core_pen = QPen(self.base_color, 4 if self.is_feeder_line else 2, Qt.SolidLine)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.update_position()
 
     def update_position(self):
         p1 = self.start_item.scenePos() + QPointF(20, 20)
         p2 = self.end_item.scenePos() + QPointF(20, 20)
 
-        # Calculate Smart Path using A*
-        self.path_points = self.calculate_astar_path(p1, p2)
+        if self._preview:
+            # Dragging: cheap orthogonal bend, routed properly on drop
+            path_points = [p1, QPointF(p2.x(), p1.y()), p2]
+        else:
+            # Endpoints unchanged since the last route: nothing to redo
+            if self.path_points and self._routed and self.line() == QLineF(p1, p2):
+                return
+
+            # Calculate Smart Path using A*
+            path_points = self.calculate_astar_path(p1, p2)
 
         # Required to update the bounding box for the QGraphicsItem
         self.prepareGeometryChange()
+        self.path_points = path_points
+        self._polyline = QPolygonF(path_points)
+        self._routed = not self._preview
         self.setLine(p1.x(), p1.y(), p2.x(), p2.y())
 
+    def set_preview_mode(self, enabled):
+        """Toggle drag preview; leaving it re-routes the wire with A*."""
+        if enabled == self._preview:
+            return
+        self._preview = enabled
+        self.update_position()
+
+    def boundingRect(self):
+        # The routed path can leave the straight start/end line's rect
+        if not self.path_points:
+            return super().boundingRect()
+        margin = self._glow_pen.widthF() / 2 + 1
+        return self._polyline.boundingRect().adjusted(-margin, -margin, margin, margin)
+
     def calculate_astar_path(self, start, end):
         """Finds an orthogonal path avoiding dark pixels (walls)."""
-        grid = 20
+        grid = self.canvas.grid_size
         # Round to grid
-        s_node = (round(start.x() / grid) * grid, round(start.y() / grid) * grid)
-        e_node = (round(end.x() / grid) * grid, round(end.y() / grid) * grid)
+        s_node = (round(start.x() / grid), round(start.y() / grid))
+        e_node = (round(end.x() / grid), round(end.y() / grid))
 
         # If no floorplan, use simple orthogonal bend
-        if not self.canvas.obstacle_map:
-            return [start, QPointF(e_node[0], s_node[1]), end]
-
-        queue = [(0, s_node)]
-        came_from = {s_node: None}
-        cost_so_far = {s_node: 0}
-
-        while queue:
-            _, current = heapq.heappop(queue)
-            if current == e_node: break
-
-            for dx, dy in [(grid, 0), (-grid, 0), (0, grid), (0, -grid)]:
-                nxt = (current[0] + dx, current[1] + dy)
-
-                # Check if 'nxt' is a wall
-                if self.canvas.is_wall_at(QPointF(nxt[0], nxt[1])):
-                    continue
-
-                new_cost = cost_so_far[current] + grid
-                if nxt not in cost_so_far or new_cost < cost_so_far[nxt]:
-                    cost_so_far[nxt] = new_cost
-                    priority = new_cost + abs(e_node[0] - nxt[0]) + abs(e_node[1] - nxt[1])
-                    heapq.heappush(queue, (priority, nxt))
-                    came_from[nxt] = current
-
-        # Reconstruct path
-        path = []
-        curr = e_node
-        if curr not in came_from: return [start, end]  # Fallback
-        while curr is not None:
-            path.append(QPointF(curr[0], curr[1]))
-            curr = came_from[curr]
-        path.reverse()
-        return path
+        obstacle_grid = self.canvas.obstacle_grid
+        if obstacle_grid is None:
+            return [start, QPointF(e_node[0] * grid, s_node[1] * grid), end]
+
+        # Shift into obstacle-grid indices; anything off the grid can't be routed
+        ox, oy = self.canvas.obstacle_origin
+        rows, cols = obstacle_grid.shape
+        sx, sy = s_node[0] - ox, s_node[1] - oy
+        ex, ey = e_node[0] - ox, e_node[1] - oy
+        if not (0 <= sx < cols and 0 <= ex < cols and 0 <= sy < rows and 0 <= ey < rows):
+            return [start, end]
+
+        # Terminals sit on wall lines; the route may always start and end there
+        wall_bits = self.canvas.wall_bits
+        if obstacle_grid[sy, sx] or obstacle_grid[ey, ex]:
+            obstacle_grid = obstacle_grid.copy()
+            obstacle_grid[sy, sx] = obstacle_grid[ey, ex] = 0
+            wall_bits = pack_walls(obstacle_grid)
+
+        # Common case: a plain L-bend is clear, no search needed
+        corner = l_route(obstacle_grid, sx, sy, ex, ey)
+        if corner is not None:
+            cells = [(sx, sy), corner, (ex, ey)]
+            return [QPointF((x + ox) * grid, (y + oy) * grid) for x, y in cells]
+
+        cells = astar(wall_bits, cols, sx, sy, ex, ey)
+        if not len(cells):
+            return [start, end]  # Fallback
+        return [QPointF((x + ox) * grid, (y + oy) * grid) for x, y in cells.tolist()]
 
     def paint(self, painter, option, widget):
-        glow_width = 10 if self.is_feeder_line else 6
-        core_width = 4 if self.is_feeder_line else 2
-
-        for i in range(len(self.path_points) - 1):
-            p1, p2 = self.path_points[i], self.path_points[i + 1]
-            glow_color = QColor(self.base_color)
-            glow_color.setAlpha(60)
-            painter.setPen(QPen(glow_color, glow_width))
-            painter.drawLine(p1, p2)
-            painter.setPen(QPen(self.base_color, core_width, Qt.SolidLine))
-            painter.drawLine(p1, p2)
+        # Whole route in two strokes: translucent glow, then the solid core
+        painter.setPen(self._glow_pen)
+        painter.drawPolyline(self._polyline)
+        painter.setPen(self._core_pen)
+        painter.drawPolyline(self._polyline)
 
 
 class ElectricalComponent(QGraphicsObject):
@@ -124,8 +176,11 @@ class ElectricalComponent(QGraphicsObject):
         self.va = data.get("va", 0)
         self.comp_type = data.get("type", "General")
         self.is_continuous = data.get("is_continuous", False)
+        self.load_kind = classify_load(name)  # SLD symbol family, kept off the paint path
         self.connections = []
         self.wires = []
+        self._drag_wires = set()
+        self._drag_moved = False  # _drag_wires are in preview mode
         
         default_svg = "assets/symbols/feeder.svg" if data.get("type") == "Feeder" else "assets/symbols/generic.svg"
         self.symbol_path = data.get("symbol", default_svg)
@@ -141,6 +196,8 @@ class ElectricalComponent(QGraphicsObject):
                  self.visual_item = QGraphicsPixmapItem(pix)
         
         self.visual_item.setParentItem(self)
+        # Rasterise the symbol once and reuse it until the view transform changes
+        self.visual_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
         self.setScale(0.4)
         self.setPos(pos)
@@ -148,19 +205,23 @@ class ElectricalComponent(QGraphicsObject):
         self.setFlags(
             QGraphicsItem.ItemIsMovable | QGraphicsItem.ItemIsSelectable | QGraphicsItem.ItemSendsGeometryChanges)
 
-        self.label = QGraphicsTextItem(self)
-        self.label.setParentItem(self)
+        # Plain two-line label: a simple text item skips QTextDocument layout
+        self.label = QGraphicsSimpleTextItem(self)
         self.label.setScale(2.5)
         self.label.setFont(QFont("Consolas", 8, QFont.Weight.Bold))
-        self.label.setDefaultTextColor(QColor("#00e5ff"))
-        self.label.setPos(0, 110)
+        self.label.setBrush(_ACCENT)
+        self.label.setPos(4 * 2.5, 110 + 4 * 2.5)  # where the old text item's 4px document margin put it
+        self.label.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.update_label_text()
 
     def paint(self, painter, option, widget):
         if self.isSelected():
-            painter.setPen(QPen(Qt.white, 2, Qt.DashLine))
+            painter.setPen(_SELECTION_PEN)
             painter.drawRect(self.boundingRect().adjusted(-5, -5, 5, 5))
 
+    def type(self):
+        return ELEC_COMP_TYPE
+
     def boundingRect(self):
         if self.visual_item:
             return self.visual_item.boundingRect()
@@ -168,7 +229,7 @@ class ElectricalComponent(QGraphicsObject):
 
     def update_label_text(self):
         label_str = f"{self.name}" if self.comp_type == "Feeder" else f"{self.name}\n{self.va}VA"
-        self.label.setPlainText(label_str)
+        self.label.setText(label_str)
 
     def itemChange(self, change, value):
         if change == QGraphicsItem.ItemPositionChange and self.scene():
@@ -176,13 +237,48 @@ class ElectricalComponent(QGraphicsObject):
             grid_size = 20
             new_pos.setX(round(new_pos.x() / grid_size) * grid_size)
             new_pos.setY(round(new_pos.y() / grid_size) * grid_size)
+            # First real move of a drag: the grabbed item previews its wires
+            if new_pos != self.pos():
+                grabber = self.scene().mouseGrabberItem()
+                if isinstance(grabber, ElectricalComponent):
+                    grabber._start_wire_preview()
+            return new_pos
+        if change == QGraphicsItem.ItemPositionHasChanged and self.scene():
+            # Follow the item to where it actually landed
             for wire in self.wires:
                 wire.update_position()
-            return new_pos
+            # Keep the canvas' room-lookup anchors in step with the move
+            for view in self.scene().views():
+                if isinstance(view, DesignCanvas):
+                    view.index_component(self)
         return super().itemChange(change, value)
 
+    def mousePressEvent(self, event):
+        super().mousePressEvent(event)
+        # The whole selection moves with this item; its wires go into preview
+        # only once something actually moves, so a plain click keeps routes
+        self._drag_wires = {w for item in self.scene().selectedItems() + [self]
+                            if item.type() == ELEC_COMP_TYPE for w in item.wires}
+        self._drag_moved = False
+
+    def _start_wire_preview(self):
+        if self._drag_moved:
+            return
+        self._drag_moved = True
+        for wire in self._drag_wires:
+            wire.set_preview_mode(True)
+
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        if self._drag_moved:
+            for wire in self._drag_wires:
+                wire.set_preview_mode(False)
+        self._drag_wires = set()
+        self._drag_moved = False
+
     def update_data(self, new_name, new_va):
         self.name = new_name
+        self.load_kind = classify_load(new_name)
         self.va = int(new_va or 0)
         self.update_label_text()
 
@@ -193,13 +289,30 @@ class ElectricalComponent(QGraphicsObject):
         return False
 
 
+@lru_cache(maxsize=None)
+def opengl_available():
+    """True if this platform can create an OpenGL context for a view's viewport.
+
+    Shared by every QGraphicsView that opts into a QOpenGLWidget viewport.
+    """
+    return QOpenGLContext().create()
+
+
 class DesignCanvas(QGraphicsView):
     def __init__(self):
         super().__init__()
         self.scene = QGraphicsScene(0, 0, 5000, 5000)
+        self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
         self.setScene(self.scene)
+        # GPU-backed viewport: pans and zooms are composited by OpenGL
+        # (platforms without a GL context keep the raster viewport). A GL
+        # surface is redrawn whole every frame, so partial updates only
+        # cost region bookkeeping there.
+        if opengl_available():
+            self.setViewport(QOpenGLWidget())
+            self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
         self.signals = CanvasSignals()
-        self.setBackgroundBrush(QBrush(QColor("#0d0f14")))
+        self.setBackgroundBrush(QBrush(_BACKGROUND))
         self.setRenderHint(QPainter.Antialiasing)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setDragMode(QGraphicsView.RubberBandDrag)
@@ -209,6 +322,26 @@ class DesignCanvas(QGraphicsView):
         self.start_item = None
         self.floorplan_item = None
         self.obstacle_map = None
+        self._img_np = None     # obstacle_map pixels as an (h, w, 4) RGBA view
+        self._lightness = None  # obstacle_map lightness, indexed [y, x]
+        # Wall flags per grid node for wire routing, and the cell index of [0, 0]
+        self.obstacle_grid = None
+        self.wall_bits = None  # obstacle_grid bit-packed for the A* kernel
+        self.obstacle_origin = (0, 0)
+
+        # Live list of ElectricalComponents on the scene, so callers don't
+        # have to walk and filter scene.items() on every sync.
+        self.components = []
+        # Likewise for RoomItems, in the order they were added
+        self.rooms = []
+
+        # Scene anchor (x, y) of each component – the point wires attach to
+        # and rooms are tested against – row i matching components[i], so
+        # room queries are array comparisons.
+        self._comp_anchors = np.zeros((0, 2))
+        # Row of each component in components / _comp_anchors, so a moved
+        # item finds its row without scanning the list
+        self._comp_rows = {}
 
         # Panning state
         self._pan_active = False
@@ -219,10 +352,24 @@ class DesignCanvas(QGraphicsView):
         try:
             # Ensure output directory exists
             temp_png = os.path.join("assets", "templates", "processed_view.png")
+            meta_path = os.path.join("assets", "templates", "processed_view.json")
             os.makedirs(os.path.dirname(temp_png), exist_ok=True)
 
             print(f"Loading DXF: {dxf_path}")
 
+            # Reuse the last render if it came from this exact file version
+            source = os.path.abspath(dxf_path)
+            cache_key = f"{os.path.getmtime(dxf_path):.0f}_{os.path.getsize(dxf_path)}"
+            try:
+                with open(meta_path, "r", encoding="utf-8") as fh:
+                    meta = json.load(fh)
+            except (OSError, ValueError):
+                meta = {}
+            if meta.get("source") == source and meta.get("key") == cache_key and os.path.exists(temp_png):
+                print(f"Using cached render: {temp_png}")
+                self.set_template(temp_png)
+                return True
+
             # Read the DXF file
             doc = ezdxf.readfile(dxf_path)
             msp = doc.modelspace()
@@ -267,12 +414,13 @@ class DesignCanvas(QGraphicsView):
             out = MatplotlibBackend(ax)
             Frontend(ctx, out).draw_layout(msp, finalize=True)
 
-            # Save with high DPI for quality
+            # 100 DPI is plenty for display and 20 px-grid wall detection;
+            # no tight bbox so figure inches map 1:1 onto image pixels.
             print(f"Saving rendered image to: {temp_png}")
             fig.savefig(temp_png,
-                        dpi=200,  # Reduced from 300 for better performance
-                        bbox_inches='tight',
-                        pad_inches=0.1,
+                        dpi=100,
+                        bbox_inches=None,
+                        pad_inches=0,
                         facecolor='white',
                         edgecolor='none')
             plt.close(fig)
@@ -283,6 +431,8 @@ class DesignCanvas(QGraphicsView):
                 return False
 
             print(f"Successfully saved PNG: {os.path.getsize(temp_png)} bytes")
+            with open(meta_path, "w", encoding="utf-8") as fh:
+                json.dump({"source": source, "key": cache_key}, fh)
 
             # Load the template into canvas
             self.set_template(temp_png)
@@ -317,6 +467,9 @@ class DesignCanvas(QGraphicsView):
         self.floorplan_item = QGraphicsPixmapItem(pixmap)
         self.floorplan_item.setZValue(-2)  # Behind everything
         self.floorplan_item.setAcceptedMouseButtons(Qt.NoButton)  # Not interactive
+        # Large static image: keep a device-resolution copy so pans are blits
+        self.floorplan_item.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, False)
+        self.floorplan_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
         # Position at origin
         self.floorplan_item.setPos(0, 0)
@@ -335,8 +488,13 @@ class DesignCanvas(QGraphicsView):
         )
 
         # Cache image for wall detection
-        self.obstacle_map = pixmap.toImage()
+        # One conversion to a fixed RGBA layout; _img_np is a zero-copy view
+        # of its pixels and stays valid while obstacle_map is referenced.
+        self.obstacle_map = pixmap.toImage().convertToFormat(QImage.Format_RGBA8888)
         print(f"Obstacle map cached: {self.obstacle_map.width()}x{self.obstacle_map.height()}")
+        self._img_np = self._pixel_view(self.obstacle_map)
+        self._lightness = self._build_lightness(self._img_np)
+        self._build_obstacle_grid()
 
         # Fit the view to show the entire floorplan
         self.fitInView(self.floorplan_item, Qt.KeepAspectRatio)
@@ -349,6 +507,52 @@ class DesignCanvas(QGraphicsView):
 
         print("Template loaded and view adjusted")
 
+    @staticmethod
+    def _pixel_view(image):
+        """(h, w, 4) uint8 view onto a 32-bit QImage's pixel buffer (no copy)."""
+        w, h = image.width(), image.height()
+        pixels = np.frombuffer(image.constBits(), np.uint8)
+        return pixels.reshape(h, image.bytesPerLine())[:, :w * 4].reshape(h, w, 4)
+
+    @staticmethod
+    def _build_lightness(pixels):
+        """Per-pixel lightness of an (h, w, 4) RGBA array as a (h, w) uint8 array."""
+        # Same measure as QColor.lightness(): (max + min) / 2 of R, G, B
+        rgb = pixels[..., :3]
+        return ((rgb.max(axis=2).astype(np.uint16) + rgb.min(axis=2)) // 2).astype(np.uint8)
+
+    def _build_obstacle_grid(self):
+        """Reduce obstacle_map to one wall flag per grid node of the scene rect (1 = wall).
+
+        A node is a wall when at least _WALL_FRACTION of the grid_size square
+        centred on it is dark, so walls thinner than the grid spacing still
+        block wires while isolated dark pixels do not.
+        """
+        grid = self.grid_size
+        rect = self.scene.sceneRect()
+        ox, oy = math.floor(rect.left() / grid), math.floor(rect.top() / grid)
+        cols = math.ceil(rect.right() / grid) - ox + 1
+        rows = math.ceil(rect.bottom() / grid) - oy + 1
+
+        lightness = self._lightness
+        h, w = lightness.shape
+
+        # Lay the image onto a canvas of whole node cells (off-image = open
+        # floor), then count each cell's dark pixels in one reduction.
+        offset = self.floorplan_item.pos()
+        top = int(offset.y()) - (oy * grid - grid // 2)
+        left = int(offset.x()) - (ox * grid - grid // 2)
+        cells = np.full((rows * grid, cols * grid), 255, np.uint8)
+        y0, x0 = max(top, 0), max(left, 0)
+        y1, x1 = min(top + h, rows * grid), min(left + w, cols * grid)
+        if y0 < y1 and x0 < x1:
+            cells[y0:y1, x0:x1] = lightness[y0 - top:y1 - top, x0 - left:x1 - left]
+
+        dark = (cells < WALL_LIGHTNESS).reshape(rows, grid, cols, grid).sum(axis=(1, 3))
+        self.obstacle_grid = (dark >= _WALL_FRACTION * grid * grid).astype(np.uint8)
+        self.wall_bits = pack_walls(self.obstacle_grid)
+        self.obstacle_origin = (ox, oy)
+
     def is_wall_at(self, scene_pos):
         """Checks if a point is dark (wall) or bright (floor)."""
         if not self.obstacle_map or not self.floorplan_item:
@@ -359,11 +563,10 @@ class DesignCanvas(QGraphicsView):
         x, y = int(local_p.x()), int(local_p.y())
 
         # Check bounds
-        if 0 <= x < self.obstacle_map.width() and 0 <= y < self.obstacle_map.height():
+        h, w = self._lightness.shape
+        if 0 <= x < w and 0 <= y < h:
             # Dark pixels (low lightness) = walls
-            pixel_color = self.obstacle_map.pixelColor(x, y)
-            lightness = pixel_color.lightness()
-            return lightness < 120  # Threshold for wall detection
+            return self._lightness[y, x] < WALL_LIGHTNESS  # Threshold for wall detection
 
         return False
 
@@ -372,20 +575,37 @@ class DesignCanvas(QGraphicsView):
         results = ""
         total_va = 0
 
-        for item in self.scene.items():
-            if isinstance(item, RoomItem):
-                room_total = 0
-                # Finds components physically inside the RoomItem rectangle
-                for collided in self.scene.collidingItems(item):
-                    if isinstance(collided, ElectricalComponent):
-                        room_total += collided.va
+        vas = np.fromiter((c.va for c in self.components), dtype=np.float64, count=len(self.components))
+        # Newest first, matching the scene's stacking order used previously
+        for item in reversed(self.rooms):
+            # Finds components physically inside the RoomItem rectangle
+            room_total = _va_total(vas[self._intersecting(item.sceneBoundingRect())])
 
-                results += f"{item.name}: {room_total} VA\n"
-                total_va += room_total
+            results += f"{item.name}: {room_total} VA\n"
+            total_va += room_total
 
         results += f"\nTOTAL CONNECTED LOAD: {total_va} VA"
         return results
 
+    @staticmethod
+    def _anchor_row(item):
+        p = item.scenePos()
+        return p.x() + 20, p.y() + 20
+
+    def index_component(self, item):
+        """Refresh a component's row in the anchor array after it moved."""
+        self._comp_anchors[self._comp_rows[item]] = self._anchor_row(item)
+
+    def _intersecting(self, rect):
+        """Boolean mask over components whose anchor lies in rect (edges included)."""
+        a = self._comp_anchors
+        return ((a[:, 0] >= rect.left()) & (a[:, 0] <= rect.right()) &
+                (a[:, 1] >= rect.top()) & (a[:, 1] <= rect.bottom()))
+
+    def components_in_rect(self, rect):
+        """Components whose anchor lies in a scene rect."""
+        return [self.components[i] for i in np.flatnonzero(self._intersecting(rect))]
+
     def drawBackground(self, painter, rect):
         """Draw the grid background."""
         super().drawBackground(painter, rect)
@@ -394,18 +614,17 @@ class DesignCanvas(QGraphicsView):
         if self.transform().m11() < 0.5:  # Skip grid when zoomed out
             return
 
-        painter.setPen(QPen(QColor("#1c222d"), 0.5))
-
-        left = int(rect.left()) - (int(rect.left()) % self.grid_size)
-        top = int(rect.top()) - (int(rect.top()) % self.grid_size)
+        painter.setPen(_GRID_PEN)
 
-        # Draw vertical lines
-        for x in range(left, int(rect.right()), self.grid_size):
-            painter.drawLine(x, int(rect.top()), x, int(rect.bottom()))
+        grid = self.grid_size
+        left = int(rect.left()) - (int(rect.left()) % grid)
+        top = int(rect.top()) - (int(rect.top()) % grid)
 
-        # Draw horizontal lines
-        for y in range(top, int(rect.bottom()), self.grid_size):
-            painter.drawLine(int(rect.left()), y, int(rect.right()), y)
+        # Every exposed grid line goes to the paint engine in one batch
+        l, t, r, b = rect.left(), rect.top(), rect.right(), rect.bottom()
+        lines = [QLineF(x, t, x, b) for x in range(left, int(r) + 1, grid)]
+        lines += [QLineF(l, y, r, y) for y in range(top, int(b) + 1, grid)]
+        painter.drawLines(lines)
 
     def toggle_wire_mode(self, enabled):
         """Toggle wire drawing mode."""
@@ -421,7 +640,7 @@ class DesignCanvas(QGraphicsView):
             # Check if item is component or child of component
             temp = item
             while temp:
-                if isinstance(temp, ElectricalComponent):
+                if temp.type() == ELEC_COMP_TYPE:
                     return temp
                 temp = temp.parentItem()
 
@@ -443,7 +662,7 @@ class DesignCanvas(QGraphicsView):
                 start_p = item.scenePos() + QPointF(20, 20)
 
                 self.temp_line = QGraphicsLineItem(start_p.x(), start_p.y(), start_p.x(), start_p.y())
-                self.temp_line.setPen(QPen(QColor("#00e5ff"), 2, Qt.DashLine))
+                self.temp_line.setPen(QPen(_ACCENT, 2, Qt.DashLine))
                 self.temp_line.setZValue(10)
                 self.scene.addItem(self.temp_line)
                 return
@@ -513,18 +732,46 @@ class DesignCanvas(QGraphicsView):
         # Create component
         item = ElectricalComponent(name, data, scene_center)
         self.scene.addItem(item)
+        self._comp_rows[item] = len(self.components)
+        self.components.append(item)
+        self._comp_anchors = np.vstack([self._comp_anchors, [self._anchor_row(item)]])
 
         # Emit update signal
         self.signals.circuit_updated.emit()
 
         return item
 
+    def remove_item(self, item):
+        """Remove an item from the scene, keeping the component and room lists in step."""
+        self.scene.removeItem(item)
+        if item.type() == ELEC_COMP_TYPE:
+            row = self._comp_rows.pop(item)
+            del self.components[row]
+            self._comp_anchors = np.delete(self._comp_anchors, row, axis=0)
+            # Later rows shift up by one
+            for i, comp in enumerate(self.components[row:], row):
+                self._comp_rows[comp] = i
+        elif isinstance(item, RoomItem):
+            self.rooms.remove(item)
+
+    def clear_scene(self):
+        """Remove every item from the scene (floorplan included)."""
+        self.scene.clear()
+        self.components.clear()
+        self.rooms.clear()
+        self._comp_anchors = np.zeros((0, 2))
+        self._comp_rows.clear()
+        self.floorplan_item = None
+        self.obstacle_grid = None
+
     def add_room(self, name):
         """Add a new room boundary rectangle."""
         center = self.mapToScene(self.viewport().rect().center())
         room = RoomItem(name, QRectF(0, 0, 300, 300))
         room.setPos(center)
         self.scene.addItem(room)
+        self.rooms.append(room)
+        return room
 
     def wheelEvent(self, event):
         """Handle mouse wheel for zooming."""
@@ -3,6 +3,9 @@ from PySide6.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QLineEdit, QCom
     QPushButton
 from PySide6.QtCore import Qt
 
+# Design standards offered in the settings combo box; the first is the default
+_STANDARDS = ("PEC (Philippines)", "ANSI (US)", "IEC (International)")
+
 
 class ProjectSettingsDialog(QDialog):
     def __init__(self, current_settings, parent=None):
@@ -19,9 +22,12 @@ class ProjectSettingsDialog(QDialog):
         self.proj_name = QLineEdit(current_settings.get('name', 'New Project'))
         self.author = QLineEdit(current_settings.get('author', 'Engineer'))
 
+        # Populate silently: nothing listens yet, so skip the change signals
         self.standard = QComboBox()
-        self.standard.addItems(["PEC (Philippines)", "ANSI (US)", "IEC (International)"])
-        self.standard.setCurrentText(current_settings.get('standard', 'PEC (Philippines)'))
+        self.standard.blockSignals(True)
+        self.standard.addItems(_STANDARDS)
+        self.standard.setCurrentText(current_settings.get('standard', _STANDARDS[0]))
+        self.standard.blockSignals(False)
 
         form.addRow("Project Name:", self.proj_name)
         form.addRow("Lead Author:", self.author)
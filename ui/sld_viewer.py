@@ -4,18 +4,146 @@ sld_viewer.py – Professional SLD Viewer Dialog
 Displays generated single-line diagrams with export and zoom controls.
 """
 
+import os
+from collections import OrderedDict
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QGraphicsView, QGraphicsScene, QFileDialog, QMessageBox,
+    QGraphicsView, QGraphicsScene, QGraphicsItem, QFileDialog, QMessageBox,
     QFrame, QSlider, QComboBox
 )
 from PySide6.QtGui import (
-    QPainter, QPixmap, QPen, QColor, QFont, QImage
+    QPainter, QPixmap, QPen, QColor, QFont, QImage, QPageLayout, QPageSize
 )
-from PySide6.QtCore import Qt, QRectF
+from PySide6.QtCore import Qt, QRectF, QSize, QTimer
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
 from PySide6.QtPrintSupport import QPrinter
+from PySide6.QtSvg import QSvgGenerator
 
 from modules.sld_generator import SLDGenerator
+from ui.canvas import opengl_available
+
+# Diagrams kept in SLDViewer._pixmap_cache
+_PIXMAP_CACHE_SIZE = 4
+
+# Diagrams with more circuits than this get half/quarter-size mip levels
+_MIP_MIN_CIRCUITS = 50
+_MIP_LEVELS = 3
+
+# Dialog theme, shared by every viewer instance
+_SLD_VIEWER_QSS = """
+QDialog {
+    background-color: #0E1013;
+}
+
+#toolbar {
+    background-color: #1A1F26;
+    border-bottom: 1px solid #2D3646;
+}
+
+#statusbar {
+    background-color: #12151B;
+    border-top: 1px solid #2D3646;
+}
+
+QLabel {
+    color: #ECEFF4;
+    font-size: 10px;
+}
+
+QPushButton {
+    background-color: #1C222D;
+    color: #00D9FF;
+    border: 1px solid #2D3646;
+    border-radius: 4px;
+    padding: 6px 14px;
+    font-size: 10px;
+    font-weight: bold;
+}
+
+QPushButton:hover {
+    background-color: #252E3E;
+    border-color: #00D9FF;
+}
+
+QPushButton:pressed {
+    background-color: #1A2030;
+}
+
+QGraphicsView {
+    background-color: #161A1F;
+    border: 1px solid #2D3646;
+    border-radius: 4px;
+    margin: 8px;
+}
+"""
+
+
+def _linearize_pdf(path: str) -> None:
+    """
+    Rewrite a PDF in place as linearized ("fast web view") so viewers can
+    show the first page before the whole file arrives. Needs pikepdf;
+    without it, or if the rewrite fails, the file is left as QPrinter
+    wrote it.
+    """
+    try:
+        import pikepdf
+    except ImportError:
+        return
+
+    tmp = path + ".tmp"
+    try:
+        with pikepdf.open(path) as pdf:
+            pdf.save(tmp, linearize=True)
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"PDF left unlinearized: {e}")
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+# ==========================================================================
+# DIAGRAM ITEM
+# ==========================================================================
+class SLDDiagramItem(QGraphicsItem):
+    """
+    Rendered diagram that repaints only the part of it the view exposes.
+    With use_mips, zoomed-out views blit from a pre-shrunk copy (built on
+    first use) instead of downsampling the full-size pixmap every frame.
+    """
+
+    def __init__(self, pixmap: QPixmap, use_mips: bool = False) -> None:
+        super().__init__()
+        self._mips = [pixmap] + [None] * ((_MIP_LEVELS - 1) if use_mips else 0)
+        self._rect = QRectF(pixmap.rect())
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+
+    def boundingRect(self) -> QRectF:
+        return self._rect
+
+    def _mip(self, scale: float) -> tuple:
+        """(pixmap, factor) for the smallest level that still has a texel per device pixel."""
+        level = 0
+        while level + 1 < len(self._mips) and 0.5 ** (level + 1) >= scale:
+            level += 1
+        factor = 0.5 ** level
+        if self._mips[level] is None:
+            base = self._mips[0]
+            self._mips[level] = base.scaled(
+                max(1, int(base.width() * factor)), max(1, int(base.height() * factor)),
+                Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+        return self._mips[level], factor
+
+    def paint(self, painter: QPainter, option, widget=None) -> None:
+        exposed = option.exposedRect.intersected(self._rect)
+        if exposed.isEmpty():
+            return
+        pixmap, factor = self._mip(abs(painter.worldTransform().m11()))
+        source = QRectF(exposed.x() * factor, exposed.y() * factor,
+                        exposed.width() * factor, exposed.height() * factor)
+        painter.drawPixmap(exposed, pixmap, source)
 
 
 # ==========================================================================
@@ -24,6 +152,9 @@ from modules.sld_generator import SLDGenerator
 class SLDViewer(QDialog):
     """Professional dialog for viewing and exporting single-line diagrams."""
 
+    # Rendered diagrams shared across viewer instances, least recently used first
+    _pixmap_cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+
     def __init__(self, sld_data: list, project_data: dict = None, parent=None) -> None:
         super().__init__(parent)
 
@@ -33,6 +164,9 @@ class SLDViewer(QDialog):
             "system_voltage": 230,
             "standard": "PEC 2017"
         }
+        # Diagram bounds in scene coordinates; fixed for this dialog's data,
+        # so fit and export read it instead of querying the scene
+        self._diagram_rect = QRectF(0, 0, *self._diagram_size())
 
         # ── Window setup ──────────────────────────────────────────────
         self.setWindowTitle("Single Line Diagram Viewer – ELECDRAFT PRO")
@@ -42,8 +176,11 @@ class SLDViewer(QDialog):
         # ── Build UI ──────────────────────────────────────────────────
         self._setup_ui()
 
-        # ── Generate diagram ──────────────────────────────────────────
-        self._render_diagram()
+        # ── Generate diagram once the dialog is on screen ─────────────
+        placeholder = self.scene.addText("Generating diagram…", QFont("Segoe UI", 12))
+        placeholder.setDefaultTextColor(QColor("#8B949E"))
+        self.view.centerOn(placeholder)
+        QTimer.singleShot(0, self._render_diagram)
 
         # ── Apply styles ──────────────────────────────────────────────
         self._apply_styles()
@@ -63,12 +200,28 @@ class SLDViewer(QDialog):
 
         # ── Graphics view ─────────────────────────────────────────────
         self.scene = QGraphicsScene()
+        # At most two items (placeholder, then the diagram): a BSP index
+        # would only add bookkeeping to every add and lookup
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.view = QGraphicsView(self.scene)
-        self.view.setRenderHint(QPainter.Antialiasing)
+        # The scene is one pre-rendered, already antialiased pixmap, so the
+        # view only needs filtered scaling (exports antialias in render())
         self.view.setRenderHint(QPainter.SmoothPixmapTransform)
         self.view.setDragMode(QGraphicsView.ScrollHandDrag)
+        # GPU-backed viewport for pan/zoom; GL redraws whole frames anyway,
+        # so skip the partial-update bookkeeping (raster fallback otherwise)
+        if opengl_available():
+            self.view.setViewport(QOpenGLWidget())
+            self.view.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
         main_layout.addWidget(self.view, stretch=1)
 
+        # Smooth pixmap filtering is switched off while zooming and restored
+        # once the zoom buttons have been idle for a moment
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(150)
+        self._smooth_timer.timeout.connect(self._restore_smooth)
+
         # ── Status bar ────────────────────────────────────────────────
         status = self._build_status_bar()
         main_layout.addWidget(status)
@@ -94,15 +247,15 @@ class SLDViewer(QDialog):
         layout.addWidget(QLabel("Zoom:"))
 
         btn_zoom_in = QPushButton("🔍 +")
-        btn_zoom_in.clicked.connect(lambda: self.view.scale(1.2, 1.2))
+        btn_zoom_in.clicked.connect(lambda: self._zoom(1.2))
         layout.addWidget(btn_zoom_in)
 
         btn_zoom_out = QPushButton("🔍 −")
-        btn_zoom_out.clicked.connect(lambda: self.view.scale(0.8, 0.8))
+        btn_zoom_out.clicked.connect(lambda: self._zoom(0.8))
         layout.addWidget(btn_zoom_out)
 
         btn_fit = QPushButton("⛶ Fit")
-        btn_fit.clicked.connect(lambda: self.view.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio))
+        btn_fit.clicked.connect(lambda: self._zoom())
         layout.addWidget(btn_fit)
 
         layout.addSpacing(12)
@@ -116,6 +269,10 @@ class SLDViewer(QDialog):
         btn_export_png.clicked.connect(self._export_png)
         layout.addWidget(btn_export_png)
 
+        btn_export_svg = QPushButton("📐 Export SVG")
+        btn_export_svg.clicked.connect(self._export_svg)
+        layout.addWidget(btn_export_svg)
+
         layout.addSpacing(12)
 
         # Close button
@@ -145,32 +302,60 @@ class SLDViewer(QDialog):
 
         return frame
 
+    def _zoom(self, factor: float = None) -> None:
+        """Scale the view by factor (fit to the diagram when None) with fast filtering."""
+        self.view.setRenderHint(QPainter.SmoothPixmapTransform, False)
+        if factor is None:
+            self.view.fitInView(self._diagram_rect, Qt.KeepAspectRatio)
+        else:
+            self.view.scale(factor, factor)
+        self._smooth_timer.start()
+
+    def _restore_smooth(self) -> None:
+        self.view.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        self.view.viewport().update()
+
     # ══════════════════════════════════════════════════════════════════
     # DIAGRAM RENDERING
     # ══════════════════════════════════════════════════════════════════
+    def _diagram_size(self) -> tuple:
+        """Logical canvas size (width, height) for the current circuits."""
+        height = 200 + len(self.sld_data) * 70 + 200  # header + circuits + footer
+        return 800, height
+
     def _render_diagram(self) -> None:
         """Generate the SLD and add to scene."""
-        # Calculate canvas size
-        circuit_count = len(self.sld_data)
-        width = 800
-        height = 200 + circuit_count * 70 + 200  # header + circuits + footer
+        width, height = self._diagram_rect.size().toSize().toTuple()
 
-        # Create pixmap
-        pixmap = QPixmap(width, height)
-        pixmap.fill(Qt.white)
+        # Reuse the pixmap from an earlier viewer with identical inputs
+        key = (
+            tuple((it.get("name"), it.get("va"), it.get("breaker"), it.get("wire"), it.get("kind"))
+                  for it in self.sld_data),
+            tuple(sorted((k, repr(v)) for k, v in self.project_data.items())),
+        )
+        pixmap = SLDViewer._pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(width, height)
+            pixmap.fill(Qt.white)
+
+            # Draw diagram
+            painter = QPainter(pixmap)
+            SLDGenerator.draw_diagram(painter, self.sld_data, self.project_data)
+            painter.end()
 
-        # Draw diagram
-        painter = QPainter(pixmap)
-        SLDGenerator.draw_diagram(painter, self.sld_data, self.project_data)
-        painter.end()
+            SLDViewer._pixmap_cache[key] = pixmap
+            if len(SLDViewer._pixmap_cache) > _PIXMAP_CACHE_SIZE:
+                SLDViewer._pixmap_cache.popitem(last=False)
+        else:
+            SLDViewer._pixmap_cache.move_to_end(key)
 
         # Add to scene
         self.scene.clear()
-        self.scene.addPixmap(pixmap)
-        self.scene.setSceneRect(0, 0, width, height)
+        self.scene.addItem(SLDDiagramItem(pixmap, use_mips=len(self.sld_data) > _MIP_MIN_CIRCUITS))
+        self.scene.setSceneRect(self._diagram_rect)
 
         # Fit to view
-        self.view.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
+        self.view.fitInView(self._diagram_rect, Qt.KeepAspectRatio)
 
     # ══════════════════════════════════════════════════════════════════
     # EXPORT FUNCTIONS
@@ -188,14 +373,23 @@ class SLDViewer(QDialog):
             printer = QPrinter(QPrinter.HighResolution)
             printer.setOutputFormat(QPrinter.PdfFormat)
             printer.setOutputFileName(path)
-            printer.setPageOrientation(QPrinter.Portrait)
-            printer.setPageSize(QPrinter.Letter)
-
-            # Render scene to printer
+            printer.setPageOrientation(QPageLayout.Portrait)
+            printer.setPageSize(QPageSize(QPageSize.Letter))
+
+            # Paint the diagram straight onto the page, scaled to fit and
+            # centred, without walking the scene
+            width, height = self._diagram_rect.size().toSize().toTuple()
+            page = printer.pageLayout().paintRectPixels(printer.resolution())
+            scale = min(page.width() / width, page.height() / height)
             painter = QPainter(printer)
-            self.scene.render(painter)
+            painter.translate((page.width() - width * scale) / 2,
+                              (page.height() - height * scale) / 2)
+            painter.scale(scale, scale)
+            SLDGenerator.draw_diagram(painter, self.sld_data, self.project_data)
             painter.end()
 
+            _linearize_pdf(path)
+
             self.lbl_status.setText(f"✓ Exported to: {path}")
             QMessageBox.information(self, "Export Success", f"SLD exported to:\n{path}")
 
@@ -211,14 +405,13 @@ class SLDViewer(QDialog):
             return
 
         try:
-            # Render scene to image
-            rect = self.scene.sceneRect()
-            image = QImage(int(rect.width()), int(rect.height()), QImage.Format_ARGB32)
+            # Paint the diagram straight into the image
+            width, height = self._diagram_rect.size().toSize().toTuple()
+            image = QImage(width, height, QImage.Format_RGB32)
             image.fill(Qt.white)
 
             painter = QPainter(image)
-            painter.setRenderHint(QPainter.Antialiasing)
-            self.scene.render(painter)
+            SLDGenerator.draw_diagram(painter, self.sld_data, self.project_data)
             painter.end()
 
             image.save(path, "PNG")
@@ -229,54 +422,36 @@ class SLDViewer(QDialog):
         except Exception as e:
             QMessageBox.critical(self, "Export Error", f"Failed to export PNG:\n{e}")
 
+    def _export_svg(self) -> None:
+        """Export diagram to SVG (vector, no rasterisation)."""
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export SLD to SVG", "", "SVG Files (*.svg)"
+        )
+        if not path:
+            return
+
+        try:
+            width, height = self._diagram_rect.size().toSize().toTuple()
+            generator = QSvgGenerator()
+            generator.setFileName(path)
+            generator.setSize(QSize(width, height))
+            generator.setViewBox(QRectF(0, 0, width, height))
+            generator.setResolution(self.logicalDpiX())  # keep font sizes as on screen
+            generator.setTitle("Single Line Diagram")
+
+            painter = QPainter(generator)
+            SLDGenerator.draw_diagram(painter, self.sld_data, self.project_data)
+            painter.end()
+
+            self.lbl_status.setText(f"✓ Exported to: {path}")
+            QMessageBox.information(self, "Export Success", f"SLD exported to:\n{path}")
+
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error", f"Failed to export SVG:\n{e}")
+
     # ══════════════════════════════════════════════════════════════════
     # STYLING
     # ══════════════════════════════════════════════════════════════════
     def _apply_styles(self) -> None:
         """Apply professional dark theme."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #0E1013;
-            }
-
-            #toolbar {
-                background-color: #1A1F26;
-                border-bottom: 1px solid #2D3646;
-            }
-
-            #statusbar {
-                background-color: #12151B;
-                border-top: 1px solid #2D3646;
-            }
-
-            QLabel {
-                color: #ECEFF4;
-                font-size: 10px;
-            }
-
-            QPushButton {
-                background-color: #1C222D;
-                color: #00D9FF;
-                border: 1px solid #2D3646;
-                border-radius: 4px;
-                padding: 6px 14px;
-                font-size: 10px;
-                font-weight: bold;
-            }
-
-            QPushButton:hover {
-                background-color: #252E3E;
-                border-color: #00D9FF;
-            }
-
-            QPushButton:pressed {
-                background-color: #1A2030;
-            }
-
-            QGraphicsView {
-                background-color: #161A1F;
-                border: 1px solid #2D3646;
-                border-radius: 4px;
-                margin: 8px;
-            }
-        """)
\ No newline at end of file
+        self.setStyleSheet(_SLD_VIEWER_QSS)
\ No newline at end of file
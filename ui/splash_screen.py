@@ -11,12 +11,37 @@ Design Philosophy:
 """
 
 from PySide6.QtWidgets import QSplashScreen
-from PySide6.QtCore import Qt, QTimer, QRect, QRectF, QPointF
+from PySide6.QtCore import Qt, QTimer, QRect, QRectF, QPointF, QStandardPaths
 from PySide6.QtGui import (
-    QPixmap, QPainter, QColor, QFont, QPen, QLinearGradient,
-    QRadialGradient, QBrush, QPainterPath
+    QPixmap, QImage, QPainter, QColor, QFont, QPen, QLinearGradient,
+    QRadialGradient, QBrush, QPainterPath, QPixmapCache, QStaticText
 )
 import math
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+
+# The static splash background, saved under the user cache directory so later
+# launches load it instead of repainting; stale once this module is newer
+_BASE_CACHE_FILE = os.path.join("ELECDRAFT", "splash_base.png")
+
+# Rendered text layers kept by EnhancedSplash (one per fade step while fading
+# in, then one per status message), least recently used evicted first
+_OVERLAY_CACHE_SIZE = 8
+
+
+# Regions repainted by showMessage / set_progress: the status line (message
+# and ellipsis), and the progress bar with its glow outline and percentage.
+# The animation tick still repaints everything since particles roam freely.
+_MESSAGE_RECT = QRect(0, 358, 720, 20)
+_PROGRESS_RECT = QRect(178, 314, 440, 24)
+
+# One period of sin() sampled for the logo/progress glow pulse; indexed with
+# int(pulse_value * _SIN_LUT_SCALE) & 255 instead of calling math.sin per frame
+_SIN_LUT = tuple(np.sin(np.linspace(0.0, 2 * math.pi, 256, endpoint=False)).tolist())
+_SIN_LUT_SCALE = 256 / (2 * math.pi)
 
 
 # ==========================================================================
@@ -49,50 +74,99 @@ class Colors:
 
 
 # ==========================================================================
-# ELEGANT PARTICLE
+# ELEGANT PARTICLES
 # ==========================================================================
-class ElegantParticle:
-    """Minimal floating particle for subtle background motion."""
-
-    def __init__(self, width: int, height: int) -> None:
-        import random
-        self.x = random.uniform(0, width)
-        self.y = random.uniform(0, height)
-        self.vx = random.uniform(-0.15, 0.15)
-        self.vy = random.uniform(-0.25, 0.1)
-        self.size = random.uniform(1.0, 2.5)
-        self.base_opacity = random.uniform(20, 60)
-        self.phase = random.uniform(0, 2 * math.pi)
-        self.bounds = (width, height)
-
-    def update(self) -> None:
-        self.x += self.vx
-        self.y += self.vy
-        self.phase += 0.03
-
-        if self.x < 0:
-            self.x = self.bounds[0]
-        elif self.x > self.bounds[0]:
-            self.x = 0
-        if self.y < 0:
-            self.y = self.bounds[1]
-        elif self.y > self.bounds[1]:
-            self.y = 0
-
-    def draw(self, painter: QPainter) -> None:
-        opacity = self.base_opacity + 20 * math.sin(self.phase)
+class ElegantParticles:
+    """Minimal floating particles for subtle background motion, one array per attribute."""
+
+    # Side of the pre-rendered particle sprite, in pixels
+    SPRITE_SIZE = 32
+
+    # Sprites are pre-faded to this many opacity steps between 0 and
+    # MAX_OPACITY (base 20..60 plus the +/-20 pulse), so draw() changes no
+    # painter state per particle
+    OPACITY_LEVELS = 32
+    MAX_OPACITY = 80
+
+    def __init__(self, count: int, width: int, height: int) -> None:
+        rng = np.random.default_rng()
+        # Rows are x and y, so one array op moves or wraps every particle
+        self.bounds = np.array([[width], [height]], dtype=float)
+        self.pos = rng.uniform(0, self.bounds, (2, count))
+        self.vel = np.array([rng.uniform(-0.15, 0.15, count), rng.uniform(-0.25, 0.1, count)])
+        self.size = rng.uniform(1.0, 2.5, count)
+        self.base_opacity = rng.uniform(20, 60, count)
+        self.phase = rng.uniform(0, 2 * math.pi, count)
+        # Glow diameter (6 * size) snapped to whole pixels, so every particle
+        # is an unscaled blit of a sprite pre-rendered at its own size
+        self.diameter = np.rint(self.size * 6).astype(int)
+        self._sprite = self._build_sprite()
+        self._sprites: "dict[tuple, QPixmap]" = {}
+
+    def _faded_sprite(self, diameter: int, level: int) -> QPixmap:
+        """The particle sprite at one diameter and opacity step, built on first use."""
+        key = (diameter, level)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = QPixmap(diameter, diameter)
+            sprite.fill(Qt.transparent)
+            painter = QPainter(sprite)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.setOpacity(level / (self.OPACITY_LEVELS - 1) * self.MAX_OPACITY / 255)
+            painter.drawPixmap(QRectF(0, 0, diameter, diameter), self._sprite,
+                               QRectF(self._sprite.rect()))
+            painter.end()
+            self._sprites[key] = sprite
+        return sprite
+
+    def _build_sprite(self) -> QPixmap:
+        """Glow plus core dot at full opacity and SPRITE_SIZE; scaled down per particle."""
+        side = self.SPRITE_SIZE
+        radius = side / 2
+        center = QPointF(radius, radius)
+
+        sprite = QPixmap(side, side)
+        sprite.fill(Qt.transparent)
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
 
-        glow = QRadialGradient(QPointF(self.x, self.y), self.size * 3)
-        glow.setColorAt(0.0, QColor(0, 217, 255, int(opacity * 0.4)))
-        glow.setColorAt(0.7, QColor(0, 217, 255, int(opacity * 0.1)))
+        glow = QRadialGradient(center, radius)
+        glow.setColorAt(0.0, QColor(0, 217, 255, int(255 * 0.4)))
+        glow.setColorAt(0.7, QColor(0, 217, 255, int(255 * 0.1)))
         glow.setColorAt(1.0, Qt.transparent)
-
         painter.setBrush(glow)
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(QPointF(self.x, self.y), self.size * 3, self.size * 3)
+        painter.drawEllipse(center, radius, radius)
+
+        # Core dot is 0.8 / 3 of the glow radius, as in the original drawing
+        core = radius * 0.8 / 3
+        painter.setBrush(QColor(0, 217, 255))
+        painter.drawEllipse(center, core, core)
+        painter.end()
+        return sprite
+
+    def update(self, step: float = 1.0) -> None:
+        """Advance by ``step`` nominal 16 ms frames."""
+        self.pos += self.vel * step
+        np.mod(self.pos, self.bounds, out=self.pos)  # wrap around the edges
+        self.phase += 0.03 * step
 
-        painter.setBrush(QColor(0, 217, 255, int(opacity)))
-        painter.drawEllipse(QPointF(self.x, self.y), self.size * 0.8, self.size * 0.8)
+    def draw(self, painter: QPainter) -> None:
+        opacity = self.base_opacity + 20 * np.sin(self.phase)
+        levels = np.rint(np.clip(opacity / self.MAX_OPACITY, 0, 1) * (self.OPACITY_LEVELS - 1)).astype(int)
+        # Top-left corners on whole pixels: plain blits, no resampling
+        corners = np.rint(self.pos - self.diameter / 2).astype(int)
+
+        # Particles stay inside the splash, so the pass needs no clip test
+        clipping = painter.hasClipping()
+        painter.setClipping(False)
+        sprites = self._sprites
+        for x, y, d, level in zip(*corners.tolist(), self.diameter.tolist(), levels.tolist()):
+            sprite = sprites.get((d, level))
+            if sprite is None:
+                sprite = self._faded_sprite(d, level)
+            painter.drawPixmap(x, y, sprite)
+        painter.setClipping(clipping)
 
 
 # ==========================================================================
@@ -105,11 +179,37 @@ class EnhancedSplash(QSplashScreen):
         self.width = 720
         self.height = 480
 
-        self.base_pixmap = QPixmap(self.width, self.height)
-        self.base_pixmap.fill(Qt.transparent)
-
         self.logo_path = logo_path
-        self._particles = [ElegantParticle(self.width, self.height) for _ in range(35)]
+        self._particles = ElegantParticles(35, self.width, self.height)
+
+        # Fonts, the scaled logo and the fading text layer are built once;
+        # drawContents only re-rasterises text when opacity or message change
+        # (footer and accent line never change and are part of the base)
+        self._font_title = QFont("Segoe UI", 28, QFont.DemiBold)
+        self._font_sub = QFont("Segoe UI", 10, QFont.Normal)
+        self._font_msg = QFont("Segoe UI", 9, QFont.Normal)
+        self._font_pct = QFont("Segoe UI", 11, QFont.Normal)
+        self._font_footer = QFont("Segoe UI", 8, QFont.Normal)
+        self._logo = None
+        self._overlay_cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+
+        # Per-frame paint objects: geometry is fixed, so only colour alphas
+        # and the progress fill's end point are updated in drawContents.
+        # The logo glow is blitted from one sprite per pulse alpha (21 values)
+        self._glow_color = QColor(0, 217, 255)
+        self._glow_sprites: "dict[int, QPixmap]" = {}
+        self._bar_rect = QRectF(180, 330, 360, 3)
+        self._bar_outline = self._bar_rect.adjusted(-0.5, -0.5, 0, 0.5)
+        self._bar_fill_rect = QRectF(self._bar_rect)
+        self._bar_fill_grad = QLinearGradient(180, 330, 181, 330)
+        self._bar_fill_grad.setColorAt(0.0, Colors.ACCENT_GLOW)
+        self._bar_fill_grad.setColorAt(1.0, Colors.ACCENT_PRIMARY)
+        self._bar_glow_pen = QPen(self._glow_color, 1)
+        self._msg_width = (None, 0)
+        # Per-frame strings keep their glyph layout: the four ellipsis states
+        # and each percentage value as it is first shown
+        self._st_ellipsis = tuple(QStaticText("." * n) for n in range(4))
+        self._st_pct: "dict[int, QStaticText]" = {}
 
         self.current_progress = 0
         self.smooth_progress = 0.0
@@ -117,21 +217,56 @@ class EnhancedSplash(QSplashScreen):
         self.pulse_value = 0.0
         self.logo_opacity = 0.0
         self.content_opacity = 0.0
+        self._fade_opacity = 0.0
 
-        self._generate_base()
+        self.base_pixmap = self._load_base()
 
         super().__init__(self.base_pixmap)
         self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint | Qt.SplashScreen)
 
+        # One timer drives every animation, including the window fade-in;
+        # it only runs while the splash is shown (see showEvent/hideEvent)
         self.anim_timer = QTimer(self)
+        self.anim_timer.setInterval(16)
         self.anim_timer.timeout.connect(self._update)
-        self.anim_timer.start(16)
+        # Nominal 16 ms frames per tick, and the matching progress easing;
+        # showEvent retunes both to the screen's refresh rate
+        self._step = 1.0
+        self._progress_ease = 0.12
 
         self.setWindowOpacity(0.0)
-        QTimer.singleShot(50, self._fade_in)
+
+    def _load_base(self) -> QPixmap:
+        """Static background, from the disk cache when it is still current."""
+        cache_path = os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation),
+            _BASE_CACHE_FILE
+        )
+        try:
+            fresh = os.path.getmtime(cache_path) >= os.path.getmtime(__file__)
+        except OSError:
+            fresh = False
+        if fresh:
+            pixmap = QPixmap(cache_path)
+            if pixmap.width() == self.width and pixmap.height() == self.height:
+                return pixmap
+
+        # Painted into a premultiplied image (the raster engine's native
+        # format), then converted to the splash pixmap once
+        self._base_image = QImage(self.width, self.height, QImage.Format_ARGB32_Premultiplied)
+        self._base_image.fill(Qt.transparent)
+        self._generate_base()
+        pixmap = QPixmap.fromImage(self._base_image)
+
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        except OSError:
+            return pixmap
+        pixmap.save(cache_path, "PNG")
+        return pixmap
 
     def _generate_base(self) -> None:
-        painter = QPainter(self.base_pixmap)
+        painter = QPainter(self._base_image)
         painter.setRenderHints(
             QPainter.Antialiasing |
             QPainter.TextAntialiasing |
@@ -167,7 +302,10 @@ class EnhancedSplash(QSplashScreen):
         card_grad.setColorAt(0.0, QColor(255, 255, 255, 4))
         card_grad.setColorAt(0.5, QColor(255, 255, 255, 2))
         card_grad.setColorAt(1.0, QColor(255, 255, 255, 4))
+        # A 2-4 alpha wash: antialiased corners would be invisible
+        painter.setRenderHint(QPainter.Antialiasing, False)
         painter.fillPath(card_path, card_grad)
+        painter.setRenderHint(QPainter.Antialiasing, True)
 
         painter.setPen(QPen(Colors.BORDER_SUBTLE, 1))
         painter.setBrush(Qt.NoBrush)
@@ -179,44 +317,86 @@ class EnhancedSplash(QSplashScreen):
             corner_radius, corner_radius
         )
 
+        # Footer
+        footer_y = self.height - 32
+
+        painter.setPen(Colors.TEXT_DISABLED)
+        painter.setFont(self._font_footer)
+
+        painter.drawText(
+            QRect(80, footer_y, 300, 20),
+            Qt.AlignLeft | Qt.AlignVCenter,
+            "PEC 2017 Compliant"
+        )
+
+        painter.setPen(Colors.TEXT_TERTIARY)
+        painter.drawText(
+            QRect(0, footer_y, self.width, 20),
+            Qt.AlignCenter,
+            "Version 2.5.0"
+        )
+
+        painter.setPen(Colors.TEXT_DISABLED)
+        painter.drawText(
+            QRect(self.width - 380, footer_y, 300, 20),
+            Qt.AlignRight | Qt.AlignVCenter,
+            "© 2025 ELECDRAFT"
+        )
+
+        # Accent line
+        accent_grad = QLinearGradient(0, 0, self.width, 0)
+        accent_grad.setColorAt(0.0, Qt.transparent)
+        accent_grad.setColorAt(0.3, QColor(0, 217, 255, 80))
+        accent_grad.setColorAt(0.7, QColor(0, 217, 255, 80))
+        accent_grad.setColorAt(1.0, Qt.transparent)
+
+        # Pixel-aligned strip: no antialiasing needed
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.fillRect(QRectF(0, 0, self.width, 1), accent_grad)
+
         painter.end()
 
     def _update(self) -> None:
-        self.pulse_value += 0.04
+        # Kept within one period so the value never loses float precision
+        step = self._step
+        self.pulse_value = (self.pulse_value + 0.04 * step) % (2 * math.pi)
 
         diff = (self.current_progress / 100.0) - self.smooth_progress
-        self.smooth_progress += diff * 0.12
+        self.smooth_progress += diff * self._progress_ease
 
         if self.logo_opacity < 1.0:
-            self.logo_opacity += 0.015
+            self.logo_opacity += 0.015 * step
         if self.content_opacity < 1.0:
-            self.content_opacity += 0.02
+            self.content_opacity += 0.02 * step
+        if self._fade_opacity < 1.0:
+            self._fade_opacity += 0.03 * step
+            self.setWindowOpacity(min(1.0, self._fade_opacity))
 
-        for p in self._particles:
-            p.update()
+        self._particles.update(step)
 
         self.update()
 
-    def _fade_in(self) -> None:
-        self._fade_timer = QTimer(self)
-        self._fade_opacity = 0.0
-
-        def step():
-            self._fade_opacity += 0.03
-            self.setWindowOpacity(min(1.0, self._fade_opacity))
-            if self._fade_opacity >= 1.0:
-                self._fade_timer.stop()
-
-        self._fade_timer.timeout.connect(step)
-        self._fade_timer.start(16)
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        # One tick per display frame (8 ms floor); the per-tick steps scale
+        # with the interval so animation speed is the same at any refresh rate
+        hz = self.screen().refreshRate() or 60
+        interval = max(8, round(1000 / hz))
+        self._step = interval / 16
+        self._progress_ease = 1 - (1 - 0.12) ** self._step
+        self.anim_timer.start(interval)
+
+    def hideEvent(self, event) -> None:
+        self.anim_timer.stop()
+        super().hideEvent(event)
 
     def showMessage(self, message: str, *args, **kwargs) -> None:
         self.current_message = message
-        self.update()
+        self.update(_MESSAGE_RECT)
 
     def set_progress(self, value: int) -> None:
         self.current_progress = max(0, min(100, value))
-        self.update()
+        self.update(_PROGRESS_RECT)
 
     def finish_loading(self, main_window) -> None:
         self.anim_timer.stop()
@@ -224,167 +404,204 @@ class EnhancedSplash(QSplashScreen):
         QTimer.singleShot(400, lambda: self.finish(main_window))
 
     def drawContents(self, painter: QPainter) -> None:
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-
-        # Particles
-        painter.setOpacity(0.6)
-        for particle in self._particles:
-            particle.draw(painter)
-        painter.setOpacity(1.0)
+        # Everything up to the progress bar is a blit at whole-pixel
+        # coordinates, unscaled unless 1x sprites land on a high-DPI device
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform,
+                              painter.device().devicePixelRatioF() != 1.0)
+
+        pulse = _SIN_LUT[int(self.pulse_value * _SIN_LUT_SCALE) & 255]
+
+        # Particles (not worth drawing while the window is all but transparent)
+        if self.windowOpacity() >= 0.02:
+            painter.setOpacity(0.6)
+            self._particles.draw(painter)
+            painter.setOpacity(1.0)
 
         # Logo
-        logo = QPixmap(self.logo_path)
-        if not logo.isNull():
+        logo_scaled = self._scaled_logo()
+        if not logo_scaled.isNull():
             logo_size = 120
-            logo_scaled = logo.scaled(logo_size, logo_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             logo_x = (self.width - logo_size) // 2
             logo_y = 80
 
-            glow_size = logo_size * 0.5
-            pulse_alpha = 15 + int(10 * math.sin(self.pulse_value))
-            glow = QRadialGradient(
-                QPointF(logo_x + logo_size / 2, logo_y + logo_size / 2),
-                glow_size
-            )
-            glow.setColorAt(0.0, QColor(0, 217, 255, pulse_alpha))
-            glow.setColorAt(0.7, QColor(0, 217, 255, pulse_alpha // 3))
-            glow.setColorAt(1.0, Qt.transparent)
-
-            painter.setBrush(glow)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(
-                QPointF(logo_x + logo_size / 2, logo_y + logo_size / 2),
-                glow_size, glow_size
-            )
+            pulse_alpha = 15 + int(10 * pulse)
+            painter.drawPixmap(logo_x, logo_y, self._glow_sprite(pulse_alpha, logo_size))
 
             painter.setOpacity(self.logo_opacity)
             painter.drawPixmap(logo_x, logo_y, logo_scaled)
             painter.setOpacity(1.0)
 
-        # Typography
-        painter.setOpacity(self.content_opacity)
-
-        painter.setPen(Colors.TEXT_PRIMARY)
-        painter.setFont(QFont("Segoe UI", 28, QFont.DemiBold))
-
-        title_y = 230
-        painter.drawText(
-            QRect(0, title_y, self.width, 40),
-            Qt.AlignCenter,
-            "ELECDRAFT PRO"
-        )
-
-        painter.setPen(Colors.TEXT_SECONDARY)
-        painter.setFont(QFont("Segoe UI", 10, QFont.Normal))
-        painter.drawText(
-            QRect(0, title_y + 42, self.width, 24),
-            Qt.AlignCenter,
-            "Professional Electrical CAD System"
-        )
-
-        # Separator
-        sep_y = title_y + 72
-        sep_w = 200
-        sep_x = (self.width - sep_w) // 2
-
-        sep_grad = QLinearGradient(sep_x, sep_y, sep_x + sep_w, sep_y)
-        sep_grad.setColorAt(0.0, Qt.transparent)
-        sep_grad.setColorAt(0.5, Colors.BORDER_MEDIUM)
-        sep_grad.setColorAt(1.0, Qt.transparent)
-
-        painter.setPen(Qt.NoPen)
-        painter.fillRect(QRectF(sep_x, sep_y, sep_w, 1), sep_grad)
-
-        painter.setOpacity(1.0)
+        # Typography, status message, footer and accent line
+        painter.drawPixmap(0, 0, self._text_layer())
 
-        # Progress bar
+        # Progress bar (rounded half-pixel shapes need antialiasing)
+        painter.setRenderHint(QPainter.Antialiasing)
         bar_x = 180
         bar_y = 330
         bar_w = 360
-        bar_h = 3
-
-        bar_rect = QRectF(bar_x, bar_y, bar_w, bar_h)
 
         painter.setPen(Qt.NoPen)
         painter.setBrush(Colors.BORDER_SUBTLE)
-        painter.drawRoundedRect(bar_rect, 1.5, 1.5)
+        painter.drawRoundedRect(self._bar_rect, 1.5, 1.5)
 
         fill_w = bar_w * self.smooth_progress
         if fill_w > 1:
-            fill_rect = QRectF(bar_x, bar_y, fill_w, bar_h)
+            fill_rect = self._bar_fill_rect
+            fill_rect.setWidth(fill_w)
 
-            fill_grad = QLinearGradient(bar_x, bar_y, bar_x + fill_w, bar_y)
-            fill_grad.setColorAt(0.0, Colors.ACCENT_GLOW)
-            fill_grad.setColorAt(1.0, Colors.ACCENT_PRIMARY)
+            fill_grad = self._bar_fill_grad
+            fill_grad.setFinalStop(bar_x + fill_w, bar_y)
 
             painter.setBrush(fill_grad)
             painter.drawRoundedRect(fill_rect, 1.5, 1.5)
 
-            glow_alpha = 20 + int(10 * math.sin(self.pulse_value))
-            painter.setPen(QPen(QColor(0, 217, 255, glow_alpha), 1))
+            glow_alpha = 20 + int(10 * pulse)
+            self._glow_color.setAlpha(glow_alpha)
+            self._bar_glow_pen.setColor(self._glow_color)
+            painter.setPen(self._bar_glow_pen)
             painter.setBrush(Qt.NoBrush)
-            painter.drawRoundedRect(bar_rect.adjusted(-0.5, -0.5, 0, 0.5), 1.5, 1.5)
+            painter.drawRoundedRect(self._bar_outline, 1.5, 1.5)
 
-        # Status message
+        # Animated ellipsis after the status message
         msg_y = bar_y + 28
 
         painter.setPen(Colors.TEXT_SECONDARY)
-        painter.setFont(QFont("Segoe UI", 9, QFont.Normal))
-
-        msg_rect = QRect(0, msg_y, self.width, 20)
-        painter.drawText(msg_rect, Qt.AlignCenter, self.current_message)
+        painter.setFont(self._font_msg)
 
         ellipsis_count = (int(self.pulse_value * 4) % 4)
-        ellipsis = "." * ellipsis_count
 
-        msg_width = painter.fontMetrics().horizontalAdvance(self.current_message)
-        painter.drawText(
-            self.width // 2 + msg_width // 2 + 2,
-            msg_y + 14,
-            ellipsis
-        )
+        # Shaping the message is the costly part; measure it once per message
+        if self._msg_width[0] != self.current_message:
+            self._msg_width = (
+                self.current_message,
+                painter.fontMetrics().horizontalAdvance(self.current_message),
+            )
+        msg_width = self._msg_width[1]
+        if ellipsis_count:
+            # Static text is placed by its top-left corner, not the baseline
+            painter.drawStaticText(
+                self.width // 2 + msg_width // 2 + 2,
+                msg_y + 14 - painter.fontMetrics().ascent(),
+                self._st_ellipsis[ellipsis_count]
+            )
 
         # Percentage
-        pct_text = f"{int(self.current_progress)}%"
+        pct = int(self.current_progress)
+        pct_text = self._st_pct.get(pct)
+        if pct_text is None:
+            pct_text = self._st_pct[pct] = QStaticText(f"{pct}%")
         painter.setPen(Colors.TEXT_TERTIARY)
-        painter.setFont(QFont("Segoe UI", 11, QFont.Normal))
+        painter.setFont(self._font_pct)
 
         pct_x = bar_x + bar_w + 18
         pct_y = bar_y + 2
-        painter.drawText(pct_x, pct_y, pct_text)
+        painter.drawStaticText(pct_x, pct_y - painter.fontMetrics().ascent(), pct_text)
+
+    def _glow_sprite(self, alpha: int, size: int) -> QPixmap:
+        """Radial logo glow at one pulse alpha; rasterised on first use only."""
+        sprite = self._glow_sprites.get(alpha)
+        if sprite is not None:
+            return sprite
+
+        dpr = self.devicePixelRatioF()
+        sprite = QPixmap(int(size * dpr), int(size * dpr))
+        sprite.setDevicePixelRatio(dpr)
+        sprite.fill(Qt.transparent)
+
+        radius = size / 2
+        glow = QRadialGradient(QPointF(radius, radius), radius)
+        glow.setColorAt(0.0, QColor(0, 217, 255, alpha))
+        glow.setColorAt(0.7, QColor(0, 217, 255, alpha // 3))
+        glow.setColorAt(1.0, Qt.transparent)
 
-        # Footer
-        footer_y = self.height - 32
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(glow)
+        painter.drawEllipse(QPointF(radius, radius), radius, radius)
+        painter.end()
 
-        painter.setPen(Colors.TEXT_DISABLED)
-        painter.setFont(QFont("Segoe UI", 8, QFont.Normal))
+        self._glow_sprites[alpha] = sprite
+        return sprite
+
+    def _scaled_logo(self) -> QPixmap:
+        """Logo scaled to 120 px; decoded and scaled once, shared via QPixmapCache."""
+        if self._logo is None:
+            key = f"splash_logo_120:{self.logo_path}"
+            logo = QPixmapCache.find(key)
+            if logo is None:
+                logo = QPixmap(self.logo_path)
+                if not logo.isNull():
+                    logo = logo.scaled(120, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    QPixmapCache.insert(key, logo)
+            self._logo = logo  # also remembers a missing file, so it is not retried per frame
+        return self._logo
+
+    def _text_layer(self) -> QPixmap:
+        """Title block and status message, re-rasterised only when they change."""
+        key = (round(min(self.content_opacity, 1.0), 2), self.current_message)
+        layer = self._overlay_cache.get(key)
+        if layer is not None:
+            self._overlay_cache.move_to_end(key)
+            return layer
+
+        dpr = self.devicePixelRatioF()
+        layer = QPixmap(int(self.width * dpr), int(self.height * dpr))
+        layer.setDevicePixelRatio(dpr)
+        layer.fill(Qt.transparent)
+        painter = QPainter(layer)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._draw_text_layer(painter, key[0])
+        painter.end()
 
-        painter.drawText(
-            QRect(80, footer_y, 300, 20),
-            Qt.AlignLeft | Qt.AlignVCenter,
-            "PEC 2017 Compliant"
-        )
+        self._overlay_cache[key] = layer
+        if len(self._overlay_cache) > _OVERLAY_CACHE_SIZE:
+            self._overlay_cache.popitem(last=False)
+        return layer
 
-        painter.setPen(Colors.TEXT_TERTIARY)
+    def _draw_text_layer(self, painter: QPainter, content_opacity: float) -> None:
+        # Typography
+        painter.setOpacity(content_opacity)
+
+        painter.setPen(Colors.TEXT_PRIMARY)
+        painter.setFont(self._font_title)
+
+        title_y = 230
         painter.drawText(
-            QRect(0, footer_y, self.width, 20),
+            QRect(0, title_y, self.width, 40),
             Qt.AlignCenter,
-            "Version 2.5.0"
+            "ELECDRAFT PRO"
         )
 
-        painter.setPen(Colors.TEXT_DISABLED)
+        painter.setPen(Colors.TEXT_SECONDARY)
+        painter.setFont(self._font_sub)
         painter.drawText(
-            QRect(self.width - 380, footer_y, 300, 20),
-            Qt.AlignRight | Qt.AlignVCenter,
-            "© 2025 ELECDRAFT"
+            QRect(0, title_y + 42, self.width, 24),
+            Qt.AlignCenter,
+            "Professional Electrical CAD System"
         )
 
-        # Accent line
-        accent_grad = QLinearGradient(0, 0, self.width, 0)
-        accent_grad.setColorAt(0.0, Qt.transparent)
-        accent_grad.setColorAt(0.3, QColor(0, 217, 255, 80))
-        accent_grad.setColorAt(0.7, QColor(0, 217, 255, 80))
-        accent_grad.setColorAt(1.0, Qt.transparent)
+        # Separator
+        sep_y = title_y + 72
+        sep_w = 200
+        sep_x = (self.width - sep_w) // 2
 
-        painter.fillRect(QRectF(0, 0, self.width, 1), accent_grad)
\ No newline at end of file
+        sep_grad = QLinearGradient(sep_x, sep_y, sep_x + sep_w, sep_y)
+        sep_grad.setColorAt(0.0, Qt.transparent)
+        sep_grad.setColorAt(0.5, Colors.BORDER_MEDIUM)
+        sep_grad.setColorAt(1.0, Qt.transparent)
+
+        painter.setPen(Qt.NoPen)
+        painter.fillRect(QRectF(sep_x, sep_y, sep_w, 1), sep_grad)
+
+        painter.setOpacity(1.0)
+
+        # Status message
+        msg_y = 330 + 28
+
+        painter.setPen(Colors.TEXT_SECONDARY)
+        painter.setFont(self._font_msg)
+
+        msg_rect = QRect(0, msg_y, self.width, 20)
+        painter.drawText(msg_rect, Qt.AlignCenter, self.current_message)
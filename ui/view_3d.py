@@ -8,21 +8,30 @@ Professional isometric 3D visualization with:
   • Precision grid with axis tripod
   • Orbit / Zoom / Pan navigation
   • Component labels and wire routing paths
+
+Box corners are projected in NumPy batches and face polygons are written
+straight into QPolygonF point buffers (see _polygon_from_array).
 """
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QSlider, QComboBox, QFrame, QButtonGroup, QToolButton,
-    QSizePolicy, QGraphicsView, QGraphicsScene
+    QSizePolicy, QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsItemGroup
 )
 from PySide6.QtGui import (
     QColor, QPainter, QPen, QBrush, QFont, QTransform, QLinearGradient,
-    QRadialGradient, QPainterPath, QPolygonF
+    QGradient, QPainterPath, QPolygonF, QSurfaceFormat
 )
 from PySide6.QtCore import Qt, QPointF, QRectF, QTimer, Signal, QEasingCurve, QPropertyAnimation
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
 
 import math
 
+import numpy as np
+import shiboken6
+
+from ui.canvas import opengl_available
+
 # ==========================================================================
 # COLOUR PALETTE  –  AutoCAD dark theme
 # ==========================================================================
@@ -37,10 +46,107 @@ CLR_COMPONENT = QColor("#00e5ff")  # default component
 CLR_HIGHLIGHT = QColor("#f1c40f")  # selected / hover
 CLR_WIRE = QColor("#ff6b81")  # circuit wire
 
+# Shared pens and fonts, built once rather than on every redraw
+PEN_GRID_MAJOR = QPen(CLR_GRID_MAJOR, 1, Qt.SolidLine)
+PEN_GRID_MINOR = QPen(CLR_GRID_MINOR, 1, Qt.DotLine)
+PEN_WIRE = QPen(CLR_WIRE, 2, Qt.DashLine)
+FONT_AXIS = QFont("Arial", 10, QFont.Bold)
+FONT_LABEL = QFont("Consolas", 8)
+
+
+def _face_gradient(lit: QColor, shadow: QColor) -> QBrush:
+    """Diagonal lit-to-shadow gradient brush, relative to the filled shape's bounds."""
+    grad = QLinearGradient(0, 0, 1, 1)
+    grad.setCoordinateMode(QGradient.ObjectBoundingMode)
+    grad.setColorAt(0.0, lit)
+    grad.setColorAt(1.0, shadow)
+    return QBrush(grad)
+
+
+class _BoxMaterials:
+    """Pens, brushes and gradient colours for one load bucket's boxes."""
+
+    def __init__(self, color: QColor) -> None:
+        self.wire_pen = QPen(color, 2)
+        # (edge pen, fill brush) per shading role
+        self.shaded = {
+            "top": (QPen(color.darker(120), 1), QBrush(color.lighter(130))),
+            "right": (QPen(color.darker(150), 1), QBrush(color.darker(110))),
+            "front": (QPen(color.darker(150), 1), QBrush(color.darker(120))),
+        }
+        # (edge pen, gradient brush) per role; the gradients run in each
+        # face's own bounding box, so one brush fits every box
+        self.realistic = {
+            "top": (QPen(color.darker(120), 1), _face_gradient(color.lighter(140), QColor(color))),
+            "right": (QPen(color.darker(150), 1), _face_gradient(color.darker(100), color.darker(130))),
+            "front": (QPen(color.darker(150), 1), _face_gradient(color.darker(110), color.darker(140))),
+        }
+
+
+# Box materials by load (thermal gradient): low – cyan, medium – yellow, high – red
+_BOX_LOW = _BoxMaterials(QColor("#00e5ff"))
+_BOX_MEDIUM = _BoxMaterials(QColor("#f1c40f"))
+_BOX_HIGH = _BoxMaterials(QColor("#ff4757"))
+
+# Load bucket edges (VA) and the materials indexed by bucket number
+_BOX_BUCKET_EDGES = np.array([500.0, 2000.0])
+_BOX_MATERIALS = (_BOX_LOW, _BOX_MEDIUM, _BOX_HIGH)
+
+# View zoom limits relative to the fitted view; the projection-scale limits
+# (0.2 - 5) over the fit's projection scale of 1.5
+_ZOOM_MIN = 0.2 / 1.5
+_ZOOM_MAX = 5.0 / 1.5
+
+# Boxes per block of the screen-overlap test in _box_tiers (bounds its
+# block x N temporaries)
+_TIER_BLOCK = 1024
+
 
 # ==========================================================================
 # 3D MATH UTILITIES
 # ==========================================================================
+# Unit box corners as (x, y, z) multiples of (w, d, h): bottom face 0-3, top 4-7
+_BOX_CORNERS = np.array([
+    (0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0),
+    (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1),
+], dtype=float)
+
+# Box faces: corner indices, outward normal and shading role. Only faces whose
+# normal points towards the viewer are drawn (at most three of them)
+_FACE_TOP = [4, 5, 6, 7]
+_BOX_FACES = (
+    (_FACE_TOP, "top"),
+    ([1, 2, 6, 5], "right"),
+    ([2, 3, 7, 6], "front"),
+    ([0, 3, 7, 4], "right"),
+    ([0, 1, 5, 4], "front"),
+    ([0, 1, 2, 3], "front"),
+)
+_FACE_NORMALS = np.array([
+    (0, 0, 1), (1, 0, 0), (0, 1, 0), (-1, 0, 0), (0, -1, 0), (0, 0, -1),
+], dtype=float)
+
+# Corner indices of the twelve wireframe edges
+_BOX_EDGES = np.array([
+    (0, 1), (1, 2), (2, 3), (3, 0),
+    (4, 5), (5, 6), (6, 7), (7, 4),
+    (0, 4), (1, 5), (2, 6), (3, 7),
+])
+
+
+def _polygon_from_array(pts: np.ndarray) -> QPolygonF:
+    """Build a QPolygonF from an (N, 2) float array by writing its point buffer.
+
+    QPointF is two packed doubles, so the polygon's storage is viewed as an
+    (N, 2) float64 array and filled in one copy, with no per-vertex QPointF.
+    """
+    poly = QPolygonF()
+    poly.resize(len(pts))
+    buf = shiboken6.VoidPtr(poly.data(), pts.size * 8, True)
+    np.frombuffer(buf, dtype=np.float64).reshape(-1, 2)[:] = pts
+    return poly
+
+
 class IsoProjection:
     """Isometric projection matrix for 3D → 2D conversion.
 
@@ -51,23 +157,73 @@ class IsoProjection:
     """
 
     def __init__(self, scale: float = 1.0, rotation: float = 0.0, tilt: float = 30.0) -> None:
-        self.scale = scale  # zoom factor
-        self.rotation = rotation  # rotation around Z-axis (degrees)
-        self.tilt = tilt  # vertical tilt (degrees)
+        self._scale = scale  # zoom factor
+        self._rotation = rotation  # rotation around Z-axis (degrees)
+        self._tilt = tilt  # vertical tilt (degrees)
+        self._mat = None  # cached (2, 3) matrix, rebuilt after any change
+
+    # Setting any parameter drops the cached matrix
+    @property
+    def scale(self) -> float:
+        return self._scale
+
+    @scale.setter
+    def scale(self, value: float) -> None:
+        self._scale = value
+        self._mat = None
+
+    @property
+    def rotation(self) -> float:
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value: float) -> None:
+        self._rotation = value
+        self._mat = None
+
+    @property
+    def tilt(self) -> float:
+        return self._tilt
+
+    @tilt.setter
+    def tilt(self, value: float) -> None:
+        self._tilt = value
+        self._mat = None
 
     def project(self, x: float, y: float, z: float) -> QPointF:
         """Convert 3D world coordinates to 2D screen coordinates."""
-        # Apply rotation
-        rad = math.radians(self.rotation)
-        xr = x * math.cos(rad) - y * math.sin(rad)
-        yr = x * math.sin(rad) + y * math.cos(rad)
+        (m00, m01, m02), (m10, m11, m12) = self.matrix().tolist()
+        return QPointF(x * m00 + y * m01 + z * m02, x * m10 + y * m11 + z * m12)
 
-        # Isometric projection with tilt
-        tilt_rad = math.radians(self.tilt)
-        iso_x = (xr - yr) * math.cos(tilt_rad)
-        iso_y = (xr + yr) * 0.5 * math.cos(tilt_rad) - z * math.sin(tilt_rad)
+    def matrix(self) -> np.ndarray:
+        """(2, 3) projection matrix: screen = M @ (x, y, z).
 
-        return QPointF(iso_x * self.scale, iso_y * self.scale)
+        Rotation about Z, then the isometric tilt, then the zoom scale.
+        """
+        if self._mat is None:
+            rad = math.radians(self._rotation)
+            c, s = math.cos(rad), math.sin(rad)
+            tilt_rad = math.radians(self._tilt)
+            ct, st = math.cos(tilt_rad), math.sin(tilt_rad)
+            self._mat = self._scale * np.array([
+                [ct * (c - s), -ct * (s + c), 0.0],
+                [0.5 * ct * (c + s), 0.5 * ct * (c - s), -st],
+            ])
+        return self._mat
+
+    def project_batch(self, pts: np.ndarray) -> np.ndarray:
+        """Project an (N, 3) array of world points to an (N, 2) screen array."""
+        return pts @ self.matrix().T
+
+    def view_vector(self) -> np.ndarray:
+        """World direction pointing towards the viewer.
+
+        It is the cross product of the matrix rows, i.e. the direction the
+        projection flattens: larger p · v means nearer the viewer, and a face
+        is visible when its outward normal has a positive dot product with it.
+        """
+        m = self.matrix()
+        return np.cross(m[0], m[1])
 
 
 # ==========================================================================
@@ -85,7 +241,13 @@ class AutoCAD3DScene(QGraphicsScene):
         self.pan_offset = QPointF(0, 0)
 
         # Data
-        self.components: list[dict] = []  # {name, x, y, z, va, w, h, d}
+        # Components as parallel per-row arrays: origin (x, y, z), box size
+        # (w, d, h); names and VA ratings stay Python lists for the labels
+        self.comp_origins = np.zeros((0, 3))
+        self.comp_sizes = np.zeros((0, 3))
+        self.comp_names: list[str] = []
+        self.comp_vas: list = []
+        self.comp_buckets = np.zeros(0, dtype=np.intp)  # index into _BOX_MATERIALS
         self.wires: list[tuple] = []  # [(x1,y1,z1, x2,y2,z2), ...]
         self.render_mode = "shaded"  # wireframe | shaded | realistic
         self.show_grid = True
@@ -99,40 +261,64 @@ class AutoCAD3DScene(QGraphicsScene):
         self.grid_y_max = 2500
         self.grid_spacing = 100
 
+        # Zoom/pan bursts (wheel ticks), preset and render-mode changes
+        # coalesce into one rebuild per frame; redraw() itself stays
+        # synchronous for callers that need the built scene at once
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(16)
+        self._redraw_timer.timeout.connect(self.redraw)
+
+        # Built items: a root group carrying the pan offset, one child group
+        # per layer so toggles only flip visibility, and the label items
+        self._root = None
+        self._layers: dict[str, QGraphicsItemGroup] = {}
+        self._labels: list = []
+        self._content_rect = QRectF()
+        self._extent = QRectF()
+        self._visible_faces: list = list(_BOX_FACES[:3])
+
+        # Culling: the scene area the view shows (None = no view, build
+        # everything) and the projected area the last rebuild covered
+        self._visible_rect = None
+        self._built_rect = None
+
     # ══════════════════════════════════════════════════════════════════
     # PUBLIC API
     # ══════════════════════════════════════════════════════════════════
-    def set_components(self, items: list) -> None:
-        """Update the component list and trigger a redraw."""
-        self.components.clear()
+    def set_components(self, items: list, redraw: bool = True) -> None:
+        """Update the component list and, unless told otherwise, redraw.
+
+        Callers that rebuild straight afterwards anyway pass ``redraw=False``.
+        """
+        self.comp_names = [item.name for item in items]
+        self.comp_vas = [item.va for item in items]
 
-        for item in items:
+        self.comp_origins = np.zeros((len(items), 3))  # all on ground plane for now
+        for row, item in enumerate(items):
             pos = item.pos()
-            # Extrude height based on VA (taller = higher load)
-            height = 20 + (item.va / 50.0)
-            height = min(height, 200)  # cap at 200 px
-
-            self.components.append({
-                "name": item.name,
-                "x": pos.x(),
-                "y": pos.y(),
-                "z": 0,  # all on ground plane for now
-                "va": item.va,
-                "w": 40,  # width
-                "h": height,  # height (extrusion)
-                "d": 40,  # depth
-            })
+            self.comp_origins[row, 0] = pos.x()
+            self.comp_origins[row, 1] = pos.y()
 
-        # Recompute grid bounds
-        if self.components:
-            xs = [c["x"] for c in self.components]
-            ys = [c["y"] for c in self.components]
-            self.grid_x_min = min(xs) - 200
-            self.grid_x_max = max(xs) + 200
-            self.grid_y_min = min(ys) - 200
-            self.grid_y_max = max(ys) + 200
+        # 40 x 40 footprint; extrude height based on VA (taller = higher load),
+        # capped at 200 px
+        self.comp_sizes = np.empty((len(items), 3))
+        self.comp_sizes[:, :2] = 40
+        vas = np.asarray(self.comp_vas, dtype=float)
+        self.comp_sizes[:, 2] = np.minimum(20 + vas / 50.0, 200)
+        self.comp_buckets = np.digitize(vas, _BOX_BUCKET_EDGES)
 
-        self.redraw()
+        # Recompute grid bounds
+        if items:
+            x_min, y_min = self.comp_origins[:, :2].min(axis=0).tolist()
+            x_max, y_max = self.comp_origins[:, :2].max(axis=0).tolist()
+            self.grid_x_min = x_min - 200
+            self.grid_x_max = x_max + 200
+            self.grid_y_min = y_min - 200
+            self.grid_y_max = y_max + 200
+
+        if redraw:
+            self.redraw()
 
     def set_view_preset(self, preset: str) -> None:
         """Apply AutoCAD-style view presets."""
@@ -149,236 +335,327 @@ class AutoCAD3DScene(QGraphicsScene):
         if preset in presets:
             self.projection.rotation = presets[preset]["rotation"]
             self.projection.tilt = presets[preset]["tilt"]
-            self.redraw()
+            self.schedule_redraw()
 
     def set_render_mode(self, mode: str) -> None:
         """Switch between wireframe / shaded / realistic."""
         self.render_mode = mode
-        self.redraw()
+        self.schedule_redraw()
 
     def zoom(self, factor: float) -> None:
         """Adjust zoom level."""
         self.projection.scale *= factor
         self.projection.scale = max(0.2, min(self.projection.scale, 5.0))
-        self.redraw()
+        self.schedule_redraw()
 
     def pan(self, dx: float, dy: float) -> None:
-        """Pan the view."""
+        """Pan the view by moving the built scene; nothing is rebuilt."""
         self.pan_offset += QPointF(dx, dy)
-        self.redraw()
+        if self._root is not None:
+            self._root.setPos(self.pan_offset)
+            self._update_scene_rect()
+            if not self._covers_visible():
+                self.schedule_redraw()
+
+    def set_visible_rect(self, rect: QRectF | None) -> None:
+        """Record the scene area the view shows; rebuild once it leaves the built area.
+
+        ``None`` means the view is about to show everything: build it all.
+        """
+        self._visible_rect = None if rect is None else QRectF(rect)
+        if not self._covers_visible():
+            self.schedule_redraw()
+
+    def apply_visibility(self) -> None:
+        """Show or hide the grid, axes and labels to match the show_* flags."""
+        if self._root is None:
+            return
+        self._layers["grid"].setVisible(self.show_grid)
+        self._layers["axes"].setVisible(self.show_axes)
+        for lbl in self._labels:
+            lbl.setVisible(self.show_labels)
+
+    def schedule_redraw(self) -> None:
+        """Rebuild on the next timer tick; repeated calls before then share it."""
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
+    def _covers_visible(self) -> bool:
+        """True when the built items cover everything the view shows."""
+        if self._built_rect is None or self._visible_rect is None:
+            return True
+        return self._built_rect.contains(self._visible_rect.translated(-self.pan_offset))
 
     def redraw(self) -> None:
         """Full scene rebuild."""
+        self._redraw_timer.stop()
         self.clear()
 
+        # Items are built in projected coordinates under one root group that
+        # sits at the pan offset; toggled layers are built hidden, not skipped
+        self._root = QGraphicsItemGroup()
+        self._root.setPos(self.pan_offset)
+        self.addItem(self._root)
+        self._layers = {
+            name: QGraphicsItemGroup(self._root)
+            for name in ("grid", "axes", "components", "wires")
+        }
+        self._labels = []
+
+        # Only items inside the visible area, padded by half a view on every
+        # side so small pans need no rebuild, are built; the content rect
+        # still spans every projected point so the scene extents stay whole
+        if self._visible_rect is None:
+            self._built_rect = None
+        else:
+            w, h = self._visible_rect.width() / 2, self._visible_rect.height() / 2
+            self._built_rect = self._visible_rect.translated(-self.pan_offset).adjusted(-w, -h, w, h)
+        self._extent = QRectF()
+
         # 1. Draw grid plane
-        if self.show_grid:
-            self._draw_grid()
+        self._draw_grid(self._layers["grid"])
 
         # 2. Draw axis tripod
-        if self.show_axes:
-            self._draw_axes()
+        self._draw_axes(self._layers["axes"])
 
         # 3. Draw components (sorted back-to-front for proper occlusion)
-        self._draw_components()
+        self._draw_components(self._layers["components"])
 
         # 4. Draw wires / circuit paths
-        self._draw_wires()
+        self._draw_wires(self._layers["wires"])
+
+        self.apply_visibility()
 
-        # Update scene rect to fit everything
-        self.setSceneRect(self.itemsBoundingRect().adjusted(-100, -100, 100, 100))
+        # Scene rect from the projected extent gathered while drawing, rather
+        # than another pass over every item's bounding rect
+        self._content_rect = self._extent
+        self._update_scene_rect()
+
+    def _update_scene_rect(self) -> None:
+        """Scene rect = built content at the current pan offset, plus a margin."""
+        self.setSceneRect(
+            self._content_rect.translated(self.pan_offset).adjusted(-100, -100, 100, 100)
+        )
 
     # ══════════════════════════════════════════════════════════════════
     # INTERNAL RENDERING
     # ══════════════════════════════════════════════════════════════════
-    def _to_screen(self, x: float, y: float, z: float) -> QPointF:
-        """World coords → screen coords (with pan offset)."""
-        pt = self.projection.project(x, y, z)
-        return pt + self.pan_offset
+    def _to_screen(self, pts) -> np.ndarray:
+        """World points (N, 3) → projected points (N, 2) in one batch.
 
-    def _draw_grid(self) -> None:
+        The pan offset is not applied here; the root group carries it.
+        """
+        return self.projection.project_batch(np.asarray(pts, dtype=float).reshape(-1, 3))
+
+    def _grow_extent(self, lo: np.ndarray, hi: np.ndarray) -> None:
+        """Widen the projected content extent to cover points from lo to hi."""
+        self._extent |= QRectF(QPointF(*lo.min(axis=0).tolist()), QPointF(*hi.max(axis=0).tolist()))
+
+    def _in_built_rect(self, lo: np.ndarray, hi: np.ndarray, margin: float = 0.0) -> np.ndarray:
+        """Mask of screen boxes (per-row min/max corners) touching the built area."""
+        self._grow_extent(lo, hi)
+        if self._built_rect is None:
+            return np.ones(len(lo), dtype=bool)
+        r = self._built_rect
+        return ((hi[:, 0] >= r.left() - margin) & (lo[:, 0] <= r.right() + margin)
+                & (hi[:, 1] >= r.top() - margin) & (lo[:, 1] <= r.bottom() + margin))
+
+    def _draw_grid(self, layer: QGraphicsItemGroup) -> None:
         """Render the ground plane grid."""
-        pen_major = QPen(CLR_GRID_MAJOR, 1, Qt.SolidLine)
-        pen_minor = QPen(CLR_GRID_MINOR, 1, Qt.DotLine)
-
-        # Horizontal grid lines (along X)
-        y = self.grid_y_min
-        while y <= self.grid_y_max:
-            p1 = self._to_screen(self.grid_x_min, y, 0)
-            p2 = self._to_screen(self.grid_x_max, y, 0)
-            pen = pen_major if y % (self.grid_spacing * 5) == 0 else pen_minor
-            self.addLine(p1.x(), p1.y(), p2.x(), p2.y(), pen)
-            y += self.grid_spacing
-
-        # Vertical grid lines (along Y)
-        x = self.grid_x_min
-        while x <= self.grid_x_max:
-            p1 = self._to_screen(x, self.grid_y_min, 0)
-            p2 = self._to_screen(x, self.grid_y_max, 0)
-            pen = pen_major if x % (self.grid_spacing * 5) == 0 else pen_minor
-            self.addLine(p1.x(), p1.y(), p2.x(), p2.y(), pen)
-            x += self.grid_spacing
-
-    def _draw_axes(self) -> None:
+        spacing = self.grid_spacing
+
+        # Line positions along each axis, and both end points of every line:
+        # horizontal lines (along X) first, then vertical lines (along Y)
+        ys = self.grid_y_min + spacing * np.arange(int((self.grid_y_max - self.grid_y_min) // spacing) + 1)
+        xs = self.grid_x_min + spacing * np.arange(int((self.grid_x_max - self.grid_x_min) // spacing) + 1)
+        ends = np.zeros((len(ys) + len(xs), 2, 3))
+        ends[:len(ys), 0, 0] = self.grid_x_min
+        ends[:len(ys), 1, 0] = self.grid_x_max
+        ends[:len(ys), :, 1] = ys[:, None]
+        ends[len(ys):, :, 0] = xs[:, None]
+        ends[len(ys):, 0, 1] = self.grid_y_min
+        ends[len(ys):, 1, 1] = self.grid_y_max
+
+        # Lines entirely outside the built area are dropped
+        screen = self._to_screen(ends).reshape(-1, 2, 2)
+        keep = self._in_built_rect(screen.min(axis=1), screen.max(axis=1))
+
+        # One path item per pen rather than one line item per grid line
+        lines = screen[keep].reshape(-1, 4).tolist()
+        major = (np.concatenate((ys, xs))[keep] % (spacing * 5) == 0).tolist()
+        path_major, path_minor = QPainterPath(), QPainterPath()
+        for (x1, y1, x2, y2), is_major in zip(lines, major):
+            path = path_major if is_major else path_minor
+            path.moveTo(x1, y1)
+            path.lineTo(x2, y2)
+        # The dotted grid is the costliest stroke; cached, pans and repaints
+        # blit it until the next rebuild
+        for path, pen in ((path_minor, PEN_GRID_MINOR), (path_major, PEN_GRID_MAJOR)):
+            item = self.addPath(path, pen)
+            item.setParentItem(layer)
+            item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    def _draw_axes(self, layer: QGraphicsItemGroup) -> None:
         """Draw XYZ axis tripod at the origin."""
-        origin = self._to_screen(0, 0, 0)
         axis_len = 150
-
-        # X-axis (red)
-        x_end = self._to_screen(axis_len, 0, 0)
-        self.addLine(origin.x(), origin.y(), x_end.x(), x_end.y(), QPen(CLR_AXIS_X, 3))
-        lbl_x = self.addText("X", QFont("Arial", 10, QFont.Bold))
-        lbl_x.setDefaultTextColor(CLR_AXIS_X)
-        lbl_x.setPos(x_end + QPointF(10, -10))
-
-        # Y-axis (green)
-        y_end = self._to_screen(0, axis_len, 0)
-        self.addLine(origin.x(), origin.y(), y_end.x(), y_end.y(), QPen(CLR_AXIS_Y, 3))
-        lbl_y = self.addText("Y", QFont("Arial", 10, QFont.Bold))
-        lbl_y.setDefaultTextColor(CLR_AXIS_Y)
-        lbl_y.setPos(y_end + QPointF(10, -10))
-
-        # Z-axis (cyan)
-        z_end = self._to_screen(0, 0, axis_len)
-        self.addLine(origin.x(), origin.y(), z_end.x(), z_end.y(), QPen(CLR_AXIS_Z, 3))
-        lbl_z = self.addText("Z", QFont("Arial", 10, QFont.Bold))
-        lbl_z.setDefaultTextColor(CLR_AXIS_Z)
-        lbl_z.setPos(z_end + QPointF(10, -10))
-
-    def _draw_components(self) -> None:
+        screen = self._to_screen([
+            (0, 0, 0), (axis_len, 0, 0), (0, axis_len, 0), (0, 0, axis_len)
+        ])
+        self._grow_extent(screen, screen)
+        (ox, oy), *ends = screen.tolist()
+
+        for (ex, ey), name, color in zip(ends, "XYZ", (CLR_AXIS_X, CLR_AXIS_Y, CLR_AXIS_Z)):
+            self.addLine(ox, oy, ex, ey, QPen(color, 3)).setParentItem(layer)
+            # Simple text item: no QTextDocument; +4 matches the old text
+            # item's document margin
+            lbl = self.addSimpleText(name, FONT_AXIS)
+            lbl.setParentItem(layer)
+            lbl.setBrush(color)
+            lbl.setPos(ex + 10 + 4, ey - 10 + 4)
+
+    def _draw_components(self, layer: QGraphicsItemGroup) -> None:
         """Render each component as a 3D extruded box."""
-        # Sort components back-to-front for painter's algorithm
-        # (simple depth = x + y + z; more sophisticated would use proper Z-buffer)
-        sorted_comps = sorted(self.components, key=lambda c: c["x"] + c["y"] + c["z"])
-
-        for comp in sorted_comps:
-            self._draw_box(
-                comp["x"], comp["y"], comp["z"],
-                comp["w"], comp["h"], comp["d"],
-                comp["name"], comp["va"]
-            )
-
-    def _draw_box(self, x: float, y: float, z: float,
-                  w: float, h: float, d: float,
-                  name: str, va: float) -> None:
-        """Draw a single 3D box (component) in isometric view.
-
-        Box corners:
+        if not self.comp_names:
+            return
+
+        # Sort components back-to-front for painter's algorithm, by the view
+        # depth of each box centre, and keep only the faces turned to the viewer
+        view = self.projection.view_vector()
+        centres = self.comp_origins + self.comp_sizes / 2
+        order = np.argsort(centres @ view, kind="stable")
+        facing = (_FACE_NORMALS @ view > 1e-9).tolist()
+        self._visible_faces = [face for face, shown in zip(_BOX_FACES, facing) if shown]
+        if not self._visible_faces:
+            # The Front/Right presets collapse screen x, leaving no view
+            # direction; fall back to the top, right and front faces
+            self._visible_faces = list(_BOX_FACES[:3])
+
+        # Project the 8 corners of every box in one batch
+        origins = self.comp_origins[order]
+        sizes = self.comp_sizes[order]
+        corners = origins[:, None, :] + _BOX_CORNERS[None, :, :] * sizes[:, None, :]
+        screen = self._to_screen(corners).reshape(len(order), 8, 2)
+
+        # Skip boxes outside the built area; the margin keeps labels that
+        # hang past a box edge
+        keep = self._in_built_rect(screen.min(axis=1), screen.max(axis=1), margin=60)
+        rows = order[keep].tolist()
+        boxes = screen[keep]
+        if self.render_mode == "realistic":
+            # Gradients are laid out per face, so every face stays its own item
+            for row, verts in zip(rows, boxes):
+                self._draw_box_realistic(layer, verts, _BOX_MATERIALS[self.comp_buckets[row]])
+                self._draw_label(layer, verts, row)
+        else:
+            self._draw_boxes_merged(layer, rows, boxes)
+
+    def _draw_label(self, layer: QGraphicsItemGroup, verts: np.ndarray, row: int) -> None:
+        """Name and VA label above a box's top face (always built; show_labels sets visibility).
+
+        ``verts`` is the (8, 2) array of projected corners, in _BOX_CORNERS order:
             Bottom face (z):      Top face (z+h):
             0 ---- 1              4 ---- 5
             |      |              |      |
             3 ---- 2              7 ---- 6
         """
-        # Define 8 vertices
-        v0 = self._to_screen(x, y, z)
-        v1 = self._to_screen(x + w, y, z)
-        v2 = self._to_screen(x + w, y + d, z)
-        v3 = self._to_screen(x, y + d, z)
-        v4 = self._to_screen(x, y, z + h)
-        v5 = self._to_screen(x + w, y, z + h)
-        v6 = self._to_screen(x + w, y + d, z + h)
-        v7 = self._to_screen(x, y + d, z + h)
-
-        # ── Determine fill color based on VA (thermal gradient) ──
-        if va < 500:
-            base_color = QColor("#00e5ff")  # low load – cyan
-        elif va < 2000:
-            base_color = QColor("#f1c40f")  # medium – yellow
-        else:
-            base_color = QColor("#ff4757")  # high load – red
-
-        # ══════════════════════════════════════════════════════════════
-        # RENDER MODE DISPATCH
-        # ══════════════════════════════════════════════════════════════
-        if self.render_mode == "wireframe":
-            self._draw_box_wireframe(v0, v1, v2, v3, v4, v5, v6, v7, base_color)
-        elif self.render_mode == "shaded":
-            self._draw_box_shaded(v0, v1, v2, v3, v4, v5, v6, v7, base_color)
-        else:  # realistic
-            self._draw_box_realistic(v0, v1, v2, v3, v4, v5, v6, v7, base_color)
-
-        # ── Component label ───────────────────────────────────────────
-        if self.show_labels:
-            # Place label above the top face
-            label_pos = (v4 + v5 + v6 + v7) / 4.0 + QPointF(0, -15)
-            lbl = self.addText(f"{name}\n{va} VA", QFont("Consolas", 8))
-            lbl.setDefaultTextColor(CLR_TEXT)
-            lbl.setPos(label_pos - QPointF(lbl.boundingRect().width() / 2, 0))
-
-    # ── Wireframe mode ────────────────────────────────────────────────
-    def _draw_box_wireframe(self, v0, v1, v2, v3, v4, v5, v6, v7, color: QColor) -> None:
-        pen = QPen(color, 2)
-        # Bottom face
-        self.addLine(v0.x(), v0.y(), v1.x(), v1.y(), pen)
-        self.addLine(v1.x(), v1.y(), v2.x(), v2.y(), pen)
-        self.addLine(v2.x(), v2.y(), v3.x(), v3.y(), pen)
-        self.addLine(v3.x(), v3.y(), v0.x(), v0.y(), pen)
-        # Top face
-        self.addLine(v4.x(), v4.y(), v5.x(), v5.y(), pen)
-        self.addLine(v5.x(), v5.y(), v6.x(), v6.y(), pen)
-        self.addLine(v6.x(), v6.y(), v7.x(), v7.y(), pen)
-        self.addLine(v7.x(), v7.y(), v4.x(), v4.y(), pen)
-        # Vertical edges
-        self.addLine(v0.x(), v0.y(), v4.x(), v4.y(), pen)
-        self.addLine(v1.x(), v1.y(), v5.x(), v5.y(), pen)
-        self.addLine(v2.x(), v2.y(), v6.x(), v6.y(), pen)
-        self.addLine(v3.x(), v3.y(), v7.x(), v7.y(), pen)
-
-    # ── Shaded mode (flat faces with simple lighting) ────────────────
-    def _draw_box_shaded(self, v0, v1, v2, v3, v4, v5, v6, v7, color: QColor) -> None:
-        """Draw three visible faces with flat shading."""
-        # Determine which faces are visible based on normal vectors
-        # (simplified: assume camera is always above and to the right)
-
-        # Top face (always visible if box has height)
-        top_color = color.lighter(130)
-        top_poly = QPolygonF([v4, v5, v6, v7])
-        self.addPolygon(top_poly, QPen(color.darker(120), 1), QBrush(top_color))
-
-        # Right face (x+w side)
-        right_color = color.darker(110)
-        right_poly = QPolygonF([v1, v2, v6, v5])
-        self.addPolygon(right_poly, QPen(color.darker(150), 1), QBrush(right_color))
-
-        # Front face (y+d side)
-        front_color = color.darker(120)
-        front_poly = QPolygonF([v2, v3, v7, v6])
-        self.addPolygon(front_poly, QPen(color.darker(150), 1), QBrush(front_color))
+        cx, cy = verts[_FACE_TOP].mean(axis=0).tolist()
+        lbl = self.addSimpleText(f"{self.comp_names[row]}\n{self.comp_vas[row]} VA", FONT_LABEL)
+        lbl.setParentItem(layer)
+        lbl.setBrush(CLR_TEXT)
+        lbl.setPos(cx - lbl.boundingRect().width() / 2, cy - 15 + 4)
+        lbl.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self._labels.append(lbl)
+
+    @staticmethod
+    def _box_tiers(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """Tier per back-to-front box: one above the highest earlier box it overlaps on screen.
+
+        Boxes within a tier never overlap, so they may be painted in any order.
+        """
+        n = len(lo)
+        (x0, y0), (x1, y1) = lo.T, hi.T
+        # Every (later, earlier) pair of overlapping boxes, a block of rows at a time
+        later, earlier = [np.empty(0, np.intp)], [np.empty(0, np.intp)]
+        for start in range(0, n, _TIER_BLOCK):
+            rows = slice(start, start + _TIER_BLOCK)
+            overlap = ((x0 < x1[rows, None]) & (x1 > x0[rows, None])
+                       & (y0 < y1[rows, None]) & (y1 > y0[rows, None]))
+            i, j = np.nonzero(np.tril(overlap, start - 1))
+            later.append(i + start)
+            earlier.append(j)
+        later, earlier = np.concatenate(later), np.concatenate(earlier)
+
+        # Longest chain of overlaps ending at each box: relax all pairs at
+        # once until nothing moves (one round per tier). Pairs come out
+        # grouped by the later box, so each round is one segmented max.
+        tiers = np.zeros(n, dtype=np.intp)
+        if not len(later):
+            return tiers
+        boxes, firsts = np.unique(later, return_index=True)
+        while True:
+            raised = np.maximum.reduceat(tiers[earlier], firsts) + 1
+            if np.array_equal(raised, tiers[boxes]):
+                return tiers
+            tiers[boxes] = raised
+
+    # ── Wireframe / shaded modes (merged per tier, bucket and face role) ──
+    def _draw_boxes_merged(self, layer: QGraphicsItemGroup, rows: list, boxes: np.ndarray) -> None:
+        """Draw boxes as one path item per load bucket and face role, per tier.
+
+        Overlapping boxes go to later tiers so back-to-front order still holds.
+        """
+        wireframe = self.render_mode == "wireframe"
+        tiers = self._box_tiers(boxes.min(axis=1), boxes.max(axis=1))
+        buckets = self.comp_buckets[rows].tolist()
+
+        for tier in range(int(tiers.max(initial=-1)) + 1):
+            members = np.flatnonzero(tiers == tier).tolist()
+            # (bucket, role) -> path; dicts keep the first-drawn face order
+            paths: dict = {}
+            for i in members:
+                verts = boxes[i]
+                if wireframe:
+                    # Bottom face, top face, then the vertical edges
+                    path = paths.setdefault((buckets[i], None), QPainterPath())
+                    for x1, y1, x2, y2 in verts[_BOX_EDGES].reshape(-1, 4).tolist():
+                        path.moveTo(x1, y1)
+                        path.lineTo(x2, y2)
+                    continue
+                for corners, role in self._visible_faces:
+                    path = paths.setdefault((buckets[i], role), QPainterPath())
+                    path.addPolygon(_polygon_from_array(verts[corners]))
+                    path.closeSubpath()
+
+            for (bucket, role), path in paths.items():
+                materials = _BOX_MATERIALS[bucket]
+                if wireframe:
+                    item = self.addPath(path, materials.wire_pen)
+                else:
+                    item = self.addPath(path, *materials.shaded[role])
+                item.setParentItem(layer)
+            for i in members:
+                self._draw_label(layer, boxes[i], rows[i])
 
     # ── Realistic mode (gradient lighting) ───────────────────────────
-    def _draw_box_realistic(self, v0, v1, v2, v3, v4, v5, v6, v7, color: QColor) -> None:
-        """Draw faces with radial gradients for depth."""
-        # Top face – radial gradient from centre
-        top_centre = (v4 + v5 + v6 + v7) / 4.0
-        top_grad = QRadialGradient(top_centre, 50)
-        top_grad.setColorAt(0.0, color.lighter(140))
-        top_grad.setColorAt(1.0, color)
-        top_poly = QPolygonF([v4, v5, v6, v7])
-        self.addPolygon(top_poly, QPen(color.darker(120), 1), QBrush(top_grad))
-
-        # Right face
-        right_centre = (v1 + v2 + v6 + v5) / 4.0
-        right_grad = QRadialGradient(right_centre, 40)
-        right_grad.setColorAt(0.0, color.darker(100))
-        right_grad.setColorAt(1.0, color.darker(130))
-        right_poly = QPolygonF([v1, v2, v6, v5])
-        self.addPolygon(right_poly, QPen(color.darker(150), 1), QBrush(right_grad))
-
-        # Front face
-        front_centre = (v2 + v3 + v7 + v6) / 4.0
-        front_grad = QRadialGradient(front_centre, 40)
-        front_grad.setColorAt(0.0, color.darker(110))
-        front_grad.setColorAt(1.0, color.darker(140))
-        front_poly = QPolygonF([v2, v3, v7, v6])
-        self.addPolygon(front_poly, QPen(color.darker(150), 1), QBrush(front_grad))
-
-    def _draw_wires(self) -> None:
+    def _draw_box_realistic(self, layer: QGraphicsItemGroup, verts: np.ndarray,
+                            materials: _BoxMaterials) -> None:
+        """Draw the faces turned towards the viewer with gradients for depth."""
+        for corners, role in self._visible_faces:
+            pen, brush = materials.realistic[role]
+            poly = _polygon_from_array(verts[corners])
+            self.addPolygon(poly, pen, brush).setParentItem(layer)
+
+    def _draw_wires(self, layer: QGraphicsItemGroup) -> None:
         """Render circuit wire paths as 3D lines."""
-        pen = QPen(CLR_WIRE, 2, Qt.DashLine)
-        for (x1, y1, z1, x2, y2, z2) in self.wires:
-            p1 = self._to_screen(x1, y1, z1)
-            p2 = self._to_screen(x2, y2, z2)
-            self.addLine(p1.x(), p1.y(), p2.x(), p2.y(), pen)
+        if not self.wires:
+            return
+        screen = self._to_screen(self.wires)
+        self._grow_extent(screen, screen)
+        path = QPainterPath()
+        for x1, y1, x2, y2 in screen.reshape(-1, 4).tolist():
+            path.moveTo(x1, y1)
+            path.lineTo(x2, y2)
+        self.addPath(path, PEN_WIRE).setParentItem(layer)
 
 
 # ==========================================================================
@@ -401,7 +678,21 @@ class View3D(QWidget):
 
         # ── 3D Viewport ───────────────────────────────────────────────
         self.scene = AutoCAD3DScene()
+        # The scene is rebuilt wholesale on every change, so a BSP index
+        # would only be torn down and refilled each time
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.view = QGraphicsView(self.scene)
+        # GPU-backed viewport: polygon and gradient fills are rasterised by
+        # OpenGL, with 4x multisampling standing in for the antialiasing
+        # hint (platforms without a GL context keep the raster viewport)
+        if opengl_available():
+            gl = QOpenGLWidget()
+            fmt = QSurfaceFormat()
+            fmt.setSamples(4)
+            gl.setFormat(fmt)
+            self.view.setViewport(gl)
+        # Every item sets its own pen and brush
+        self.view.setOptimizationFlag(QGraphicsView.DontSavePainterState)
         self.view.setRenderHint(QPainter.Antialiasing)
         self.view.setRenderHint(QPainter.SmoothPixmapTransform)
         self.view.setDragMode(QGraphicsView.ScrollHandDrag)
@@ -411,12 +702,18 @@ class View3D(QWidget):
 
         main_layout.addWidget(self.view, stretch=1)
 
+        # Keep the scene told what the viewport shows so it can cull
+        self.view.horizontalScrollBar().valueChanged.connect(self._update_visible_rect)
+        self.view.verticalScrollBar().valueChanged.connect(self._update_visible_rect)
+
         # ── Status bar (bottom) ───────────────────────────────────────
         status = self._build_status_bar()
         main_layout.addWidget(status)
 
         # Mouse interaction state
         self._last_mouse_pos = None
+        # View zoom relative to the last fit (see _zoom)
+        self._zoom_level = 1.0
 
     # ══════════════════════════════════════════════════════════════════
     # UI CONSTRUCTION
@@ -508,19 +805,19 @@ class View3D(QWidget):
         self.btn_grid = QPushButton("◫ Grid")
         self.btn_grid.setCheckable(True)
         self.btn_grid.setChecked(True)
-        self.btn_grid.clicked.connect(lambda c: self._toggle_grid(c))
+        self.btn_grid.clicked.connect(lambda c: self._toggle_layer("show_grid", c))
         layout.addWidget(self.btn_grid)
 
         self.btn_axes = QPushButton("⊹ Axes")
         self.btn_axes.setCheckable(True)
         self.btn_axes.setChecked(True)
-        self.btn_axes.clicked.connect(lambda c: self._toggle_axes(c))
+        self.btn_axes.clicked.connect(lambda c: self._toggle_layer("show_axes", c))
         layout.addWidget(self.btn_axes)
 
         self.btn_labels = QPushButton("🏷 Labels")
         self.btn_labels.setCheckable(True)
         self.btn_labels.setChecked(True)
-        self.btn_labels.clicked.connect(lambda c: self._toggle_labels(c))
+        self.btn_labels.clicked.connect(lambda c: self._toggle_layer("show_labels", c))
         layout.addWidget(self.btn_labels)
 
         layout.addStretch()
@@ -529,11 +826,11 @@ class View3D(QWidget):
         layout.addWidget(QLabel("ZOOM:"))
 
         btn_zoom_in = QPushButton("🔍 +")
-        btn_zoom_in.clicked.connect(lambda: self.scene.zoom(1.2))
+        btn_zoom_in.clicked.connect(lambda: self._zoom(1.2))
         layout.addWidget(btn_zoom_in)
 
         btn_zoom_out = QPushButton("🔍 −")
-        btn_zoom_out.clicked.connect(lambda: self.scene.zoom(0.8))
+        btn_zoom_out.clicked.connect(lambda: self._zoom(0.8))
         layout.addWidget(btn_zoom_out)
 
         btn_fit = QPushButton("⛶ Fit")
@@ -572,7 +869,8 @@ class View3D(QWidget):
     # ══════════════════════════════════════════════════════════════════
     def update_3d_scene(self, electrical_items: list) -> None:
         """Main entry point called by the app when the 3D tab is opened."""
-        self.scene.set_components(electrical_items)
+        # _fit_to_view does the single rebuild
+        self.scene.set_components(electrical_items, redraw=False)
         self._fit_to_view()
 
         # Update status bar
@@ -584,24 +882,38 @@ class View3D(QWidget):
     # ══════════════════════════════════════════════════════════════════
     # INTERNAL HELPERS
     # ══════════════════════════════════════════════════════════════════
-    def _toggle_grid(self, checked: bool) -> None:
-        self.scene.show_grid = checked
-        self.scene.redraw()
-
-    def _toggle_axes(self, checked: bool) -> None:
-        self.scene.show_axes = checked
-        self.scene.redraw()
-
-    def _toggle_labels(self, checked: bool) -> None:
-        self.scene.show_labels = checked
-        self.scene.redraw()
+    def _toggle_layer(self, flag: str, checked: bool) -> None:
+        """Set one of the scene's show_* flags; only visibility changes, nothing is rebuilt."""
+        setattr(self.scene, flag, checked)
+        self.scene.apply_visibility()
 
     def _fit_to_view(self) -> None:
         """Reset zoom/pan to fit all components."""
         self.scene.projection.scale = 1.5
         self.scene.pan_offset = QPointF(400, 300)  # reasonable default centre
+        self.scene.set_visible_rect(None)  # the fit shows the whole scene
         self.scene.redraw()
         self.view.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
+        self._zoom_level = 1.0
+        self._update_visible_rect()
+
+    def _zoom(self, factor: float) -> None:
+        """Zoom the view transform; the built scene is reused, not rebuilt."""
+        level = min(max(self._zoom_level * factor, _ZOOM_MIN), _ZOOM_MAX)
+        step = level / self._zoom_level
+        self._zoom_level = level
+        self.view.scale(step, step)
+        self._update_visible_rect()
+
+    def _update_visible_rect(self) -> None:
+        """Pass the scene area under the viewport to the scene for culling."""
+        self.scene.set_visible_rect(
+            self.view.mapToScene(self.view.viewport().rect()).boundingRect()
+        )
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._update_visible_rect()
 
     # ══════════════════════════════════════════════════════════════════
     # MOUSE INTERACTION  (orbit + pan)
@@ -610,7 +922,7 @@ class View3D(QWidget):
         """Mouse wheel = zoom."""
         delta = event.angleDelta().y()
         factor = 1.1 if delta > 0 else 0.9
-        self.scene.zoom(factor)
+        self._zoom(factor)
 
     # For advanced orbit controls you'd override mousePressEvent / mouseMoveEvent
     # and adjust self.scene.projection.rotation based on drag delta.